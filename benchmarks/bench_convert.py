@@ -0,0 +1,212 @@
+"""
+Scaling benchmark for meds2rdf.
+
+Generates synthetic MEDS datasets (``meds2rdf.synthetic``) of increasing size and
+measures, for each one, the full conversion and every ``map_*_table`` on its own:
+wall time, triples/sec and peak RSS. Each measurement runs in a fresh process so
+that peak RSS is not inherited from the previous one. Results are appended to a
+JSON-lines file together with the package version and git revision, and compared
+against the previous run of the same benchmark at the same size.
+
+Usage::
+
+    python benchmarks/bench_convert.py --rows 1e4 1e5 1e6 --results benchmarks/results.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import queue as queues
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+BENCHMARKS = ("convert_to_file", "convert", "map_data_table", "map_code_table", "map_split_table", "map_label_table")
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+
+def _measure(name: str, root: str, queue):
+    import polars as pl
+    from meds2rdf import MedsRDFConverter
+    from meds2rdf.mapping import map_code_table, map_data_table, map_label_table, map_split_table
+    from meds2rdf.sinks import NullSink, NTriplesSink
+
+    root = Path(root)
+    sink = NullSink()
+    if not name.startswith("map_"):
+        # whole conversions are compared per event
+        rows = pl.scan_parquet(str(root / "data/*.parquet")).select(pl.len()).collect().item()
+    else:
+        # reading is excluded from the timing of individual mappers
+        if name == "map_data_table":
+            table = pl.read_parquet(str(root / "data/*.parquet"))
+        elif name == "map_code_table":
+            table = pl.read_parquet(root / "metadata/codes.parquet").to_dicts()
+        elif name == "map_split_table":
+            table = pl.read_parquet(root / "metadata/subject_splits.parquet").to_dicts()
+        else:
+            table = pl.read_parquet(str(root / "labels/*/*.parquet"))
+        rows = len(table)
+        mapper = {
+            "map_data_table": map_data_table,
+            "map_code_table": map_code_table,
+            "map_split_table": lambda g, t: map_split_table(g, t),
+            "map_label_table": map_label_table,
+        }[name]
+
+    start = time.perf_counter()
+    if name == "convert_to_file":
+        with NTriplesSink(root / "out.nt") as sink:
+            MedsRDFConverter(root).convert_to_stream(sink, include_labels=True, include_splits=True)
+        triples = sink.count
+    elif name == "convert":
+        triples = len(MedsRDFConverter(root).convert(include_labels=True, include_splits=True))
+    else:
+        mapper(sink, table)
+        triples = sink.count
+    elapsed = time.perf_counter() - start
+
+    queue.put({
+        "benchmark": name,
+        "rows": rows,
+        "triples": triples,
+        "seconds": round(elapsed, 4),
+        "triples_per_sec": round(triples / elapsed, 1) if elapsed else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    })
+
+
+def run_isolated(name: str, root: Path, timeout: float | None = None, poll: float = 1.0) -> dict:
+    """
+    Run benchmark ``name`` in a fresh process. If the process dies before
+    reporting (e.g. killed when out of memory) or runs longer than ``timeout``
+    seconds, the result records the failure instead of a measurement.
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_measure, args=(name, str(root), queue))
+    start = time.perf_counter()
+    process.start()
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=poll)
+        except queues.Empty:
+            if not process.is_alive():
+                # the result may still be in the pipe when the process exits
+                try:
+                    result = queue.get(timeout=poll)
+                except queues.Empty:
+                    result = _failure(name, f"process exited with code {process.exitcode}", start)
+            elif timeout is not None and time.perf_counter() - start > timeout:
+                process.kill()
+                result = _failure(name, f"timed out after {timeout:g}s", start)
+    process.join()
+    return result
+
+
+def _failure(name: str, error: str, start: float) -> dict:
+    return {
+        "benchmark": name,
+        "rows": None,
+        "triples": None,
+        "seconds": round(time.perf_counter() - start, 4),
+        "triples_per_sec": None,
+        "peak_rss_mb": None,
+        "error": error,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _previous_results(path: Path) -> dict:
+    """Latest successful result per (benchmark, total events)."""
+    previous = {}
+    if path.exists():
+        with open(path) as f:
+            for line in f:
+                record = json.loads(line)
+                if "error" not in record:
+                    previous[(record["benchmark"], record["events"])] = record
+    return previous
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", nargs="+", type=float, default=[1e4, 1e5], help="total number of events")
+    parser.add_argument("--events-per-subject", type=int, default=100)
+    parser.add_argument("--codes", type=int, default=5_000)
+    parser.add_argument("--null-rate", type=float, default=0.3)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--benchmarks", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument("--max-graph-rows", type=float, default=1e6, help="skip the in-memory convert() above this size")
+    parser.add_argument("--timeout", type=float, default=None, help="give up on a measurement after this many seconds")
+    parser.add_argument("--results", type=Path, default=Path(__file__).parent / "results.jsonl")
+    args = parser.parse_args(argv)
+
+    from meds2rdf.synthetic import generate_meds_dataset
+
+    try:
+        package_version = version("meds2rdf")
+    except PackageNotFoundError:
+        package_version = None
+    context = {
+        "version": package_version,
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    previous = _previous_results(args.results)
+
+    with open(args.results, "a") as out:
+        for rows in map(int, args.rows):
+            n_subjects = max(rows // args.events_per_subject, 1)
+            with tempfile.TemporaryDirectory() as tmp:
+                root = generate_meds_dataset(
+                    tmp,
+                    n_subjects=n_subjects,
+                    events_per_subject=args.events_per_subject,
+                    n_codes=args.codes,
+                    null_rate=args.null_rate,
+                    n_shards=args.shards,
+                )
+                for name in args.benchmarks:
+                    if name == "convert" and rows > args.max_graph_rows:
+                        continue
+                    result = {**context, "events": rows, **run_isolated(name, root, args.timeout)}
+                    out.write(json.dumps(result) + "\n")
+                    out.flush()
+
+                    if "error" in result:
+                        print(f"{name:<16} {rows:>10} events  FAILED: {result['error']}")
+                        continue
+                    line = (
+                        f"{name:<16} {rows:>10} events  {result['seconds']:>9.3f}s  "
+                        f"{result['triples_per_sec'] or 0:>12,.0f} triples/s  {result['peak_rss_mb']:>8.1f} MB"
+                    )
+                    if (before := previous.get((name, rows))) and before.get("triples_per_sec"):
+                        ratio = result["triples_per_sec"] / before["triples_per_sec"]
+                        line += f"  ({ratio:.2f}x vs {before.get('git') or before.get('version')})"
+                    print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,22 @@
 """meds2rdf: MEDS -> RDF conversion utilities."""
 
+from importlib import import_module
 
-from .converter import MedsRDFConverter
+# Loaded on first access, so that e.g. ``meds2rdf --help`` does not pay for
+# importing Polars and rdflib
+_exports = {
+    "MedsRDFConverter": ".converter",
+    "ConversionObserver": ".instrumentation",
+    "SummaryReporter": ".instrumentation",
+    "LexicalFormat": ".utils.columnar",
+    "InvalidRowsError": ".validation",
+}
 
 
-__all__ = ["MedsRDFConverter"]
\ No newline at end of file
+def __getattr__(name):
+    if (module := _exports.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
+
+
+__all__ = ["MedsRDFConverter", "ConversionObserver", "SummaryReporter", "LexicalFormat", "InvalidRowsError"]
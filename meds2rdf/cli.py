@@ -0,0 +1,174 @@
+"""
+``meds2rdf`` command line entry point.
+
+Only the standard library is imported at module level; the converter (Polars,
+rdflib) is imported once the arguments have been parsed, so ``--help`` and usage
+errors return immediately.
+"""
+
+import argparse
+import sys
+from typing import Optional
+
+STREAM_FORMATS = ("nt", "nq", "ttl")
+GRAPH_FORMATS = {"xml": "xml"}
+STORE_FORMATS = ("oxigraph", "parquet")
+PARTITION_MODES = ("shard", "task", "subject", "size")
+
+
+def _count(value: str) -> int:
+    """Positive integer, also written as e.g. ``1e5``."""
+    count = int(float(value))
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got '{value}'")
+    return count
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="meds2rdf",
+        description="Convert a MEDS dataset directory into RDF using the MEDS Ontology.",
+    )
+    parser.add_argument("meds_root", help="root directory of the MEDS dataset")
+    parser.add_argument("output", help="output file, or directory with --partition-by/--incremental")
+
+    out = parser.add_argument_group("output")
+    out.add_argument("-f", "--format", choices=[*STREAM_FORMATS, *GRAPH_FORMATS, *STORE_FORMATS],
+                     default="nt", help="nt/nq/ttl are streamed; xml builds the whole graph in memory first; "
+                     "oxigraph bulk-loads into an embedded store at OUTPUT; parquet writes an "
+                     "integer triple table plus term dictionary into OUTPUT (default: nt)")
+    out.add_argument("--compression", choices=["gzip", "bgzip", "zstd"], default=None,
+                     help="compress the output file(s); bgzip and zstd are written in independent blocks")
+    out.add_argument("--partition-by", choices=PARTITION_MODES, default=None,
+                     help="write numbered parts plus manifest.json into OUTPUT")
+    out.add_argument("--buckets", type=_count, default=16, help="subject hash buckets for --partition-by subject")
+    out.add_argument("--max-part-size", type=_count, default=None, help="roll parts over at about this many bytes")
+    out.add_argument("--incremental", action="store_true",
+                     help="mirror the input layout into OUTPUT and only re-map inputs that changed")
+    out.add_argument("--task-graphs", action="store_true", help="with nq, one named graph per label task")
+    out.add_argument("--subject-graphs", action="store_true",
+                     help="with nq, one named graph per subject plus a shared graph for codes and metadata")
+    out.add_argument("--iri-strategy", choices=["uuid", "hash"], default="uuid", help="(default: uuid)")
+    out.add_argument("--time-zone", default=None, help="write every xsd:dateTime in this time zone, e.g. UTC")
+
+    perf = parser.add_argument_group("performance")
+    perf.add_argument("-w", "--workers", type=_count, default=1, help="processes mapping data shards (default: 1)")
+    perf.add_argument("-b", "--batch-size", type=_count, default=None, help="rows read and mapped at a time")
+    perf.add_argument("--commit-size", type=_count, default=None, help="triples per store bulk load or parquet part")
+    perf.add_argument("--compression-threads", type=_count, default=1, metavar="N",
+                      help="compress blocks of the output on N threads while converting (default: 1)")
+    perf.add_argument("--pipeline-depth", type=int, default=0, metavar="N",
+                      help="read batches and write output on background threads, N batches/chunks ahead")
+
+    content = parser.add_argument_group("content")
+    content.add_argument("--no-metadata", action="store_true", help="skip metadata/dataset.json")
+    content.add_argument("--no-codes", action="store_true", help="skip metadata/codes.parquet")
+    content.add_argument("--labels", action="store_true", help="include labels/")
+    content.add_argument("--splits", action="store_true", help="include metadata/subject_splits.parquet")
+    content.add_argument("--tasks", nargs="+", default=None, metavar="TASK", help="only these label tasks")
+    content.add_argument("--subjects", nargs="+", type=int, default=None, metavar="ID", help="only these subjects")
+    content.add_argument("--start", default=None, help="only events at or after this ISO time")
+    content.add_argument("--end", default=None, help="only events before this ISO time")
+    content.add_argument("--code-prefix", nargs="+", default=None, metavar="PREFIX", help="only codes with these prefixes")
+    content.add_argument("--sample-fraction", type=float, default=None, metavar="FRACTION",
+                         help="only a deterministic sample of about FRACTION of the subjects, e.g. 0.001")
+    content.add_argument("--sample-seed", type=int, default=0, help="seed of the subject sample (default: 0)")
+    content.add_argument("--on-invalid", choices=["raise", "drop", "quarantine"], default=None,
+                         help="validate the inputs before mapping; raise, drop or quarantine invalid rows")
+    content.add_argument("--quarantine-dir", default=None, help="where --on-invalid quarantine writes invalid rows")
+    content.add_argument("--columns", nargs="+", default=None, metavar="COLUMN", help="data columns to read")
+
+    progress = parser.add_argument_group("progress")
+    progress.add_argument("--progress", type=float, default=10.0, metavar="SECONDS",
+                          help="print rows, triples and triples/s at most every SECONDS (default: 10)")
+    progress.add_argument("-q", "--quiet", action="store_true", help="no progress nor summary")
+    return parser
+
+
+def _check(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    if args.partition_by and args.incremental:
+        parser.error("--partition-by and --incremental are mutually exclusive")
+    if args.format not in STREAM_FORMATS and (args.partition_by or args.incremental or args.compression):
+        parser.error(f"--format {args.format} only writes a single uncompressed output")
+    if args.incremental and args.compression:
+        parser.error("--incremental does not support --compression")
+    if args.task_graphs and (args.format != "nq" or args.partition_by or args.incremental):
+        parser.error("--task-graphs requires a single --format nq file")
+    if args.subject_graphs and (args.format not in ("nq", *STORE_FORMATS) or args.incremental):
+        parser.error("--subject-graphs requires --format nq (a single file or parts) or a store")
+    if args.on_invalid == "quarantine" and not args.quarantine_dir:
+        parser.error("--on-invalid quarantine requires --quarantine-dir")
+    if args.sample_fraction is not None and not 0 < args.sample_fraction <= 1:
+        parser.error("--sample-fraction must be in (0, 1]")
+    if args.partition_by == "size" and not args.max_part_size:
+        parser.error("--partition-by size requires --max-part-size")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    _check(parser, args)
+
+    from . import LexicalFormat, MedsRDFConverter, SummaryReporter
+    from .instrumentation import ConversionObserver
+
+    observer = ConversionObserver() if args.quiet else SummaryReporter(progress_interval=args.progress)
+    converter = MedsRDFConverter(
+        args.meds_root,
+        iri_strategy=args.iri_strategy,
+        observer=observer,
+        lexical=LexicalFormat(time_zone=args.time_zone),
+        subject_graphs=args.subject_graphs,
+        on_invalid=args.on_invalid,
+        quarantine_dir=args.quarantine_dir,
+    )
+    options = {
+        "include_dataset_metadata": not args.no_metadata,
+        "include_codes": not args.no_codes,
+        "include_labels": args.labels or args.tasks is not None,
+        "include_splits": args.splits,
+        "workers": args.workers,
+        "batch_size": args.batch_size,
+        "subject_ids": args.subjects,
+        "time_range": (args.start, args.end) if args.start or args.end else None,
+        "code_prefixes": args.code_prefix,
+        "columns": args.columns,
+        "tasks": args.tasks,
+        "pipeline_depth": args.pipeline_depth,
+        "sample_fraction": args.sample_fraction,
+        "sample_seed": args.sample_seed,
+    }
+
+    if args.partition_by:
+        converter.convert_to_parts(
+            args.output,
+            partition_by=args.partition_by,
+            buckets=args.buckets,
+            max_part_size=args.max_part_size,
+            format=args.format,
+            compression=args.compression,
+            compression_threads=args.compression_threads,
+            **options,
+        )
+    elif args.incremental:
+        converter.convert_to_directory(args.output, format=args.format, incremental=True, **options)
+    elif args.format == "oxigraph":
+        converter.convert_to_oxigraph(args.output, commit_size=args.commit_size, **options)
+    elif args.format == "parquet":
+        converter.convert_to_triple_table(args.output, commit_size=args.commit_size, **options)
+    elif args.format in GRAPH_FORMATS:
+        converter.convert(**options).serialize(destination=args.output, format=GRAPH_FORMATS[args.format])
+    else:
+        converter.convert_to_file(
+            args.output,
+            format=args.format,
+            task_graphs=args.task_graphs,
+            compression=args.compression,
+            compression_threads=args.compression_threads,
+            **options,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
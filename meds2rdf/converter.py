@@ -1,25 +1,141 @@
 # meds2rdf/converter.py
 from pathlib import Path
-from rdflib import Graph
-import polars as pl
+from rdflib import Dataset, URIRef
+from rdflib.store import Store
 import json
+from typing import Callable, Optional
 
-from .mapping.event_mapper import map_data_table
+from .mapping.event_mapper import map_data_table, compile_event_plan
 from .mapping.code_mapper import map_code_table
-from .mapping.label_mapper import map_label_table
+from .mapping.label_mapper import map_label_table, compile_label_plan
 from .mapping.split_mapper import map_split_table
 from .mapping.metadata_mapper import map_dataset_metadata
+from .mapping.plan import extension_columns
+from .sinks import (
+    TripleSink,
+    GraphSink,
+    PartitionedSink,
+    OxigraphSink,
+    TripleTableSink,
+    TurtleSink,
+    SubjectGraphRouter,
+    open_sink,
+    open_graph,
+)
+from .sinks.graph import DEFAULT_COMMIT_SIZE
+from .sinks.triple_table import DEFAULT_TABLE_COMMIT_SIZE
+from .parallel import list_data_shards, map_data_shards_parallel, read_part
+from .manifest import ShardManifest
+from .scan import Selection, iter_batches, label_task
+from .pipeline import read_ahead
+from .instrumentation import ConversionObserver, ConversionTracker, emitted
+from .utils.iri import check_iri_strategy, task_graph_iri
+from .utils.columnar import LexicalFormat
+from .utils.node_registry import NodeRegistry
+from .utils.term_cache import TERMS
+from .validation import ON_INVALID, InvalidRowsError, ValidationReport, quarantine, validate_inputs
 
 from meds2rdf.namespace import MEDS
 
+_METADATA_FILE = "metadata/dataset.json"
+
+
+def _begin(g, source: str):
+    """Tell a sink which input the next triples come from (no-op for Graphs)."""
+    if isinstance(g, TripleSink):
+        g.begin(source)
+
+
+def _task_graph(source: str) -> Optional[URIRef]:
+    """Named graph of a label input's task, None for every other input."""
+    task = label_task(source)
+    return task_graph_iri(task) if task is not None else None
+
+
+def _add_serialized(g, chunk: bytes):
+    """Merge an N-Triples chunk produced by a worker into a Graph or a sink."""
+    if isinstance(g, TripleSink):
+        g.add_serialized(chunk, format="nt")
+    else:
+        g.parse(data=chunk, format="nt")
+
+
 class MedsRDFConverter:
     """
     High-level object that converts an entire MEDS directory into an RDF graph.
     """
 
-    def __init__(self, meds_root: str | Path):
+    def __init__(
+        self,
+        meds_root: str | Path,
+        iri_strategy: str = "uuid",
+        node_cache_size: Optional[int] = 1 << 20,
+        observer: Optional[ConversionObserver] = None,
+        store: str | Store = "default",
+        store_path: Optional[str | Path] = None,
+        commit_size: int = DEFAULT_COMMIT_SIZE,
+        lexical: Optional[LexicalFormat] = None,
+        subject_graphs: bool = False,
+        on_invalid: Optional[str] = None,
+        quarantine_dir: Optional[str | Path] = None,
+    ):
+        """
+        Parameters
+        ----------
+        meds_root : str | Path
+            Root directory of the MEDS dataset
+        iri_strategy : str
+            "uuid" to mint random IRIs for events, labels and metadata nodes, or
+            "hash" to derive them from the row content (plus source shard and row
+            index), so that repeated conversions of the same data are identical.
+        node_cache_size : Optional[int]
+            How many subjects/codes are remembered as already declared (LRU), so
+            that their type and identifier triples are emitted once instead of
+            once per event. ``None`` remembers all of them.
+        observer : Optional[ConversionObserver]
+            Notified of per-stage and per-input timings, rows read, triples
+            emitted and bytes written (e.g. ``meds2rdf.SummaryReporter()``)
+        store : str | Store
+            rdflib store backing ``self.graph``: a plugin name or a Store instance.
+            Use a persistent store (e.g. "Oxigraph" from ``oxrdflib``, or
+            "BerkeleyDB") together with ``store_path`` for graphs larger than RAM.
+        store_path : Optional[str | Path]
+            Location the persistent store is opened (or created) at
+        commit_size : int
+            Number of triples written to the store per bulk insert/transaction
+        lexical : Optional[LexicalFormat]
+            Time zone and precision of the xsd:dateTime and xsd:double literals
+            of events and labels, e.g. ``LexicalFormat(time_zone="UTC")``
+        subject_graphs : bool
+            Put each subject's events, labels and split assignment in a named graph
+            named after the subject node, and codes and dataset metadata in
+            ``meds2rdf.sinks.SHARED_GRAPH``. ``self.graph`` is then a ``Dataset``,
+            and file outputs must be N-Quads.
+        on_invalid : Optional[str]
+            Validate every input on its lazy scan before mapping (null mandatory
+            fields, unknown splits, unknown ``parent_codes`` prefixes) and report it
+            to the observer's ``validation_finished``. On invalid rows, "raise" an
+            ``InvalidRowsError`` holding the report, "drop" them, or "quarantine"
+            them (drop, and write them with the report into ``quarantine_dir``).
+            None skips the validation pass.
+        quarantine_dir : Optional[str | Path]
+            Where "quarantine" writes the invalid rows, mirroring the input layout
+        """
         self.meds_root = Path(meds_root)
-        self.graph = Graph()
+        self.iri_strategy = check_iri_strategy(iri_strategy)
+        self.node_cache_size = node_cache_size
+        self.observer = observer or ConversionObserver()
+        self.commit_size = commit_size
+        self.lexical = lexical or LexicalFormat()
+        self.subject_graphs = subject_graphs
+        if on_invalid is not None and on_invalid not in ON_INVALID:
+            raise ValueError(f"Unknown on_invalid: '{on_invalid}', expected one of {ON_INVALID}")
+        if on_invalid == "quarantine" and quarantine_dir is None:
+            raise ValueError("on_invalid='quarantine' requires a quarantine_dir")
+        self.on_invalid = on_invalid
+        self.quarantine_dir = Path(quarantine_dir) if quarantine_dir is not None else None
+        self.validation_report: Optional[ValidationReport] = None
+        self.graph = open_graph(store, store_path, dataset=subject_graphs)
         self.graph.bind("meds", MEDS)
 
     # ------------------------------
@@ -31,58 +147,653 @@ class MedsRDFConverter:
         include_codes=True,
         include_labels=False,
         include_splits=False,
+        workers=1,
+        batch_size=None,
+        subject_ids=None,
+        time_range=None,
+        code_prefixes=None,
+        columns=None,
+        tasks=None,
+        pipeline_depth=0,
+        sample_fraction=None,
+        sample_seed=0,
     ):
         """
         Convert an entire MEDS dataset directory to RDF.
 
+        Parameters
+        ----------
+        workers : int
+            Number of processes mapping ``data/`` shards in parallel. With more
+            than one worker each shard is mapped in its own process and the
+            results are merged in shard order.
+        batch_size : Optional[int]
+            Read and map every input in batches of about ``batch_size`` rows, so
+            that memory scales with the batch instead of the dataset (when
+            streaming to a sink, which is flushed after each batch).
+        subject_ids, time_range, code_prefixes, columns
+            Convert only a subset of the events (see ``meds2rdf.scan.Selection``).
+            Filters are pushed down into the Parquet scans; codes, splits and
+            labels are then restricted to what the selected events reference.
+        tasks : Optional[list[str]]
+            Only map the labels of these tasks (subdirectories of ``labels/``)
+        pipeline_depth : int
+            If > 0, Parquet batches are decoded on a reader thread up to this many
+            batches ahead of the mapper (use with ``batch_size``), and file outputs
+            are encoded, compressed and written on a writer thread through a queue
+            of this many chunks, so that I/O overlaps mapping. 0 runs in sequence.
+        sample_fraction, sample_seed
+            Convert a deterministic sample of about ``sample_fraction`` of the
+            subjects: a seeded hash of ``subject_id`` is pushed into the scans of
+            events, splits and labels alike, and codes are restricted to the ones
+            the sampled events use
+
         Returns
         -------
         rdflib.Graph
         """
+        sink = GraphSink(self.graph, self.commit_size, router=self._router())
+        self._convert_into(
+            sink,
+            include_dataset_metadata=include_dataset_metadata,
+            include_codes=include_codes,
+            include_labels=include_labels,
+            include_splits=include_splits,
+            workers=workers,
+            batch_size=batch_size,
+            subject_ids=subject_ids,
+            time_range=time_range,
+            code_prefixes=code_prefixes,
+            columns=columns,
+            tasks=tasks,
+            pipeline_depth=pipeline_depth,
+            sample_fraction=sample_fraction,
+            sample_seed=sample_seed,
+        )
+        sink.close()
+        return self.graph
+
+    def convert_to_stream(self, sink: TripleSink, **kwargs) -> TripleSink:
+        """
+        Convert the MEDS dataset, sending every triple straight to ``sink``
+        instead of accumulating them in ``self.graph``.
+
+        Parameters
+        ----------
+        sink : TripleSink
+            Any object exposing ``add((s, p, o))`` (e.g. ``NTriplesSink``)
+        **kwargs
+            Same options as ``convert``
+
+        Returns
+        -------
+        TripleSink
+            The given sink, flushed
+        """
+        self._convert_into(sink, **kwargs)
+        sink.flush()
+        return sink
+
+    def convert_to_file(
+        self,
+        path: str | Path,
+        format: str = "nt",
+        task_graphs: bool = False,
+        compression: Optional[str] = None,
+        compression_threads: int = 1,
+        **kwargs,
+    ) -> Path:
+        """
+        Convert the MEDS dataset directly into an RDF file ("nt", "nq" or compact
+        Turtle, "ttl") without building an in-memory graph.
+
+        Parameters
+        ----------
+        task_graphs : bool
+            With "nq", put the labels of every task in their own named graph
+            (``meds-data:task/<task>``), everything else in the default graph
+        compression : Optional[str]
+            "gzip", "bgzip" (blocked gzip, indexable) or "zstd" to write a compressed
+            file (see ``meds2rdf.sinks.compression``)
+        compression_threads : int
+            If > 1, the output is compressed in independent blocks on this many
+            threads while the conversion runs, so it can also be decompressed in parallel
+
+        Returns
+        -------
+        Path
+            Path of the written file
+        """
+        if (task_graphs or self.subject_graphs) and format not in ("nq", "nquads"):
+            raise ValueError("Named graphs require an N-Quads output")
+        options = {"graph_for": _task_graph} if task_graphs else {}
+        if self.subject_graphs:
+            options["router"] = self._router()
+        queue_size = kwargs.get("pipeline_depth", 0)
+        with open_sink(
+            path,
+            format,
+            compression=compression,
+            queue_size=queue_size,
+            compression_threads=compression_threads,
+            **options,
+        ) as sink:
+            self.convert_to_stream(sink, **kwargs)
+        return Path(path)
+
+    def convert_to_oxigraph(self, store, commit_size: Optional[int] = None, **kwargs):
+        """
+        Convert the MEDS dataset straight into an embedded Oxigraph store (requires
+        ``pyoxigraph``) through its bulk loader, without an intermediate file.
+        Load throughput is reported to the observer's ``load_finished``.
+
+        Parameters
+        ----------
+        store : pyoxigraph.Store | str | Path
+            An open store, or the directory of an on-disk store to open or create
+        commit_size : Optional[int]
+            Triples per bulk load (defaults to the converter's ``commit_size``)
+        **kwargs
+            Same options as ``convert``
+
+        Returns
+        -------
+        pyoxigraph.Store
+        """
+        with OxigraphSink(store, commit_size or self.commit_size, router=self._router()) as sink:
+            self.convert_to_stream(sink, **kwargs)
+        self.observer.load_finished(sink.stats())
+        return sink.store
+
+    def convert_to_triple_table(self, out_dir: str | Path, commit_size: Optional[int] = None, **kwargs) -> Path:
+        """
+        Convert the MEDS dataset into a dictionary-encoded integer triple table:
+        ``out_dir/terms/*.parquet`` maps int64 ids to terms and
+        ``out_dir/triples/*.parquet`` holds ``s``, ``p``, ``o`` ids (plus ``g`` with
+        ``subject_graphs``), ready for Spark or warehouse loading.
+
+        Parameters
+        ----------
+        out_dir : str | Path
+            Directory the two tables are written to
+        commit_size : Optional[int]
+            Triples encoded (and written) per part (defaults to one million)
+        **kwargs
+            Same options as ``convert``
+
+        Returns
+        -------
+        Path
+            ``out_dir``
+        """
+        with TripleTableSink(out_dir, commit_size or DEFAULT_TABLE_COMMIT_SIZE, router=self._router()) as sink:
+            self.convert_to_stream(sink, **kwargs)
+        return sink.out_dir
+
+    def convert_to_parts(
+        self,
+        out_dir: str | Path,
+        partition_by: str = "shard",
+        buckets: int = 16,
+        max_part_size: Optional[int] = None,
+        format: str = "nt",
+        compression: Optional[str] = "gzip",
+        compression_threads: int = 1,
+        **kwargs,
+    ) -> Path:
+        """
+        Convert the MEDS dataset into numbered parts (``out_dir/part-00000.nt.gz``, ...)
+        that can be bulk-loaded in parallel, described by ``out_dir/manifest.json``
+        (triple count, size and SHA-256 of every part).
+
+        Parameters
+        ----------
+        partition_by : str
+            "shard" (one part per input file), "task" (labels of each task apart
+            from everything else), "subject" (``buckets`` parts keyed by a hash of
+            the triple subject) or "size" (split on ``max_part_size`` only)
+        max_part_size : Optional[int]
+            Approximate uncompressed size in bytes at which a part is rolled over
+        compression, compression_threads
+            As for ``convert_to_file``
+        **kwargs
+            Same options as ``convert``
+
+        Returns
+        -------
+        Path
+            The output directory
+        """
+        queue_size = kwargs.get("pipeline_depth", 0)
+        with PartitionedSink(
+            out_dir,
+            partition_by,
+            buckets,
+            max_part_size,
+            format,
+            compression,
+            queue_size,
+            self._router(),
+            compression_threads,
+        ) as sink:
+            self.convert_to_stream(sink, **kwargs)
+        return Path(out_dir)
 
+    def convert_to_directory(
+        self,
+        out_dir: str | Path,
+        format: str = "nt",
+        incremental=False,
+        include_dataset_metadata=True,
+        include_codes=True,
+        include_labels=False,
+        include_splits=False,
+        workers=1,
+        batch_size=None,
+        subject_ids=None,
+        time_range=None,
+        code_prefixes=None,
+        columns=None,
+        tasks=None,
+        pipeline_depth=0,
+        sample_fraction=None,
+        sample_seed=0,
+    ) -> Path:
+        """
+        Convert the MEDS dataset into one output part per input file, mirroring the
+        input layout under ``out_dir`` (e.g. ``data/train/0.parquet`` -> ``data/train/0.nt``),
+        and record inputs and parts in ``out_dir/manifest.json``.
+
+        Parameters
+        ----------
+        incremental : bool
+            Re-map only inputs that are new or whose content changed since the
+            manifest was written, and delete the parts of inputs that no longer
+            exist. Changing the dataset metadata or any conversion option forces a
+            full rebuild, since every part references the dataset node. With event
+            filters, codes, splits and labels are also re-mapped whenever a data
+            shard changed, since they are restricted to the selected events.
+
+        Returns
+        -------
+        Path
+            The output directory
+        """
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        selection = Selection(
+            subject_ids,
+            time_range,
+            code_prefixes,
+            columns,
+            tasks,
+            sample_fraction=sample_fraction,
+            sample_seed=sample_seed,
+        )
+        tracker = ConversionTracker(self.observer)
+        tracker.start(self.meds_root)
+        TERMS.reset_stats()
+
+        options = {
+            "format": format,
+            "iri_strategy": self.iri_strategy,
+            "include_dataset_metadata": include_dataset_metadata,
+            "include_codes": include_codes,
+            "include_labels": include_labels,
+            "include_splits": include_splits,
+            "on_invalid": self.on_invalid,
+            **self.lexical.to_options(),
+            **selection.to_options(),
+        }
+        previous = ShardManifest.load(out_dir)
+        if not incremental or previous.options != options:
+            # keep the old entries only to clean up their parts
+            previous = ShardManifest(entries=previous.entries)
+        manifest = ShardManifest(options=options)
+
+        def part_for(source: str) -> str:
+            return Path(source).with_suffix(f".{format}").as_posix()
+
+        def open_part(source: str) -> TripleSink:
+            part = out_dir / part_for(source)
+            part.parent.mkdir(parents=True, exist_ok=True)
+            return open_sink(part, format, queue_size=pipeline_depth)
+
+        def reusable(source: str, path: Path):
+            if not previous.options:
+                return None
+            return previous.is_unchanged(source, path)
+
+        # 1. Dataset metadata: a changed dataset node invalidates every other part
         dataset_uri = None
+        meta_path = self.meds_root / _METADATA_FILE
+        if include_dataset_metadata and meta_path.exists():
+            if (entry := reusable(_METADATA_FILE, meta_path)) and previous.dataset_uri:
+                dataset_uri = URIRef(previous.dataset_uri)
+                manifest.entries[_METADATA_FILE] = entry
+            else:
+                # nothing recorded before can be reused
+                previous.options = {}
+                with open_part(_METADATA_FILE) as sink, tracker.input("metadata", _METADATA_FILE, sink) as record:
+                    dataset_uri = self._map_metadata(sink, meta_path)
+                    record["rows"] = 1
+                manifest.record(_METADATA_FILE, meta_path, "metadata", part_for(_METADATA_FILE))
+        manifest.dataset_uri = str(dataset_uri) if dataset_uri else None
+
+        # 2. Data, codes, splits and labels
+        extensions = self._extension_columns()
+        inputs = self._list_inputs(include_codes, include_splits, include_labels, selection)
+        selection.resolve([path for stage, path in inputs if stage == "data"])
+        reused = {}
+        for stage, path in inputs:
+            source = self._source_name(path)
+            if entry := reusable(source, path):
+                reused[source] = entry
+        if selection.filters_events:
+            # codes, splits and labels are restricted to what the selected events
+            # reference, so they are stale as soon as the set of data shards moved
+            data_sources = {self._source_name(path) for stage, path in inputs if stage == "data"}
+            previous_data = {source for source, entry in previous.entries.items() if entry["stage"] == "data"}
+            if data_sources != previous_data or any(source not in reused for source in data_sources):
+                reused = {source: entry for source, entry in reused.items() if entry["stage"] == "data"}
+        manifest.entries.update(reused)
+        stale = [(stage, path) for stage, path in inputs if self._source_name(path) not in reused]
+        self._validate(stale, selection)
+
+        def write_part(stage: str, path: Path, result: tuple | None = None):
+            source = self._source_name(path)
+            with open_part(source) as sink, tracker.input(stage, source, sink) as record:
+                # parts get their own registry so that each one stays self-contained
+                if result is None:
+                    record["rows"] = self._map_input(
+                        sink,
+                        stage,
+                        path,
+                        dataset_uri,
+                        NodeRegistry(self.node_cache_size),
+                        selection,
+                        batch_size,
+                        lambda rows: tracker.tick(record, rows),
+                        extensions,
+                        pipeline_depth,
+                    )
+                else:
+                    part, record["rows"], _ = result
+                    for chunk in read_part(part):
+                        sink.add_serialized(chunk, format="nt")
+            manifest.record(source, path, stage, part_for(source))
+
+        stale_shards = [path for stage, path in stale if stage == "data"]
+        if workers > 1 and stale_shards:
+            # the pool starts, and workers map, before the first part is written
+            tracker.enter("data")
+            results = map_data_shards_parallel(
+                stale_shards,
+                workers,
+                self.meds_root,
+                dataset_uri,
+                iri_strategy=self.iri_strategy,
+                selection=selection,
+                batch_size=batch_size,
+                extension_columns=extensions,
+                lexical=self.lexical,
+            )
+            for path, result in zip(stale_shards, results):
+                write_part("data", path, result)
+            stale = [(stage, path) for stage, path in stale if stage != "data"]
+        for stage, path in stale:
+            write_part(stage, path)
+
+        # 3. Drop the parts of inputs that disappeared
+        for source, entry in previous.entries.items():
+            if source not in manifest.entries:
+                (out_dir / entry["output"]).unlink(missing_ok=True)
+
+        manifest.save(out_dir)
+        tracker.finish({"terms": TERMS.stats()})
+        return out_dir
+
+    def _convert_into(
+        self,
+        g,
+        include_dataset_metadata=True,
+        include_codes=True,
+        include_labels=False,
+        include_splits=False,
+        workers=1,
+        batch_size=None,
+        subject_ids=None,
+        time_range=None,
+        code_prefixes=None,
+        columns=None,
+        tasks=None,
+        pipeline_depth=0,
+        sample_fraction=None,
+        sample_seed=0,
+    ):
+        dataset_uri = None
+        selection = Selection(
+            subject_ids,
+            time_range,
+            code_prefixes,
+            columns,
+            tasks,
+            sample_fraction=sample_fraction,
+            sample_seed=sample_seed,
+        )
+        tracker = ConversionTracker(self.observer)
+        tracker.start(self.meds_root)
+        TERMS.reset_stats()
+
+        # Inputs are listed and validated before anything is mapped
+        extensions = self._extension_columns()
+        inputs = self._list_inputs(include_codes, include_splits, include_labels, selection)
+        shards = [path for stage, path in inputs if stage == "data"]
+        selection.resolve(shards)
+        self._validate(inputs, selection)
 
         # 1. Dataset metadata
         if include_dataset_metadata:
-            meta_path = self.meds_root / "metadata/dataset.json"
+            meta_path = self.meds_root / _METADATA_FILE
             if meta_path.exists():
-                with open(meta_path) as f:
-                    meta = json.load(f)
-                dataset_uri = map_dataset_metadata(self.graph, meta)
+                _begin(g, _METADATA_FILE)
+                with tracker.input("metadata", _METADATA_FILE, g) as record:
+                    dataset_uri = self._map_metadata(g, meta_path)
+                    record["rows"] = 1
+
+        # 2.-5. Data tables, codes, subject splits and labels
+        if workers > 1:
+            # the pool starts, and workers map, before the first shard is merged
+            tracker.enter("data")
+            results = map_data_shards_parallel(
+                shards,
+                workers,
+                self.meds_root,
+                dataset_uri,
+                iri_strategy=self.iri_strategy,
+                selection=selection,
+                batch_size=batch_size,
+                extension_columns=extensions,
+                lexical=self.lexical,
+            )
+            for shard, (part, rows, seconds) in zip(shards, results):
+                _begin(g, self._source_name(shard))
+                triples, bytes_written = emitted(g)
+                for chunk in read_part(part):
+                    _add_serialized(g, chunk)
+                after = emitted(g)
+                tracker.record(
+                    "data", self._source_name(shard), seconds, rows, after[0] - triples, after[1] - bytes_written
+                )
+            inputs = [(stage, path) for stage, path in inputs if stage != "data"]
+
+        registry = NodeRegistry(self.node_cache_size)
+        for stage, path in inputs:
+            _begin(g, self._source_name(path))
+            with tracker.input(stage, self._source_name(path), g) as record:
+                record["rows"] = self._map_input(
+                    g,
+                    stage,
+                    path,
+                    dataset_uri,
+                    registry,
+                    selection,
+                    batch_size,
+                    lambda rows: tracker.tick(record, rows),
+                    extensions,
+                    pipeline_depth,
+                )
+
+        tracker.finish({"terms": TERMS.stats()})
+
+    def _validate(self, inputs: list[tuple[str, Path]], selection: Selection):
+        """
+        Check ``inputs`` before mapping them according to ``on_invalid``; on invalid
+        rows, raise or make ``selection`` drop them.
+        """
+        if self.on_invalid is None:
+            return
+        frames = [(stage, self._source_name(path), selection.scan(stage, path)) for stage, path in inputs]
+        report = self.validation_report = validate_inputs(frames)
+        self.observer.validation_finished(report)
+        if report.ok:
+            return
+        if self.on_invalid == "raise":
+            raise InvalidRowsError(report)
+        if self.on_invalid == "quarantine":
+            invalid = report.invalid_sources
+            for stage, source, lf in frames:
+                if source in invalid:
+                    quarantine(stage, source, lf, self.quarantine_dir)
+            report.save(self.quarantine_dir / "report.json")
+        selection.drop_invalid = True
 
-        # 2. Data tables
-        data = pl.read_parquet(str(self.meds_root / "data/**/*.parquet")).to_dicts()
-        map_data_table(self.graph, data, dataset_uri)
+    def _list_inputs(
+        self, include_codes=True, include_splits=False, include_labels=False, selection: Optional[Selection] = None
+    ) -> list[tuple[str, Path]]:
+        """(stage, path) of every input file to map, in conversion order."""
+        inputs = [("data", shard) for shard in list_data_shards(self.meds_root)]
 
-        # 3. Codes
         if include_codes:
             code_file = self.meds_root / "metadata/codes.parquet"
             if code_file.exists():
-                codes = pl.read_parquet(str(code_file)).to_dicts()
-                map_code_table(self.graph, codes, dataset_uri)
+                inputs.append(("codes", code_file))
 
-        # 4. Subject splits
         if include_splits:
             split_file = self.meds_root / "metadata/subject_splits.parquet"
             if split_file.exists():
-                splits = pl.read_parquet(str(split_file)).to_dicts()
-                map_split_table(self.graph, splits)
+                inputs.append(("splits", split_file))
 
-        # 5. Labels
         if include_labels:
-            label_files = list((self.meds_root / "labels").rglob("*.parquet"))
-            labels = [row for f in label_files for row in pl.read_parquet(str(f)).to_dicts()]
-            map_label_table(self.graph, labels, dataset_uri)
+            for label_file in (selection or Selection()).label_files(self.meds_root):
+                inputs.append(("labels", label_file))
 
-        return self.graph
+        return inputs
+
+    def _router(self) -> Optional[SubjectGraphRouter]:
+        """Fresh per-triple graph router if subject graphs are enabled."""
+        return SubjectGraphRouter() if self.subject_graphs else None
+
+    def _extension_columns(self) -> tuple:
+        """Extra data columns declared in ``metadata/dataset.json``, if any."""
+        meta_path = self.meds_root / _METADATA_FILE
+        if not meta_path.exists():
+            return ()
+        with open(meta_path) as f:
+            return extension_columns(json.load(f))
+
+    def _map_metadata(self, g, meta_path: Path) -> URIRef:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return map_dataset_metadata(g, meta, iri_strategy=self.iri_strategy)
+
+    def _map_input(
+        self,
+        g,
+        stage: str,
+        path: Path,
+        dataset_uri=None,
+        registry: Optional[NodeRegistry] = None,
+        selection: Optional[Selection] = None,
+        batch_size: Optional[int] = None,
+        on_batch: Optional[Callable[[int], None]] = None,
+        extensions: tuple = (),
+        pipeline_depth: int = 0,
+    ) -> int:
+        """
+        Map a single input file of the given stage into ``g``, ``batch_size`` rows at
+        a time (whole file if None), and return the number of rows read. Sinks are
+        flushed after every batch. Data and label mapping plans are compiled once
+        from the file schema; ``extensions`` are the extra data columns to map.
+        With ``pipeline_depth`` > 0 batches are read ahead on a background thread.
+        """
+        selection = selection or Selection()
+        source = self._source_name(path)
+        lf = selection.scan(stage, path)
+
+        plan = None
+        if stage == "data":
+            plan = compile_event_plan(lf.collect_schema(), extensions, self.lexical)
+        elif stage == "labels":
+            plan = compile_label_plan(lf.collect_schema(), self.lexical)
+
+        rows = 0
+        for batch in read_ahead(iter_batches(lf, batch_size), pipeline_depth):
+            if stage == "data":
+                map_data_table(
+                    g,
+                    batch,
+                    dataset_uri,
+                    iri_strategy=self.iri_strategy,
+                    source=source,
+                    row_offset=rows,
+                    registry=registry,
+                    plan=plan,
+                )
+            elif stage == "codes":
+                map_code_table(g, batch.to_dicts(), dataset_uri, registry=registry)
+            elif stage == "splits":
+                map_split_table(g, batch.to_dicts())
+            else:
+                map_label_table(
+                    g,
+                    batch,
+                    dataset_uri,
+                    iri_strategy=self.iri_strategy,
+                    source=source,
+                    row_offset=rows,
+                    plan=plan,
+                )
+            rows += batch.height
+            if batch_size is not None and isinstance(g, TripleSink):
+                g.flush()
+            if on_batch is not None:
+                on_batch(rows)
+        return rows
+
+    def _source_name(self, path: Path) -> str:
+        """Path of an input file relative to the MEDS root, stable across machines."""
+        return path.relative_to(self.meds_root).as_posix()
 
     # ------------------------------
     # Serialization helpers
     # ------------------------------
     def to_turtle(self, path: str | Path):
-        self.graph.serialize(destination=str(path), format="turtle")
+        # grouping per subject is enough for compact Turtle; rdflib's serializer
+        # also sorts and analyses the whole graph, several times slower
+        # with subject_graphs the triples are spread over named graphs, which Turtle
+        # cannot name: write them all, as the N-Triples serializer does
+        graphs = self.graph.contexts() if isinstance(self.graph, Dataset) else (self.graph,)
+        with TurtleSink(path) as sink:
+            for graph in graphs:
+                for subject in graph.subjects(unique=True):
+                    for p, o in graph.predicate_objects(subject):
+                        sink.add((subject, p, o))
 
     def to_xml(self, path: str | Path):
+        if isinstance(self.graph, Dataset):
+            # rdflib's RDF/XML serializer only writes the default graph
+            raise ValueError("Named graphs require an N-Quads output: use convert_to_file(path, format=\"nq\")")
         self.graph.serialize(destination=str(path), format="xml")
 
     def to_nt(self, path: str | Path):
@@ -0,0 +1,205 @@
+"""Timing and throughput hooks for MedsRDFConverter."""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import IO, Optional
+
+from .sinks.base import TripleSink
+
+
+class ConversionObserver:
+    """
+    Receives the progress of a conversion. Subclass it and override the hooks you
+    need; every hook is a no-op by default.
+
+    Counts are triples emitted towards the output and, for file sinks, bytes written.
+    """
+
+    def conversion_started(self, meds_root: str):
+        pass
+
+    def validation_finished(self, report):
+        """The inputs have been checked before mapping (a ``meds2rdf.validation.ValidationReport``)."""
+
+    def stage_started(self, stage: str):
+        pass
+
+    def input_finished(self, stage: str, source: str, seconds: float, rows: int, triples: int, bytes_written: int):
+        """One input file (e.g. a data shard) has been mapped."""
+
+    def stage_finished(self, stage: str, seconds: float, rows: int, triples: int, bytes_written: int):
+        pass
+
+    def progress(self, stage: str, elapsed: float, rows: int, triples: int, bytes_written: int):
+        """Cumulative totals since the conversion started, sent after every input or batch."""
+
+    def cache_stats(self, name: str, stats: dict):
+        """Hit/miss statistics of a cache used by the conversion (e.g. "terms"), sent before it finishes."""
+
+    def conversion_finished(self, seconds: float, rows: int, triples: int, bytes_written: int):
+        pass
+
+    def load_finished(self, stats: dict):
+        """A store sink has loaded its last batch (triples, commits, seconds, triples_per_second)."""
+
+
+class SummaryReporter(ConversionObserver):
+    """
+    Built-in observer: prints a progress line at most every ``progress_interval``
+    seconds and a per-stage throughput table when the conversion ends.
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None, progress_interval: Optional[float] = 10.0):
+        self.stream = stream or sys.stderr
+        self.progress_interval = progress_interval
+        self.stages: dict[str, dict] = {}
+        self.inputs: list[dict] = []
+        self.total: dict = {}
+        self.caches: dict[str, dict] = {}
+        self.load: dict = {}
+        self.validation = None
+        self._last_progress = 0.0
+
+    def validation_finished(self, report):
+        self.validation = report
+        print(f"validated in {report.seconds:.2f}s: {report}", file=self.stream)
+
+    def input_finished(self, stage, source, seconds, rows, triples, bytes_written):
+        self.inputs.append({
+            "stage": stage, "source": source, "seconds": seconds,
+            "rows": rows, "triples": triples, "bytes": bytes_written,
+        })
+
+    def stage_finished(self, stage, seconds, rows, triples, bytes_written):
+        self.stages[stage] = {"seconds": seconds, "rows": rows, "triples": triples, "bytes": bytes_written}
+
+    def progress(self, stage, elapsed, rows, triples, bytes_written):
+        if self.progress_interval is None or elapsed - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = elapsed
+        print(
+            f"[{elapsed:8.1f}s] {stage:<8} {rows:>12,} rows {triples:>14,} triples "
+            f"({triples / elapsed if elapsed else 0:,.0f}/s)",
+            file=self.stream,
+        )
+
+    def cache_stats(self, name, stats):
+        self.caches[name] = stats
+
+    def conversion_finished(self, seconds, rows, triples, bytes_written):
+        self.total = {"seconds": seconds, "rows": rows, "triples": triples, "bytes": bytes_written}
+        print(self.summary(), file=self.stream)
+
+    def load_finished(self, stats):
+        self.load = stats
+        print(
+            f"loaded {stats['triples']:,} triples in {stats['commits']:,} commits, "
+            f"{stats['seconds']:.2f}s ({stats['triples_per_second']:,.0f} triples/s)",
+            file=self.stream,
+        )
+
+    def summary(self) -> str:
+        lines = [f"{'stage':<10}{'seconds':>10}{'rows':>14}{'triples':>16}{'triples/s':>14}{'MB':>10}"]
+        for stage, s in [*self.stages.items(), ("total", self.total)]:
+            if not s:
+                continue
+            rate = s["triples"] / s["seconds"] if s["seconds"] else 0
+            lines.append(
+                f"{stage:<10}{s['seconds']:>10.2f}{s['rows']:>14,}{s['triples']:>16,}{rate:>14,.0f}{s['bytes'] / 1e6:>10.1f}"
+            )
+        for name, c in self.caches.items():
+            lines.append(f"{name} cache: {c['hits']:,} hits, {c['misses']:,} misses ({c['hit_rate']:.1%}), {c['size']:,} entries")
+        return "\n".join(lines)
+
+
+def emitted(target) -> tuple[int, int]:
+    """(triples, bytes) emitted so far into a sink, or held by a Graph."""
+    if isinstance(target, TripleSink):
+        return target.count, getattr(target, "bytes_written", 0)
+    return len(target), 0
+
+
+class ConversionTracker:
+    """
+    Turns converter events into observer calls, keeping per-stage and overall totals.
+    Stages are opened and closed implicitly, as inputs of a new stage come in.
+    """
+
+    def __init__(self, observer: ConversionObserver):
+        self.observer = observer
+        self.stage: Optional[str] = None
+        self.totals = [0, 0, 0]
+        self._stage_totals = [0, 0, 0]
+
+    def start(self, meds_root):
+        self._start = time.perf_counter()
+        self.observer.conversion_started(str(meds_root))
+
+    def _enter_stage(self, stage: str):
+        if stage != self.stage:
+            self._close_stage()
+            self.stage = stage
+            self._stage_start = time.perf_counter()
+            self._stage_totals = [0, 0, 0]
+            self.observer.stage_started(stage)
+
+    def _close_stage(self):
+        if self.stage is not None:
+            self.observer.stage_finished(self.stage, time.perf_counter() - self._stage_start, *self._stage_totals)
+            self.stage = None
+
+    def enter(self, stage: str):
+        """Open ``stage`` ahead of its first input, e.g. so that starting a worker pool is timed as part of it."""
+        self._enter_stage(stage)
+
+    def record(self, stage: str, source: str, seconds: float, rows: int, triples: int, bytes_written: int):
+        self._enter_stage(stage)
+        for totals in (self.totals, self._stage_totals):
+            totals[0] += rows
+            totals[1] += triples
+            totals[2] += bytes_written
+        self.observer.input_finished(stage, source, seconds, rows, triples, bytes_written)
+        self.observer.progress(stage, time.perf_counter() - self._start, *self.totals)
+
+    @contextmanager
+    def input(self, stage: str, source: str, target):
+        """
+        Time the mapping of one input into ``target``; the caller stores the number
+        of rows it read in the yielded dict.
+        """
+        self._enter_stage(stage)
+        record = {"rows": 0, "_target": target, "_before": emitted(target)}
+        start = time.perf_counter()
+        yield record
+        if isinstance(target, TripleSink):
+            # so that bytes_written accounts for this input
+            target.flush()
+        seconds = time.perf_counter() - start
+        triples, bytes_written = self._delta(record)
+        self.record(stage, source, seconds, record["rows"], triples, bytes_written)
+
+    def tick(self, record: dict, rows: int):
+        """Progress event in the middle of an input, e.g. after each batch."""
+        record["rows"] = rows
+        triples, bytes_written = self._delta(record)
+        self.observer.progress(
+            self.stage,
+            time.perf_counter() - self._start,
+            self.totals[0] + rows,
+            self.totals[1] + triples,
+            self.totals[2] + bytes_written,
+        )
+
+    @staticmethod
+    def _delta(record: dict) -> tuple[int, int]:
+        after = emitted(record["_target"])
+        before = record["_before"]
+        return after[0] - before[0], after[1] - before[1]
+
+    def finish(self, caches: Optional[dict] = None):
+        """End the conversion; ``caches`` maps cache names to their ``stats()``."""
+        self._close_stage()
+        for name, stats in (caches or {}).items():
+            self.observer.cache_stats(name, stats)
+        self.observer.conversion_finished(time.perf_counter() - self._start, *self.totals)
@@ -0,0 +1,65 @@
+"""Manifest of the input files of a conversion and of the output parts they produced."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+MANIFEST_FILENAME = "manifest.json"
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_fingerprint(path: Path) -> dict:
+    """Size, modification time and SHA-256 content hash of ``path``."""
+    stat = path.stat()
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+
+
+class ShardManifest:
+    """
+    Records, for every input file (keyed by its path relative to the MEDS root),
+    its fingerprint, the conversion stage that consumed it and the output part it
+    produced. ``options`` holds the conversion settings the parts were built with.
+    """
+
+    def __init__(self, options: Optional[dict] = None, dataset_uri: Optional[str] = None, entries: Optional[dict] = None):
+        self.options = options or {}
+        self.dataset_uri = dataset_uri
+        self.entries: dict[str, dict] = entries or {}
+
+    @classmethod
+    def load(cls, out_dir: Path) -> "ShardManifest":
+        path = Path(out_dir) / MANIFEST_FILENAME
+        if not path.exists():
+            return cls()
+        with open(path) as f:
+            content = json.load(f)
+        return cls(content.get("options"), content.get("dataset_uri"), content.get("inputs"))
+
+    def save(self, out_dir: Path):
+        path = Path(out_dir) / MANIFEST_FILENAME
+        content = {"options": self.options, "dataset_uri": self.dataset_uri, "inputs": self.entries}
+        with open(path, "w") as f:
+            json.dump(content, f, indent=2, sort_keys=True)
+
+    def is_unchanged(self, source: str, path: Path) -> Optional[dict]:
+        """
+        Return the recorded entry for ``source`` if ``path`` still has the same content,
+        None otherwise. The content hash is only computed when size or mtime moved.
+        """
+        entry = self.entries.get(source)
+        if entry is None:
+            return None
+        stat = path.stat()
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return entry
+        if stat.st_size == entry["size"] and file_fingerprint(path)["sha256"] == entry["sha256"]:
+            return dict(entry, mtime_ns=stat.st_mtime_ns)
+        return None
+
+    def record(self, source: str, path: Path, stage: str, output: str, fingerprint: Optional[dict] = None):
+        self.entries[source] = {**(fingerprint or file_fingerprint(path)), "stage": stage, "output": output}
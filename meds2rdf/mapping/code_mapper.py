@@ -3,11 +3,13 @@ from rdflib.namespace import XSD
 from typing import Optional, Iterable
 from ..namespace import MEDS
 from ..utils.rdf_utils import *
+from ..utils.node_registry import NodeRegistry
 
 def map_code(
     g: Graph,
     row: dict,
-    dataset_uri: Optional[URIRef] = None
+    dataset_uri: Optional[URIRef] = None,
+    registry: Optional[NodeRegistry] = None,
 ) -> URIRef:
     """
     Map a single row of a MEDS CodeSchema into a Code RDF individual.
@@ -20,6 +22,8 @@ def map_code(
         Dictionary representing a single code (code, descrption, parent_codes, etc.)
     dataset_uri : Optional[URIRef]
         URI of the dataset metadata to link via prov:wasDerivedFrom
+    registry : Optional[NodeRegistry]
+        Codes already declared in this conversion
 
     Returns
     -------
@@ -28,12 +32,12 @@ def map_code(
     """
 
     code_str = try_access_mandatory_field_value(row=row, field="code", entity="Code")
-    code_uri = add_code(code_str=code_str, graph=g, dataset_uri=dataset_uri)
+    code_uri = add_code(code_str=code_str, graph=g, dataset_uri=dataset_uri, registry=registry)
 
     if_column_is_present("description", row, lambda v: g.add((code_uri, MEDS.codeDescription, to_literal(v, XSD.string))))
 
     def process_parent_code(v: str):
-        return g.add((code_uri, MEDS.parentCode, add_code(code_str=v, graph=g, external=True)))
+        return g.add((code_uri, MEDS.parentCode, add_code(code_str=v, graph=g, external=True, registry=registry)))
 
     if_column_is_present("parent_codes", row, process_parent_code)
 
@@ -43,7 +47,8 @@ def map_code(
 def map_code_table(
     g: Graph,
     data: Iterable[dict],
-    dataset_uri: Optional[URIRef] = None
+    dataset_uri: Optional[URIRef] = None,
+    registry: Optional[NodeRegistry] = None,
 ) -> list[URIRef]:
     """
     Map an iterable of MEDS CodeSchema rows to RDF Code individuals.
@@ -56,14 +61,17 @@ def map_code_table(
         List of rows/dicts representing the MEDS CodeSchema
     dataset_uri : Optional[URIRef]
         URI of the dataset metadata to link all codes to
+    registry : Optional[NodeRegistry]
+        Codes already declared in this conversion (e.g. by the events)
 
     Returns
     -------
     list[URIRef]
         List of URIs of the created Code individuals
     """
+    registry = registry if registry is not None else NodeRegistry()
     uris = []
     for row in data:
-        code_uri = map_code(g, row, dataset_uri)
+        code_uri = map_code(g, row, dataset_uri, registry)
         uris.append(code_uri)
     return uris
@@ -1,9 +1,17 @@
 from rdflib import Graph, URIRef, Literal
 from rdflib.namespace import RDF, XSD
-import uuid
+import polars as pl
 from typing import Optional, Iterable
 from ..namespace import MEDS, MEDS_INSTANCES, PROV
-from ..utils.rdf_utils import *
+from ..utils.columnar import LexicalFormat, iri_expr, quoted_iri_series, check_mandatory_columns
+from ..utils.iri import row_iris
+from ..utils.node_registry import NodeRegistry
+from ..utils.term_cache import TERMS
+from .plan import MappingPlan, add_literals
+
+# always read (see Selection.columns), hence the key of hashed event IRIs
+_MANDATORY_COLUMNS = ("subject_id", "code")
+_RESERVED_COLUMNS = _MANDATORY_COLUMNS
 
 _literals_dict = {
     "time": (MEDS.time, XSD.dateTime),
@@ -15,6 +23,7 @@ def map_event(
     g: Graph,
     row: dict,
     dataset_uri: Optional[URIRef] = None,
+    iri_strategy: str = "uuid",
 ) -> URIRef:
     """
     Map a single row of a MEDS DataSchema into a Event RDF individual.
@@ -27,72 +36,135 @@ def map_event(
         Dictionary representing a single event (subject_id, time, code, numeric_value, text_value, site_id)
     dataset_uri : Optional[URIRef]
         URI of the dataset metadata to link via prov:wasDerivedFrom
-    generate_code_node : bool
-        Whether to create a Code individual
+    iri_strategy : str
+        "uuid" or "hash", see ``map_data_table``
 
     Returns
     -------
     URIRef
         URI of the created Event individual
     """
-    # Create unique URI for the event
-    event_uri = URIRef(MEDS_INSTANCES[f"event/{uuid.uuid4()}"])
-    g.add((event_uri, RDF.type, MEDS.Event))
-
-    # ---------------------------
-    # Subject
-    # ---------------------------
-    subject_id = try_access_mandatory_field_value(row=row, field="subject_id", entity="Event")
-    subject_uri = to_subject_node(subject_id)
-    g.add((event_uri, MEDS.hasSubject, subject_uri))
-    g.add((subject_uri, RDF.type, MEDS.Subject))
-    g.add((subject_uri, MEDS.subjectId, Literal(str(subject_id), datatype=XSD.string)))
-
-    # ---------------------------
-    # Code
-    # ---------------------------
-    code_str = try_access_mandatory_field_value(row=row, field="code", entity="Event")
-    g.add((event_uri, MEDS.codeString, Literal(str(code_str), datatype=XSD.string)))    
-    g.add((event_uri, MEDS.hasCode, add_code(code_str=code_str, graph=g)))
-
-    # ---------------------------
-    # Link to dataset metadata if provided
-    # ---------------------------
-    if dataset_uri:
-        g.add((event_uri, PROV.wasDerivedFrom, dataset_uri))
-
-    for column_name, (p, dtype) in _literals_dict.items():
-        if_column_is_present(column_name, row, lambda v: g.add((event_uri, p, to_literal(v, dtype))))
-
-    return event_uri
+    return map_data_table(g, [row], dataset_uri, iri_strategy=iri_strategy)[0]
+
+
+def compile_event_plan(
+    schema: pl.Schema | dict,
+    extension_columns: Iterable[str] = (),
+    lexical: Optional[LexicalFormat] = None,
+) -> MappingPlan:
+    """Mapping plan of a data table with the given schema (see ``MappingPlan``)."""
+    return MappingPlan(schema, _literals_dict, extension_columns, reserved=_RESERVED_COLUMNS, lexical=lexical)
+
+
+def _event_columns(
+    df: pl.DataFrame, plan: MappingPlan, iri_strategy: str, source: Optional[str], row_offset: int
+) -> pl.DataFrame:
+    """
+    Compute, as whole columns, the IRIs and literal lexical forms needed to emit
+    the triples of every event in ``df``.
+    """
+    event_iris = row_iris(
+        df, MEDS_INSTANCES["event/"], _MANDATORY_COLUMNS, iri_strategy, source, row_offset
+    )
+    return pl.DataFrame({"event": event_iris}).hstack(
+        df.select(
+            iri_expr(MEDS_INSTANCES["subject/"], "subject_id").alias("subject"),
+            pl.col("subject_id").cast(pl.String),
+            pl.col("code").cast(pl.String),
+            *plan.lexical_exprs(),
+        )
+    ).with_columns(
+        quoted_iri_series(MEDS_INSTANCES["code/"], df["code"]).alias("code_iri"),
+    ).select("event", "subject", "subject_id", "code", "code_iri", *plan.columns)
 
 
 def map_data_table(
     g: Graph,
-    data: Iterable[dict],
+    data: pl.DataFrame | Iterable[dict],
     dataset_uri: Optional[URIRef] = None,
+    iri_strategy: str = "uuid",
+    source: Optional[str] = None,
+    row_offset: int = 0,
+    registry: Optional[NodeRegistry] = None,
+    plan: Optional[MappingPlan] = None,
+    extension_columns: Iterable[str] = (),
 ) -> list[URIRef]:
     """
-    Map an iterable of MEDS DataSchema rows to RDF Event individuals.
+    Map a batch of MEDS DataSchema rows to RDF Event individuals.
+
+    IRIs and lexical forms are computed column-wise with Polars; the remaining
+    per-row work only builds terms from precomputed strings.
 
     Parameters
     ----------
     g : Graph
         RDF graph to populate
-    data : Iterable[dict]
-        List of rows/dicts representing the MEDS DataSchema
+    data : pl.DataFrame | Iterable[dict]
+        DataFrame (or rows/dicts) following the MEDS DataSchema
     dataset_uri : Optional[URIRef]
         URI of the dataset metadata to link all events to
-    generate_code_node : bool
-        Whether to create a Code individual
+    iri_strategy : str
+        "uuid" for random event IRIs, "hash" for IRIs derived from the event's
+        subject and code plus its ``source`` and row index, which do not depend
+        on the columns read
+    source : Optional[str]
+        Name of the shard the rows come from, used to disambiguate hashed IRIs
+    row_offset : int
+        Index of the first row of ``data`` within ``source`` (for batched reads);
+        ignored when ``data`` carries the row index column of the scans
+    registry : Optional[NodeRegistry]
+        Subjects and codes already declared in this conversion; their
+        ``rdf:type``/identifier triples are not emitted again
+    plan : Optional[MappingPlan]
+        Plan compiled with ``compile_event_plan`` from the schema of the table the
+        batch comes from; compiled from ``data`` when None
+    extension_columns : Iterable[str]
+        Extra columns declared in ``dataset.json`` to map when ``plan`` is None
 
     Returns
     -------
     list[URIRef]
         List of URIs of the created Event individuals
     """
+    df = data if isinstance(data, pl.DataFrame) else pl.DataFrame(list(data), infer_schema_length=None)
+    if df.height == 0:
+        return []
+    check_mandatory_columns(df, _MANDATORY_COLUMNS, "Event")
+
+    plan = plan or compile_event_plan(df.schema, extension_columns)
+    columns = _event_columns(df, plan, iri_strategy, source, row_offset)
+    plan.warn_dropped_times(df, columns)
+    literal_props = plan.props
+    registry = registry if registry is not None else NodeRegistry()
+    plan.declare(g, registry)
+
+    # Subject and code declarations, once per distinct node
+    for subject, subject_id in columns.select("subject", "subject_id").unique(maintain_order=True).iter_rows():
+        if registry.first_seen(subject):
+            subject_uri = URIRef(subject)
+            g.add((subject_uri, RDF.type, MEDS.Subject))
+            g.add((subject_uri, MEDS.subjectId, Literal(subject_id, datatype=XSD.string)))
+
+    for code, code_iri in columns.select("code", "code_iri").unique(maintain_order=True).iter_rows():
+        if registry.first_seen(code_iri):
+            code_uri = URIRef(code_iri)
+            g.add((code_uri, RDF.type, MEDS.Code))
+            g.add((code_uri, MEDS.codeString, Literal(code, datatype=XSD.string)))
+
     uris = []
-    for row in data:
-        event_uri = map_event(g, row, dataset_uri)
+    for event, subject, subject_id, code, code_iri, *values in columns.iter_rows():
+        event_uri = URIRef(event)
+        # hasSubject first: sinks routing triples per subject key the event on it
+        g.add((event_uri, MEDS.hasSubject, TERMS.uri(subject)))
+        g.add((event_uri, RDF.type, MEDS.Event))
+        g.add((event_uri, MEDS.codeString, TERMS.literal(code, XSD.string)))
+        g.add((event_uri, MEDS.hasCode, TERMS.uri(code_iri)))
+
+        # Link to dataset metadata if provided
+        if dataset_uri:
+            g.add((event_uri, PROV.wasDerivedFrom, dataset_uri))
+
+        add_literals(g, event_uri, literal_props, values)
+
         uris.append(event_uri)
     return uris
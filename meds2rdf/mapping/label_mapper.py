@@ -1,8 +1,11 @@
-import uuid
+import polars as pl
 from rdflib import Graph, URIRef, RDF, XSD
 from typing import Iterable, Optional
 from ..namespace import MEDS, MEDS_INSTANCES, PROV
-from ..utils.rdf_utils import *
+from ..utils.columnar import LexicalFormat, iri_expr, check_mandatory_columns
+from ..utils.iri import row_iris
+from ..utils.term_cache import TERMS
+from .plan import MappingPlan, add_literals
 
 _literals_dict = {
     "description": (MEDS.codeDescription, XSD.string),
@@ -13,7 +16,12 @@ _literals_dict = {
     "categorical_value": (MEDS.categoricalValue, XSD.string),
 }
 
-def map_label(g: Graph, row: dict, dataset_uri: Optional[URIRef] = None) -> URIRef:
+def map_label(
+    g: Graph,
+    row: dict,
+    dataset_uri: Optional[URIRef] = None,
+    iri_strategy: str = "uuid",
+) -> URIRef:
     """
     Map a single row of a MEDS LabelSchema into a LabelSample RDF individual.
 
@@ -25,53 +33,93 @@ def map_label(g: Graph, row: dict, dataset_uri: Optional[URIRef] = None) -> URIR
         Dictionary representing a single label
     dataset_uri : Optional[URIRef]
         URI of the dataset metadata to link via prov:wasDerivedFrom
+    iri_strategy : str
+        "uuid" or "hash", see ``map_label_table``
 
     Returns
     -------
     URIRef
         URI of the created LabelSample individual
     """
+    return map_label_table(g, [row], dataset_uri, iri_strategy=iri_strategy)[0]
 
-    # Create unique URI for the label_sample
-    label_sample_uri = URIRef(MEDS_INSTANCES[f"label_sample/{uuid.uuid4()}"])
-    g.add((label_sample_uri, RDF.type, MEDS.LabelSample))
 
-    subject_id = try_access_mandatory_field_value(row=row, field="subject_id", entity="Label")
-    g.add((label_sample_uri, MEDS.hasSubject, to_subject_node(subject_id)))
+def compile_label_plan(schema: pl.Schema | dict, lexical: Optional[LexicalFormat] = None) -> MappingPlan:
+    """Mapping plan of a label table with the given schema (see ``MappingPlan``)."""
+    return MappingPlan(schema, _literals_dict, lexical=lexical)
 
-    for column_name, (p, dtype) in _literals_dict.items():
-        if_column_is_present(column_name, row, lambda v: g.add((label_sample_uri, p, to_literal(v, dtype))))
 
-    if dataset_uri:
-        g.add((label_sample_uri, PROV.wasDerivedFrom, dataset_uri))
-
-    return label_sample_uri
+def _label_columns(
+    df: pl.DataFrame, plan: MappingPlan, iri_strategy: str, source: Optional[str], row_offset: int
+) -> pl.DataFrame:
+    label_iris = row_iris(
+        df, MEDS_INSTANCES["label_sample/"], ("subject_id", *_literals_dict), iri_strategy, source, row_offset
+    )
+    return pl.DataFrame({"label_sample": label_iris}).hstack(
+        df.select(
+            iri_expr(MEDS_INSTANCES["subject/"], "subject_id").alias("subject"),
+            *plan.lexical_exprs(),
+        )
+    )
 
 
 def map_label_table(
     g: Graph,
-    data: Iterable[dict],
+    data: pl.DataFrame | Iterable[dict],
     dataset_uri: Optional[URIRef] = None,
+    iri_strategy: str = "uuid",
+    source: Optional[str] = None,
+    row_offset: int = 0,
+    plan: Optional[MappingPlan] = None,
 ) -> list[URIRef]:
     """
-    Map an iterable of MEDS LabelSchema rows to RDF LabelSample individuals.
+    Map a batch of MEDS LabelSchema rows to RDF LabelSample individuals.
 
     Parameters
     ----------
     g : Graph
         RDF graph to populate
-    data : Iterable[dict]
-        List of rows/dicts representing the MEDS LabelSchema
+    data : pl.DataFrame | Iterable[dict]
+        DataFrame (or rows/dicts) following the MEDS LabelSchema
     dataset_uri : Optional[URIRef]
         URI of the dataset metadata to link via prov:wasDerivedFrom
+    iri_strategy : str
+        "uuid" for random sample IRIs, "hash" for IRIs derived from the label's
+        subject, prediction time and values plus its ``source`` and row index
+    source : Optional[str]
+        Name of the label file the rows come from, used to disambiguate hashed IRIs
+    row_offset : int
+        Index of the first row of ``data`` within ``source`` (for batched reads);
+        ignored when ``data`` carries the row index column of the scans
+    plan : Optional[MappingPlan]
+        Plan compiled with ``compile_label_plan`` from the schema of the label file;
+        compiled from ``data`` when None
 
     Returns
     -------
     list[URIRef]
         List of URIs of the created LabelSample individuals
     """
+    df = data if isinstance(data, pl.DataFrame) else pl.DataFrame(list(data), infer_schema_length=None)
+    if df.height == 0:
+        return []
+    check_mandatory_columns(df, ("subject_id",), "Label")
+
+    plan = plan or compile_label_plan(df.schema)
+    columns = _label_columns(df, plan, iri_strategy, source, row_offset)
+    plan.warn_dropped_times(df, columns)
+    literal_props = plan.props
+
     uris = []
-    for row in data:
-        label_sample_uri = map_label(g, row, dataset_uri)
+    for label_sample, subject, *values in columns.iter_rows():
+        label_sample_uri = URIRef(label_sample)
+        g.add((label_sample_uri, MEDS.hasSubject, TERMS.uri(subject)))
+        g.add((label_sample_uri, RDF.type, MEDS.LabelSample))
+
+        add_literals(g, label_sample_uri, literal_props, values)
+
+        if dataset_uri:
+            g.add((label_sample_uri, PROV.wasDerivedFrom, dataset_uri))
+
         uris.append(label_sample_uri)
     return uris
@@ -1,9 +1,9 @@
 from rdflib import Graph, URIRef, Namespace, Literal
 from rdflib.namespace import RDF, RDFS, XSD, DCTERMS as DCT, PROV, DCAT
-import uuid
 
 from ..namespace import MEDS, MEDS_INSTANCES
 from ..utils.rdf_utils import if_column_is_present, to_literal
+from ..utils.iri import record_iri
 
 # Mapping for simple literal properties (dataset-level)
 # NOTE: ETL fields are handled separately (as a prov:Activity)
@@ -25,7 +25,7 @@ _column_list_dict = {
 }
 
 
-def _add_distribution_for_dataset(g: Graph, dataset_uri: URIRef, shards: dict) -> URIRef | None:
+def _add_distribution_for_dataset(g: Graph, dataset_uri: URIRef, shards: dict, iri_strategy: str = "uuid") -> URIRef | None:
     """
     If location_uri is present in shards, create a dcat:Distribution node,
     attach dcat:downloadURL (and optional dcat:accessURL), and link it to the dataset.
@@ -37,7 +37,11 @@ def _add_distribution_for_dataset(g: Graph, dataset_uri: URIRef, shards: dict) -
     if not location:
         return None
 
-    dist_uri = URIRef(MEDS_INSTANCES[f"distribution/{uuid.uuid4()}"])
+    dist_uri = record_iri(
+        MEDS_INSTANCES["distribution/"],
+        {"dataset": dataset_uri, "location": location, "description": description},
+        iri_strategy,
+    )
     g.add((dist_uri, RDF.type, DCAT.Distribution))
     # downloadURL should be an IRI (URIRef)
     try:
@@ -57,7 +61,7 @@ def _add_distribution_for_dataset(g: Graph, dataset_uri: URIRef, shards: dict) -
     return dist_uri
 
 
-def _add_etl_activity_if_present(g: Graph, dataset_uri: URIRef, shards: dict) -> URIRef | None:
+def _add_etl_activity_if_present(g: Graph, dataset_uri: URIRef, shards: dict, iri_strategy: str = "uuid") -> URIRef | None:
     """
     If any ETL-related fields are present (etl_name, etl_version, etl_notes, protocol_notes),
     create a prov:Activity node and attach relevant literals using standard properties:
@@ -75,7 +79,11 @@ def _add_etl_activity_if_present(g: Graph, dataset_uri: URIRef, shards: dict) ->
     if not any((etl_name, etl_version, etl_notes, protocol_notes)):
         return None
 
-    activity_uri = URIRef(MEDS_INSTANCES[f"etl/{uuid.uuid4()}"])
+    activity_uri = record_iri(
+        MEDS_INSTANCES["etl/"],
+        {"dataset": dataset_uri, "etl_name": etl_name, "etl_version": etl_version},
+        iri_strategy,
+    )
     g.add((activity_uri, RDF.type, PROV.Activity))
     g.add((dataset_uri, PROV.wasGeneratedBy, activity_uri))
 
@@ -98,14 +106,16 @@ def _add_etl_activity_if_present(g: Graph, dataset_uri: URIRef, shards: dict) ->
 def _add_version_node(g: Graph, resource_uri: URIRef, version: str):
     return g.add((resource_uri, DCT.hasVersion, URIRef(f"{resource_uri}_{version}")))
 
-def _add_license_node(g: Graph, dataset_uri: URIRef, license_text: str):
-    license_uri = MEDS_INSTANCES[f"dataset_license/{uuid.uuid4()}"]
+def _add_license_node(g: Graph, dataset_uri: URIRef, license_text: str, iri_strategy: str = "uuid"):
+    license_uri = record_iri(
+        MEDS_INSTANCES["dataset_license/"], {"dataset": dataset_uri, "license": license_text}, iri_strategy
+    )
     g.add((license_uri, RDF.type, DCT.LicenseDocument))
     g.add((license_uri, RDFS.label, to_literal(license_text, XSD.string)))
     g.add((dataset_uri, DCT.license, license_uri))
     return g
 
-def map_dataset_metadata(g: Graph, shards: dict) -> URIRef:
+def map_dataset_metadata(g: Graph, shards: dict, iri_strategy: str = "uuid") -> URIRef:
     """
     Map a DatasetMetadataSchema JSON-like dict into an RDF individual of type MEDS:DatasetMetadata
     (and also typed as dcat:Dataset for catalog compatibility).
@@ -116,13 +126,15 @@ def map_dataset_metadata(g: Graph, shards: dict) -> URIRef:
         The RDF graph where triples will be added.
     shards : dict
         Dictionary following DatasetMetadataSchema (all fields optional).
+    iri_strategy : str
+        "uuid" for random IRIs, "hash" for IRIs derived from the metadata content.
 
     Returns
     -------
     URIRef
         The URI of the created DatasetMetadata individual.
     """
-    dataset_uri = URIRef(MEDS_INSTANCES[f"dataset_metadata/{uuid.uuid4()}"])
+    dataset_uri = record_iri(MEDS_INSTANCES["dataset_metadata/"], shards, iri_strategy)
     # Type as MEDS DatasetMetadata and DCAT Dataset (for interoperability)
     g.add((dataset_uri, RDF.type, MEDS.DatasetMetadata))
 
@@ -135,12 +147,12 @@ def map_dataset_metadata(g: Graph, shards: dict) -> URIRef:
         if_column_is_present(field, shards, lambda v: g.add((dataset_uri, prop, to_literal(v, dtype))))
 
     if_column_is_present("dataset_version", shards, lambda v: _add_version_node(g, dataset_uri, version=v))
-    if_column_is_present("license", shards, lambda v: _add_license_node(g, dataset_uri, license_text=v))
+    if_column_is_present("license", shards, lambda v: _add_license_node(g, dataset_uri, license_text=v, iri_strategy=iri_strategy))
 
     # Distribution (location_uri + optional description_uri)
-    _add_distribution_for_dataset(g, dataset_uri, shards)
+    _add_distribution_for_dataset(g, dataset_uri, shards, iri_strategy)
 
     # ETL provenance recorded as a prov:Activity (if any ETL info provided)
-    _add_etl_activity_if_present(g, dataset_uri, shards)
+    _add_etl_activity_if_present(g, dataset_uri, shards, iri_strategy)
 
     return dataset_uri
@@ -0,0 +1,140 @@
+"""Mapping plans compiled once per table schema instead of per row."""
+
+import warnings
+from typing import Iterable, NamedTuple, Optional
+from urllib.parse import quote
+
+import polars as pl
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF, RDFS, XSD
+
+from ..namespace import MEDS_INSTANCES
+from ..utils.columnar import LexicalFormat, lexical_expr, xsd_datatype
+from ..utils.node_registry import NodeRegistry
+from ..utils.term_cache import TERMS
+
+# dataset.json fields naming the extra columns of the data tables
+EXTENSION_COLUMN_FIELDS = (
+    "code_modifier_columns",
+    "additional_value_modality_columns",
+    "other_extension_columns",
+)
+
+# literals of these datatypes take few distinct values (categories, flags) and are interned
+_INTERNED_DATATYPES = (XSD.string, XSD.boolean)
+
+
+def extension_columns(metadata: dict) -> tuple[str, ...]:
+    """Extra data columns declared in a DatasetMetadataSchema dict, in declaration order."""
+    columns = []
+    for field in EXTENSION_COLUMN_FIELDS:
+        for column in metadata.get(field) or ():
+            if column not in columns:
+                columns.append(column)
+    return tuple(columns)
+
+
+def column_property(column: str) -> URIRef:
+    """Predicate linking a row to the value of the extension column ``column``."""
+    return URIRef(MEDS_INSTANCES[f"column/{quote(column)}"])
+
+
+class ColumnRule(NamedTuple):
+    column: str
+    predicate: URIRef
+    datatype: URIRef
+    is_list: bool
+
+
+class MappingPlan:
+    """
+    Literal columns of a table, resolved once against its schema: the columns that
+    are actually present, their predicate and datatype, and whether they hold lists
+    (one literal per element). Extension columns declared in ``dataset.json`` get a
+    ``column_property`` predicate and a datatype derived from their Polars type.
+
+    Parameters
+    ----------
+    schema : pl.Schema | dict
+        Column names to Polars dtypes, e.g. ``LazyFrame.collect_schema()``
+    literals : dict
+        Known columns, ``{column: (predicate, datatype)}``
+    extension_columns : Iterable[str]
+        Additional columns to map when present
+    reserved : Iterable[str]
+        Columns mapped elsewhere (identifiers, codes), never treated as extensions
+    lexical : Optional[LexicalFormat]
+        Time zone and precision of the xsd:dateTime and xsd:double lexical forms
+    """
+
+    def __init__(
+        self,
+        schema: pl.Schema | dict,
+        literals: dict,
+        extension_columns: Iterable[str] = (),
+        reserved: Iterable[str] = (),
+        lexical: Optional[LexicalFormat] = None,
+    ):
+        self.schema = dict(schema)
+        self.lexical = lexical or LexicalFormat()
+        rules = [
+            ColumnRule(column, predicate, datatype, isinstance(self.schema[column], pl.List))
+            for column, (predicate, datatype) in literals.items()
+            if column in self.schema
+        ]
+        skip = {*literals, *reserved}
+        for column in extension_columns:
+            if column in self.schema and column not in skip:
+                dtype = self.schema[column]
+                rules.append(ColumnRule(column, column_property(column), xsd_datatype(dtype), isinstance(dtype, pl.List)))
+                skip.add(column)
+        self.rules = rules
+        self.columns = [rule.column for rule in rules]
+        # what the per-row loop zips with the values
+        self.props = [
+            (rule.predicate, rule.datatype, rule.is_list, rule.datatype in _INTERNED_DATATYPES) for rule in rules
+        ]
+        self.extensions = [rule for rule in rules if rule.column not in literals]
+
+    def lexical_exprs(self) -> list[pl.Expr]:
+        """Lexical forms of every planned column, in plan order."""
+        return [lexical_expr(rule.column, self.schema[rule.column], rule.datatype, self.lexical) for rule in self.rules]
+
+    def warn_dropped_times(self, df: pl.DataFrame, lexical: pl.DataFrame):
+        """
+        Warn with the number of naive times of ``df`` that have no lexical form in
+        ``lexical`` because they fall in a DST gap of ``LexicalFormat.time_zone``.
+        """
+        if self.lexical.time_zone is None or self.lexical.non_existent != "null":
+            return
+        for rule in self.rules:
+            dtype = self.schema[rule.column]
+            if rule.datatype != XSD.dateTime or not isinstance(dtype, pl.Datetime) or dtype.time_zone is not None:
+                continue
+            dropped = (df[rule.column].is_not_null() & lexical[rule.column].is_null()).sum()
+            if dropped:
+                warnings.warn(
+                    f"{dropped} '{rule.column}' values do not exist in time zone {self.lexical.time_zone} "
+                    "(skipped by a DST transition) and were left out",
+                    stacklevel=3,
+                )
+
+    def declare(self, g: Graph, registry: Optional[NodeRegistry] = None):
+        """Emit the declarations of the extension column predicates not yet declared."""
+        for rule in self.extensions:
+            if registry is None or registry.first_seen(str(rule.predicate)):
+                g.add((rule.predicate, RDF.type, RDF.Property))
+                g.add((rule.predicate, RDFS.label, Literal(rule.column, datatype=XSD.string)))
+
+
+def add_literals(g: Graph, node: URIRef, props: list, values) -> None:
+    """Add the literals of one row, ``values`` being in ``MappingPlan.props`` order."""
+    for (p, dtype, is_list, interned), value in zip(props, values):
+        if value is None:
+            continue
+        if is_list:
+            for v in value:
+                if v is not None:
+                    g.add((node, p, TERMS.literal(v, dtype) if interned else Literal(v, datatype=dtype)))
+        else:
+            g.add((node, p, TERMS.literal(value, dtype) if interned else Literal(value, datatype=dtype)))
@@ -0,0 +1,120 @@
+"""Process-pool conversion of MEDS data shards."""
+
+import multiprocessing
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+from rdflib import URIRef
+
+from .mapping.event_mapper import map_data_table, compile_event_plan
+from .sinks import NTriplesSink
+from .scan import Selection, iter_batches
+from .utils.columnar import LexicalFormat
+from .utils.node_registry import NodeRegistry
+
+# bytes of worker output handed to the merging sink at once
+MERGE_CHUNK_SIZE = 1 << 24
+
+
+def list_data_shards(meds_root: Path) -> list[Path]:
+    """Parquet shards under ``data/``, in a stable (sorted) order."""
+    return sorted((meds_root / "data").rglob("*.parquet"))
+
+
+def map_data_shard(
+    path: str,
+    source: str,
+    destination: str,
+    dataset_uri: Optional[str] = None,
+    iri_strategy: str = "uuid",
+    selection: Optional[Selection] = None,
+    batch_size: Optional[int] = None,
+    extension_columns: tuple = (),
+    lexical: Optional[LexicalFormat] = None,
+) -> tuple[str, int, float]:
+    """
+    Map a single data shard to an N-Triples file at ``destination``, one batch at
+    a time, and return its path together with the number of rows read and the
+    time spent.
+
+    Runs inside a worker process, hence the plain-string arguments.
+    """
+    start = time.perf_counter()
+    selection = selection or Selection()
+    sink = NTriplesSink(destination)
+    registry = NodeRegistry()
+    lf = selection.scan("data", Path(path))
+    plan = compile_event_plan(lf.collect_schema(), extension_columns, lexical)
+    rows = 0
+    for batch in iter_batches(lf, batch_size):
+        map_data_table(
+            sink,
+            batch,
+            URIRef(dataset_uri) if dataset_uri else None,
+            iri_strategy=iri_strategy,
+            source=source,
+            row_offset=rows,
+            registry=registry,
+            plan=plan,
+        )
+        rows += batch.height
+    sink.close()
+    return destination, rows, time.perf_counter() - start
+
+
+def read_part(path: str | Path, chunk_size: int = MERGE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Contents of the N-Triples file ``path`` in chunks of about ``chunk_size`` bytes, cut at line ends."""
+    with open(path, "rb") as f:
+        while lines := f.readlines(chunk_size):
+            yield b"".join(lines)
+
+
+def map_data_shards_parallel(
+    shards: list[Path],
+    workers: int,
+    meds_root: Path,
+    dataset_uri: Optional[URIRef] = None,
+    iri_strategy: str = "uuid",
+    selection: Optional[Selection] = None,
+    batch_size: Optional[int] = None,
+    extension_columns: tuple = (),
+    lexical: Optional[LexicalFormat] = None,
+) -> Iterator[tuple[str, int, float]]:
+    """
+    Map ``shards`` on a pool of ``workers`` processes.
+
+    Each worker writes its shard to a temporary N-Triples file, so that neither
+    the workers nor the parent hold a whole shard's triples in memory. The
+    ``(path, rows, seconds)`` results of ``map_data_shard`` are yielded in shard
+    order, regardless of completion order, so the merged output is deterministic;
+    read them with ``read_part``. A file is deleted as soon as the next result is
+    requested, and at most ``2 * workers`` shards are in flight at any time.
+    """
+    dataset = str(dataset_uri) if dataset_uri else None
+    # Polars' thread pool is not fork-safe, so workers are always spawned
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="meds2rdf-") as tmp, \
+            ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending = deque()
+
+        def merged():
+            path, rows, seconds = pending.popleft().result()
+            yield path, rows, seconds
+            os.unlink(path)
+
+        for index, shard in enumerate(shards):
+            source = shard.relative_to(meds_root).as_posix()
+            destination = os.path.join(tmp, f"{index}.nt")
+            pending.append(pool.submit(
+                map_data_shard, str(shard), source, destination, dataset, iri_strategy, selection, batch_size,
+                extension_columns, lexical,
+            ))
+            if len(pending) >= 2 * workers:
+                yield from merged()
+        while pending:
+            yield from merged()
@@ -0,0 +1,125 @@
+"""
+Bounded-queue stages that overlap Parquet decoding, mapping and output writing.
+
+Polars decoding and zlib compression release the GIL, so running them on their own
+threads lets them proceed while the mapper (pure Python) runs. Queues are bounded,
+so a slow stage blocks the faster one instead of letting memory grow.
+"""
+
+import queue
+import threading
+from typing import IO, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Block until ``item`` is queued or ``stop`` is set; False if stopped."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def read_ahead(items: Iterator[T], depth: int = 0) -> Iterator[T]:
+    """
+    Pull ``items`` (e.g. Parquet batches) on a background thread, at most ``depth``
+    items ahead of the consumer. ``depth=0`` iterates inline. Errors raised by the
+    producer are re-raised in the consumer; abandoning the iterator stops the producer.
+    """
+    if depth <= 0:
+        yield from items
+        return
+
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in items:
+                if not _put(q, item, stop):
+                    return
+            _put(q, _DONE, stop)
+        except BaseException as error:
+            _put(q, _Failure(error), stop)
+
+    thread = threading.Thread(target=produce, name="meds2rdf-reader", daemon=True)
+    thread.start()
+    try:
+        while (item := q.get()) is not _DONE:
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class BackgroundWriter:
+    """
+    Write-only binary stream handing chunks to a thread that writes (and, for
+    compressed streams, compresses) them into ``stream``. At most ``depth`` chunks
+    wait in the queue. Closing it closes ``stream``.
+    """
+
+    def __init__(self, stream: IO[bytes], depth: int = 4):
+        self._stream = stream
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="meds2rdf-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is _DONE:
+                    return
+                if self._error is None:
+                    self._stream.write(chunk)
+            except BaseException as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise(self):
+        if self._error is not None:
+            raise self._error
+
+    def write(self, data: bytes) -> int:
+        self._raise()
+        self._queue.put(data)
+        return len(data)
+
+    def flush(self):
+        """Wait until every queued chunk has been written."""
+        self._queue.join()
+        self._raise()
+        self._stream.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_DONE)
+        self._thread.join()
+        self._stream.close()
+        self._raise()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,265 @@
+"""Lazy Parquet scans restricted to a subset of subjects, times and codes."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import polars as pl
+
+from .utils.columnar import parse_iso_datetime, parse_iso_datetime_utc
+from .utils.iri import ROW_INDEX
+from .validation import invalid_rows
+
+_MANDATORY_DATA_COLUMNS = ("subject_id", "code")
+_UINT64 = 1 << 64
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+class Selection:
+    """
+    Subset of a MEDS dataset to convert.
+
+    Event filters are pushed down into ``pl.scan_parquet`` so that row groups whose
+    statistics cannot match are skipped. The events and labels to map carry their
+    row index in the file (``ROW_INDEX``), counted before any filter, so that hashed
+    IRIs do not depend on the selection. Once ``resolve`` has been called with the
+    data shards, codes are restricted to the ones the selected events use, and
+    splits and labels to the selected subjects.
+
+    Parameters
+    ----------
+    subject_ids : Optional[Iterable]
+        Only convert events of these subjects
+    time_range : Optional[tuple]
+        ``(start, end)`` half-open interval on ``time``; either bound may be None.
+        Static events (null ``time``) are always kept.
+    code_prefixes : Optional[Iterable[str]]
+        Only convert events whose code starts with one of these prefixes
+    columns : Optional[Iterable[str]]
+        Data columns to read besides ``subject_id`` and ``code``
+    tasks : Optional[Iterable[str]]
+        Only convert the labels of these prediction tasks (subdirectories, or file
+        stems, directly under ``labels/``)
+    drop_invalid : bool
+        Skip the rows the mappers would reject (see ``meds2rdf.validation``)
+    sample_fraction : Optional[float]
+        Only convert about this fraction of the subjects (0 < fraction <= 1),
+        picked by a hash of ``subject_id`` so that events, splits and labels
+        agree (see ``subject_sample``)
+    sample_seed : int
+        Seed of the subject hash; the same seed always picks the same subjects
+    """
+
+    def __init__(
+        self,
+        subject_ids: Optional[Iterable] = None,
+        time_range: Optional[tuple] = None,
+        code_prefixes: Optional[Iterable[str]] = None,
+        columns: Optional[Iterable[str]] = None,
+        tasks: Optional[Iterable[str]] = None,
+        drop_invalid: bool = False,
+        sample_fraction: Optional[float] = None,
+        sample_seed: int = 0,
+    ):
+        self.subject_ids = list(subject_ids) if subject_ids is not None else None
+        self.time_range = tuple(time_range) if time_range is not None else None
+        self.code_prefixes = list(code_prefixes) if code_prefixes is not None else None
+        self.columns = list(columns) if columns is not None else None
+        self.tasks = list(tasks) if tasks is not None else None
+        self.drop_invalid = drop_invalid
+        if sample_fraction is not None and not 0 < sample_fraction <= 1:
+            raise ValueError(f"sample_fraction must be in (0, 1], got {sample_fraction}")
+        self.sample_fraction = sample_fraction
+        self.sample_seed = sample_seed
+        self.subjects: Optional[pl.Series] = None
+        self.codes: Optional[pl.Series] = None
+
+    @property
+    def filters_events(self) -> bool:
+        return any(
+            f is not None for f in (self.subject_ids, self.time_range, self.code_prefixes, self.sample_fraction)
+        )
+
+    def to_options(self) -> dict:
+        """JSON-friendly description, used to tell apart conversions in a manifest."""
+        return {
+            "subject_ids": self.subject_ids,
+            "time_range": [str(t) if t is not None else None for t in self.time_range] if self.time_range else None,
+            "code_prefixes": self.code_prefixes,
+            "columns": self.columns,
+            "tasks": self.tasks,
+            "sample_fraction": self.sample_fraction,
+            "sample_seed": self.sample_seed,
+        }
+
+    def scan(self, stage: str, path: Path) -> pl.LazyFrame:
+        """Rows of an input of ``stage`` to map: selected, and valid if ``drop_invalid``."""
+        if stage == "data":
+            lf = self.scan_events(path, row_index=True)
+        elif stage == "codes":
+            lf = self.scan_codes(path)
+        elif stage in ("splits", "labels"):
+            lf = self.scan_subject_table(path, row_index=stage == "labels")
+        else:
+            raise ValueError(f"Unknown conversion stage: '{stage}'")
+        if self.drop_invalid:
+            lf = lf.filter(~invalid_rows(stage, lf.collect_schema()))
+        return lf
+
+    def event_predicate(self, schema: Optional[pl.Schema] = None) -> Optional[pl.Expr]:
+        """
+        Filter of the selected events of a data table with the given ``schema``,
+        None when every event is selected. The ``time_range`` bounds are compared
+        in the time zone of a tz-aware ``time`` column (naive bounds are taken to
+        be in it), and string times are parsed as ISO 8601 first (in UTC when
+        they carry an offset).
+        """
+        predicates = []
+        if self.subject_ids is not None:
+            predicates.append(pl.col("subject_id").is_in(self.subject_ids))
+        if self.time_range is not None:
+            dtype = (schema or {}).get("time", pl.Datetime("us"))
+            time = pl.col("time")
+            if dtype == pl.String:
+                # strings with an offset are compared in UTC
+                time = pl.coalesce(parse_iso_datetime(time), parse_iso_datetime_utc(time).dt.replace_time_zone(None))
+            time_zone = dtype.time_zone if isinstance(dtype, pl.Datetime) else None
+            start, end = self.time_range
+            in_range = pl.lit(True)
+            if start is not None:
+                in_range = in_range & (time >= _time_bound(start, time_zone))
+            if end is not None:
+                in_range = in_range & (time < _time_bound(end, time_zone))
+            predicates.append(pl.col("time").is_null() | in_range)
+        if self.code_prefixes is not None:
+            predicates.append(pl.any_horizontal([pl.col("code").str.starts_with(p) for p in self.code_prefixes]))
+        if self.sample_fraction is not None:
+            predicates.append(subject_sample(self.sample_fraction, self.sample_seed))
+        return pl.all_horizontal(predicates) if predicates else None
+
+    def scan_events(self, paths: Path | list[Path], row_index: bool = False) -> pl.LazyFrame:
+        lf = _scan_parquet(paths, row_index)
+        # filter first: the predicate may use columns the projection leaves out
+        if (predicate := self.event_predicate(lf.collect_schema())) is not None:
+            lf = lf.filter(predicate)
+        if self.columns is not None:
+            available = lf.collect_schema().names()
+            wanted = [*_MANDATORY_DATA_COLUMNS, *(c for c in self.columns if c not in _MANDATORY_DATA_COLUMNS)]
+            if row_index:
+                wanted.insert(0, ROW_INDEX)
+            lf = lf.select([c for c in wanted if c in available])
+        return lf
+
+    def resolve(self, shards: list[Path]):
+        """Collect the subjects and codes referenced by the selected events."""
+        if not self.filters_events or not shards:
+            return
+        refs = self.scan_events(shards)
+        subjects, codes = pl.collect_all([
+            refs.select(pl.col("subject_id").unique()),
+            refs.select(pl.col("code").unique()),
+        ])
+        self.subjects = subjects.to_series()
+        self.codes = codes.to_series()
+
+    def scan_codes(self, path: Path) -> pl.LazyFrame:
+        lf = pl.scan_parquet(str(path))
+        if self.codes is not None:
+            lf = lf.filter(pl.col("code").is_in(self.codes.implode()))
+        return lf
+
+    def label_files(self, meds_root: Path) -> list[Path]:
+        """Label files of the selected tasks, in a stable (sorted) order."""
+        files = sorted((meds_root / "labels").rglob("*.parquet"))
+        if self.tasks is None:
+            return files
+        return [f for f in files if label_task(f.relative_to(meds_root).as_posix()) in self.tasks]
+
+    def scan_subject_table(self, path: Path, row_index: bool = False) -> pl.LazyFrame:
+        """Splits and labels: rows of the selected subjects only."""
+        lf = _scan_parquet(path, row_index)
+        if self.sample_fraction is not None:
+            # also applies without data shards to resolve the subjects from
+            lf = lf.filter(subject_sample(self.sample_fraction, self.sample_seed))
+        if self.subjects is not None:
+            lf = lf.filter(pl.col("subject_id").is_in(self.subjects.implode()))
+        return lf
+
+
+def iter_batches(lf: pl.LazyFrame, batch_size: Optional[int] = None) -> Iterator[pl.DataFrame]:
+    """
+    Evaluate ``lf`` whole, or as a stream of DataFrames of about ``batch_size`` rows
+    so that only one batch is held in memory at a time.
+    """
+    if batch_size is None:
+        yield lf.collect()
+    else:
+        yield from lf.collect_batches(chunk_size=batch_size, lazy=True)
+
+
+def splitmix64(expr: pl.Expr, seed: int = 0) -> pl.Expr:
+    """
+    SplitMix64 finalizer of an integer expression, as UInt64: uniformly spread,
+    and unlike ``Expr.hash`` stable across Polars versions and platforms.
+    """
+    def u64(value: int) -> pl.Expr:
+        return pl.lit(value % _UINT64, dtype=pl.UInt64)
+
+    # UInt64 arithmetic wraps around, as in the reference implementation
+    x = expr.cast(pl.Int64).reinterpret(signed=False) + u64((seed + 1) * _GOLDEN_GAMMA)
+    x = (x ^ (x // u64(1 << 30))) * u64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x // u64(1 << 27))) * u64(0x94D049BB133111EB)
+    return x ^ (x // u64(1 << 31))
+
+
+def subject_hash(seed: int = 0) -> pl.Expr:
+    """``splitmix64`` of ``subject_id``."""
+    return splitmix64(pl.col("subject_id"), seed)
+
+
+def subject_sample(fraction: float, seed: int = 0) -> pl.Expr:
+    """
+    True for about ``fraction`` of the subjects, always the same ones for a given
+    ``seed`` whatever the table, so it can be pushed into every scan independently.
+    """
+    if fraction >= 1:
+        return pl.lit(True)
+    return subject_hash(seed) < pl.lit(int(fraction * _UINT64), dtype=pl.UInt64)
+
+
+def label_task(source: str) -> Optional[str]:
+    """
+    Prediction task of a label file given by its path relative to the MEDS root
+    (``labels/<task>/...`` or ``labels/<task>.parquet``), None for other inputs.
+    """
+    parts = source.split("/")
+    if len(parts) < 2 or parts[0] != "labels":
+        return None
+    return parts[1].removesuffix(".parquet")
+
+
+def _as_sources(paths: Path | list[Path]):
+    return [str(p) for p in paths] if isinstance(paths, list) else str(paths)
+
+
+def _scan_parquet(paths: Path | list[Path], row_index: bool = False) -> pl.LazyFrame:
+    # the row index is numbered by the scan itself, before any filter is applied
+    return pl.scan_parquet(_as_sources(paths), row_index_name=ROW_INDEX if row_index else None)
+
+
+def _as_datetime(value) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _time_bound(value, time_zone: Optional[str]) -> pl.Expr:
+    """
+    ``time_range`` bound comparable with a ``time`` column in ``time_zone`` (None
+    for naive columns): aware bounds are converted to it (to UTC for naive
+    columns), naive ones localized to it.
+    """
+    value = _as_datetime(value)
+    if value.tzinfo is not None:
+        utc = pl.lit(value.astimezone(timezone.utc).replace(tzinfo=None)).dt.replace_time_zone("UTC")
+        return utc.dt.convert_time_zone(time_zone) if time_zone else utc.dt.replace_time_zone(None)
+    bound = pl.lit(value)
+    return bound.dt.replace_time_zone(time_zone, ambiguous="earliest") if time_zone else bound
@@ -0,0 +1,24 @@
+from .base import TripleSink, NullSink
+from .ntriples import NTriplesSink, NQuadsSink, open_sink
+from .turtle import TurtleSink
+from .graph import GraphSink, open_graph
+from .partitioned import PartitionedSink
+from .routing import SubjectGraphRouter, SHARED_GRAPH
+from .oxigraph import OxigraphSink
+from .triple_table import TripleTableSink
+
+__all__ = [
+    "TripleSink",
+    "NullSink",
+    "NTriplesSink",
+    "NQuadsSink",
+    "open_sink",
+    "TurtleSink",
+    "GraphSink",
+    "open_graph",
+    "PartitionedSink",
+    "SubjectGraphRouter",
+    "SHARED_GRAPH",
+    "OxigraphSink",
+    "TripleTableSink",
+]
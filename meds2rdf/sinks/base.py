@@ -0,0 +1,65 @@
+import io
+from typing import Tuple
+from rdflib import Graph
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
+from rdflib.term import Node
+
+
+class _Forward:
+    """N-Triples parser sink handing every parsed triple, in file order, to ``add``."""
+
+    def __init__(self, add):
+        self.add = add
+
+    def triple(self, s, p, o):
+        self.add((s, p, o))
+
+
+class TripleSink:
+    """
+    Write-only target for mapped triples.
+
+    Mappers only ever call ``add((s, p, o))`` on the object they are given, so any
+    sink implementing this method can be used in place of an ``rdflib.Graph``.
+    Unlike a Graph, a sink does not deduplicate nor keep triples in memory.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> "TripleSink":
+        raise NotImplementedError
+
+    def add_serialized(self, data: bytes, format: str = "nt"):
+        """
+        Add triples that were already serialized elsewhere (e.g. by a worker process).
+        N-Triples are streamed in file order, other formats go through a Graph.
+        """
+        if format == "nt":
+            W3CNTriplesParser(sink=_Forward(self.add)).parse(io.BytesIO(data))
+            return
+        for triple in Graph().parse(data=data, format=format):
+            self.add(triple)
+
+    def begin(self, source: str):
+        """Called by the converter before the triples of input ``source`` are added."""
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class NullSink(TripleSink):
+    """Counts and discards triples; used to time mapping without any output cost."""
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> "NullSink":
+        self.count += 1
+        return self
@@ -0,0 +1,162 @@
+"""
+Compressed output streams.
+
+"gzip" with one thread is a plain gzip stream. Otherwise the output is cut into
+blocks compressed independently on a shared thread pool (zlib and zstd release
+the GIL, so this overlaps triple generation), written in order:
+
+- "gzip": one gzip member per block, readable by any gzip tool
+- "bgzip": BGZF blocks (at most 64 KiB each) as written by htslib's ``bgzip``,
+  which can be indexed and read from any block
+- "zstd": one zstd frame per block (requires ``zstandard``)
+
+Since every block decompresses on its own, block-compressed outputs can be split
+at block boundaries and decompressed in parallel.
+"""
+
+import gzip
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import IO, Callable, Optional
+
+COMPRESSIONS = (None, "gzip", "bgzip", "zstd")
+SUFFIXES = {None: "", "gzip": ".gz", "bgzip": ".gz", "zstd": ".zst"}
+DEFAULT_BLOCK_SIZE = 1 << 22
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+# BGZF: gzip members with a "BC" extra field holding the block size
+_BGZF_BLOCK_SIZE = 0xFF00
+_BGZF_MAX_SIZE = 1 << 16
+_BGZF_HEADER = struct.Struct("<4BI2BH2BHH")
+_BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd compression requires zstandard: pip install 'meds2rdf[zstd]'") from e
+    return zstandard
+
+
+@lru_cache(maxsize=None)
+def _executor(threads: int) -> ThreadPoolExecutor:
+    """Pool shared by all the outputs compressed with ``threads`` threads (e.g. every part)."""
+    return ThreadPoolExecutor(threads, thread_name_prefix="meds2rdf-compress")
+
+
+def _gzip_member(block: bytes) -> bytes:
+    return gzip.compress(block, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+def _bgzf_block(block: bytes) -> bytes:
+    for level in (_GZIP_LEVEL, 0):
+        deflate = zlib.compressobj(level, zlib.DEFLATED, -15)
+        data = deflate.compress(block) + deflate.flush()
+        size = _BGZF_HEADER.size + len(data) + 8
+        if size <= _BGZF_MAX_SIZE:
+            break
+    header = _BGZF_HEADER.pack(0x1F, 0x8B, 8, 4, 0, 0, 0xFF, 6, ord("B"), ord("C"), 2, size - 1)
+    return header + data + struct.pack("<II", zlib.crc32(block), len(block))
+
+
+def _zstd_frame(zstandard, block: bytes) -> bytes:
+    # compressors are not thread-safe, and cheap next to a multi-megabyte block
+    return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(block)
+
+
+class BlockCompressor:
+    """
+    Write-only binary stream cutting its input into ``block_size`` blocks that are
+    compressed with ``compress`` on ``threads`` threads (inline with one) and
+    written to ``stream`` in order, followed by ``trailer`` on close. At most two
+    blocks per thread are in flight. Closing it closes ``stream``.
+    """
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        compress: Callable[[bytes], bytes],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        threads: int = 1,
+        trailer: bytes = b"",
+    ):
+        self._stream = stream
+        self._compress = compress
+        self.block_size = block_size
+        self._trailer = trailer
+        self._executor = _executor(threads) if threads > 1 else None
+        self._in_flight: deque = deque()
+        self._max_in_flight = 2 * threads
+        self._pending = bytearray()
+        self._closed = False
+
+    def write(self, data: bytes) -> int:
+        self._pending += data
+        if len(self._pending) >= self.block_size:
+            view = memoryview(self._pending)
+            end = len(self._pending) - len(self._pending) % self.block_size
+            for start in range(0, end, self.block_size):
+                self._submit(bytes(view[start:start + self.block_size]))
+            view.release()
+            del self._pending[:end]
+        return len(data)
+
+    def _submit(self, block: bytes):
+        if self._executor is None:
+            self._stream.write(self._compress(block))
+            return
+        self._in_flight.append(self._executor.submit(self._compress, block))
+        while len(self._in_flight) > self._max_in_flight:
+            self._stream.write(self._in_flight.popleft().result())
+
+    def _drain(self):
+        while self._in_flight:
+            self._stream.write(self._in_flight.popleft().result())
+
+    def flush(self):
+        """Write every compressed block; the last, partial one waits for more input."""
+        self._drain()
+        self._stream.flush()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._pending:
+            self._submit(bytes(self._pending))
+            self._pending.clear()
+        self._drain()
+        self._stream.write(self._trailer)
+        self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_output(path: str | Path, compression: Optional[str] = None, threads: int = 1) -> IO[bytes]:
+    """
+    Binary output stream for ``path``, compressed with ``compression`` if set, on
+    ``threads`` threads.
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: '{compression}'")
+    if compression is None:
+        return open(path, "wb")
+    if compression == "gzip" and threads <= 1:
+        return gzip.open(path, "wb", compresslevel=_GZIP_LEVEL)
+    if compression == "zstd":
+        compress, block_size, trailer = partial(_zstd_frame, _import_zstandard()), DEFAULT_BLOCK_SIZE, b""
+    elif compression == "bgzip":
+        compress, block_size, trailer = _bgzf_block, _BGZF_BLOCK_SIZE, _BGZF_EOF
+    else:
+        compress, block_size, trailer = _gzip_member, DEFAULT_BLOCK_SIZE, b""
+    return BlockCompressor(open(path, "wb"), compress, block_size, threads, trailer)
@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from rdflib import Dataset, Graph, URIRef
+from rdflib.store import Store
+from rdflib.term import Node
+
+from .base import TripleSink
+
+DEFAULT_COMMIT_SIZE = 100_000
+
+
+def open_graph(store: str | Store = "default", path: Optional[str | Path] = None, dataset: bool = False) -> Graph:
+    """
+    Create a Graph (a ``Dataset`` of named graphs if ``dataset``) backed by ``store``
+    (an rdflib store plugin name or instance). Persistent stores, e.g. "Oxigraph"
+    (``oxrdflib``) or "BerkeleyDB" (``berkeleydb``), are opened, and created if
+    needed, at ``path``.
+    """
+    graph = Dataset(store=store) if dataset else Graph(store=store)
+    if path is not None:
+        graph.open(str(path), create=not Path(path).exists())
+    return graph
+
+
+class GraphSink(TripleSink):
+    """
+    Buffers triples and writes them into ``graph`` with one ``addN`` call per
+    ``commit_size`` triples, committing after each write on transactional stores.
+    Disk-backed stores get bulk inserts instead of one index update per triple.
+
+    With a ``router`` (e.g. ``SubjectGraphRouter``), ``graph`` must be a ``Dataset``
+    and every triple goes to the named graph the router picks for it.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        commit_size: int = DEFAULT_COMMIT_SIZE,
+        router: Optional[Callable[[Tuple[Node, Node, Node]], Optional[URIRef]]] = None,
+    ):
+        super().__init__()
+        if router is not None and not isinstance(graph, Dataset):
+            raise ValueError("Routing triples to named graphs requires a Dataset")
+        self.graph = graph
+        self.commit_size = commit_size
+        self.router = router
+        self.commits = 0
+        self._buffer: list = []
+        self._contexts: dict = {}
+
+    def _context(self, triple: Tuple[Node, Node, Node]) -> Graph:
+        if self.router is None:
+            return self.graph
+        name = self.router(triple)
+        if (context := self._contexts.get(name)) is None:
+            context = self._contexts[name] = self.graph.graph(name) if name is not None else self.graph.default_graph
+        return context
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> "GraphSink":
+        self._buffer.append((*triple, self._context(triple)))
+        self.count += 1
+        if len(self._buffer) >= self.commit_size:
+            self.flush()
+        return self
+
+    def add_serialized(self, data: bytes, format: str = "nt"):
+        if format != "nt" or self.router is not None:
+            return super().add_serialized(data, format)
+        self.flush()
+        self.graph.parse(data=data, format="nt")
+        self.count += data.count(b"\n")
+        self._commit()
+
+    def flush(self):
+        if self._buffer:
+            self.graph.addN(self._buffer)
+            self._buffer = []
+            self._commit()
+
+    def _commit(self):
+        if self.graph.store.transaction_aware:
+            self.graph.commit()
+        self.commits += 1
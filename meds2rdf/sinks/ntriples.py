@@ -0,0 +1,160 @@
+from pathlib import Path
+from typing import IO, Callable, Optional, Tuple
+from rdflib.term import Node, URIRef
+from rdflib.plugins.serializers.nt import _nt_row
+from rdflib.plugins.serializers.nquads import _nq_row
+
+from .base import TripleSink
+from .compression import open_output
+from ..pipeline import BackgroundWriter
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+class NTriplesSink(TripleSink):
+    """
+    Stream triples to an N-Triples file as they are produced.
+
+    Parameters
+    ----------
+    destination : str | Path | IO[bytes]
+        Output path or an already opened binary stream
+    buffer_size : int
+        Number of bytes buffered before a write is issued
+    compression : Optional[str]
+        "gzip", "bgzip" or "zstd" to compress the file opened at ``destination``
+        (see ``meds2rdf.sinks.compression``)
+    compression_threads : int
+        Threads compressing blocks of the output alongside the conversion
+    queue_size : int
+        If > 0, encoded chunks are written (and compressed) by a background thread,
+        with at most ``queue_size`` chunks waiting; 0 writes inline
+    """
+
+    def __init__(
+        self,
+        destination: str | Path | IO[bytes],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compression: Optional[str] = None,
+        queue_size: int = 0,
+        compression_threads: int = 1,
+    ):
+        super().__init__()
+        if isinstance(destination, (str, Path)):
+            self._stream = open_output(destination, compression, compression_threads)
+            if queue_size > 0:
+                self._stream = BackgroundWriter(self._stream, queue_size)
+            self._owns_stream = True
+        else:
+            self._stream = destination
+            self._owns_stream = False
+        self.buffer_size = buffer_size
+        self.bytes_written = 0
+        self._buffer: list[str] = []
+        self._buffered = 0
+
+    @property
+    def size(self) -> int:
+        """Bytes written so far, including those still buffered."""
+        return self.bytes_written + self._buffered
+
+    def _row(self, triple: Tuple[Node, Node, Node]) -> str:
+        return _nt_row(triple)
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> "NTriplesSink":
+        row = self._row(triple)
+        self._buffer.append(row)
+        self._buffered += len(row)
+        self.count += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+        return self
+
+    def add_serialized(self, data: bytes, format: str = "nt"):
+        if format != "nt":
+            return super().add_serialized(data, format)
+        self.flush()
+        self._stream.write(data)
+        self.bytes_written += len(data)
+        self.count += data.count(b"\n")
+
+    def flush(self):
+        if self._buffer:
+            data = "".join(self._buffer).encode("utf-8")
+            self._stream.write(data)
+            self.bytes_written += len(data)
+            self._buffer.clear()
+            self._buffered = 0
+
+    def close(self):
+        self.flush()
+        if self._owns_stream:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+
+class NQuadsSink(NTriplesSink):
+    """
+    Stream triples to an N-Quads file, all placed in ``graph`` (default graph if None).
+    With ``graph_for``, the triples of each input go to the graph it returns for the
+    input's name (``graph`` when it returns None). A ``router`` (e.g.
+    ``SubjectGraphRouter``) instead picks the graph of every single triple.
+    """
+
+    def __init__(
+        self,
+        destination: str | Path | IO[bytes],
+        graph: Optional[URIRef] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        graph_for: Optional[Callable[[str], Optional[URIRef]]] = None,
+        compression: Optional[str] = None,
+        queue_size: int = 0,
+        router: Optional[Callable[[Tuple[Node, Node, Node]], Optional[URIRef]]] = None,
+        compression_threads: int = 1,
+    ):
+        super().__init__(
+            destination,
+            buffer_size=buffer_size,
+            compression=compression,
+            queue_size=queue_size,
+            compression_threads=compression_threads,
+        )
+        self.graph = self.default_graph = graph
+        self.graph_for = graph_for
+        self.router = router
+
+    def begin(self, source: str):
+        if self.graph_for is not None:
+            self.graph = self.graph_for(source) or self.default_graph
+
+    def _row(self, triple: Tuple[Node, Node, Node]) -> str:
+        if self.router is not None:
+            return _nq_row(triple, self.router(triple))
+        return _nq_row(triple, self.graph)
+
+    def add_serialized(self, data: bytes, format: str = "nt"):
+        # N-Triples chunks need the graph term appended, so re-emit them row by row
+        return TripleSink.add_serialized(self, data, format)
+
+
+_sink_formats = {
+    "nt": NTriplesSink,
+    "ntriples": NTriplesSink,
+    "nq": NQuadsSink,
+    "nquads": NQuadsSink,
+}
+
+
+def open_sink(path: str | Path | IO[bytes], format: str = "nt", **kwargs) -> TripleSink:
+    """
+    Open a streaming sink writing ``format`` to ``path`` (or an open binary stream).
+    """
+    if format in ("ttl", "turtle"):
+        # imported here since TurtleSink builds on NTriplesSink
+        from .turtle import TurtleSink
+
+        return TurtleSink(path, **kwargs)
+    if (sink_cls := _sink_formats.get(format)) is None:
+        raise ValueError(f"Unsupported streaming format: '{format}'")
+    return sink_cls(path, **kwargs)
@@ -0,0 +1,186 @@
+import json
+import zlib
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+from rdflib import URIRef
+from rdflib.term import Node
+
+from .base import TripleSink
+from .compression import COMPRESSIONS, SUFFIXES
+from .ntriples import open_sink
+from .routing import SubjectGraphRouter
+from ..manifest import MANIFEST_FILENAME, file_fingerprint
+from ..scan import label_task
+
+PARTITION_MODES = ("shard", "task", "subject", "size")
+
+
+class PartitionedSink(TripleSink):
+    """
+    Write triples to ``out_dir/part-00000.nt.gz``, ``part-00001.nt.gz``, ... so that
+    they can be serialized, shipped and bulk-loaded in parallel, and describe the
+    parts in ``out_dir/manifest.json`` when closed.
+
+    The manifest holds the ``format``, ``compression`` and ``partition_by`` of the
+    parts, their total ``triples``, and one ``parts`` entry per file in creation
+    order: its ``file`` name, the input ``sources`` that wrote to it, its subject
+    ``bucket`` ("subject", absent for the shared nodes' part) or label ``task``
+    ("task"), its ``triples``,
+    ``uncompressed_bytes``, on-disk ``bytes`` and ``sha256`` checksum, so that a
+    loader can verify every part before loading it.
+
+    Parameters
+    ----------
+    out_dir : str | Path
+        Directory the parts and the manifest are written to
+    partition_by : str
+        "shard" starts a new part for every input file, "task" gives the labels of
+        each prediction task their own part(s), next to the rest, "subject" spreads
+        MEDS subjects over ``buckets`` parts by a stable hash of the subject node:
+        a subject's node, split assignment, events and labels end up in the same
+        part, shared nodes (codes, dataset metadata) in one more part without a
+        bucket (see ``SubjectGraphRouter``), "size" only splits on ``max_part_size``
+    buckets : int
+        Number of subject hash buckets
+    max_part_size : Optional[int]
+        Start a new part once the current one holds about this many (uncompressed)
+        bytes; required for "size", optional for the other modes
+    format : str
+        Format of the parts, "nt", "nq" or "ttl"
+    compression : Optional[str]
+        "gzip", "bgzip", "zstd" or None (see ``meds2rdf.sinks.compression``)
+    queue_size : int
+        Chunks queued for each part's background writer thread (0: write inline)
+    router : Optional[Callable]
+        With "nq", picks the named graph of every triple (e.g. ``SubjectGraphRouter``)
+    compression_threads : int
+        Threads compressing blocks of the parts, shared by all open parts
+    """
+
+    def __init__(
+        self,
+        out_dir: str | Path,
+        partition_by: str = "shard",
+        buckets: int = 16,
+        max_part_size: Optional[int] = None,
+        format: str = "nt",
+        compression: Optional[str] = "gzip",
+        queue_size: int = 0,
+        router: Optional[Callable[[Tuple[Node, Node, Node]], Optional[URIRef]]] = None,
+        compression_threads: int = 1,
+    ):
+        super().__init__()
+        if router is not None and format not in ("nq", "nquads"):
+            raise ValueError("Routing triples to named graphs requires N-Quads parts")
+        if partition_by not in PARTITION_MODES:
+            raise ValueError(f"Unknown partitioning: '{partition_by}', expected one of {PARTITION_MODES}")
+        if partition_by == "size" and not max_part_size:
+            raise ValueError("Partitioning by size requires max_part_size")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: '{compression}'")
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.partition_by = partition_by
+        self.buckets = buckets
+        self.max_part_size = max_part_size
+        self.format = format
+        self.compression = compression
+        self.queue_size = queue_size
+        self.compression_threads = compression_threads
+        self._sink_options = {"router": router} if router is not None else {}
+        # MEDS subject of every triple, None for shared nodes
+        self._subjects = SubjectGraphRouter(shared_graph=None) if partition_by == "subject" else None
+        self.parts: list[dict] = []
+        self._open: dict[Optional[int], tuple[TripleSink, dict]] = {}
+        self._source: Optional[str] = None
+        self._closed_bytes = 0
+
+    @property
+    def bytes_written(self) -> int:
+        """Uncompressed bytes written to all parts so far."""
+        return self._closed_bytes + sum(sink.bytes_written for sink, _ in self._open.values())
+
+    def _key(self, triple: Tuple[Node, Node, Node]) -> Optional[int]:
+        if self._subjects is not None and (subject := self._subjects(triple)) is not None:
+            return zlib.crc32(str(subject).encode("utf-8")) % self.buckets
+        return None
+
+    def _part(self, key: Optional[int]) -> TripleSink:
+        current = self._open.get(key)
+        if current is not None and self.max_part_size and current[0].size >= self.max_part_size:
+            self._close_part(key)
+            current = None
+        if current is None:
+            current = self._open[key] = self._open_part(key)
+        sink, entry = current
+        if self._source is not None and entry["sources"][-1:] != [self._source]:
+            entry["sources"].append(self._source)
+        return sink
+
+    def _open_part(self, key: Optional[int]) -> tuple[TripleSink, dict]:
+        name = f"part-{len(self.parts):05d}.{self.format}{SUFFIXES[self.compression]}"
+        entry = {"file": name, "sources": []}
+        if key is not None:
+            entry["bucket"] = key
+        if self.partition_by == "task" and (task := label_task(self._source or "")) is not None:
+            entry["task"] = task
+        self.parts.append(entry)
+        return open_sink(
+            self.out_dir / name,
+            self.format,
+            compression=self.compression,
+            queue_size=self.queue_size,
+            compression_threads=self.compression_threads,
+            **self._sink_options,
+        ), entry
+
+    def _close_part(self, key: Optional[int]):
+        sink, entry = self._open.pop(key)
+        sink.close()
+        self._closed_bytes += sink.bytes_written
+        fingerprint = file_fingerprint(self.out_dir / entry["file"])
+        entry.update(
+            triples=sink.count,
+            uncompressed_bytes=sink.bytes_written,
+            bytes=fingerprint["size"],
+            sha256=fingerprint["sha256"],
+        )
+
+    def begin(self, source: str):
+        previous, self._source = self._source, source
+        if None not in self._open:
+            return
+        if self.partition_by == "shard" or (
+            self.partition_by == "task" and label_task(source) != label_task(previous or "")
+        ):
+            self._close_part(None)
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> "PartitionedSink":
+        self._part(self._key(triple)).add(triple)
+        self.count += 1
+        return self
+
+    def add_serialized(self, data: bytes, format: str = "nt"):
+        if self.partition_by == "subject":
+            return super().add_serialized(data, format)
+        sink = self._part(None)
+        before = sink.count
+        sink.add_serialized(data, format)
+        self.count += sink.count - before
+
+    def flush(self):
+        for sink, _ in self._open.values():
+            sink.flush()
+
+    def close(self):
+        for key in list(self._open):
+            self._close_part(key)
+        manifest = {
+            "format": self.format,
+            "compression": self.compression,
+            "partition_by": self.partition_by,
+            "triples": sum(part["triples"] for part in self.parts),
+            "parts": self.parts,
+        }
+        with open(self.out_dir / MANIFEST_FILENAME, "w") as f:
+            json.dump(manifest, f, indent=2)
@@ -0,0 +1,37 @@
+from typing import Optional, Tuple
+from rdflib import URIRef
+from rdflib.term import Node
+
+from ..namespace import MEDS, MEDS_INSTANCES
+
+SHARED_GRAPH = URIRef(MEDS_INSTANCES["graph/shared"])
+_SUBJECT_PREFIX = str(MEDS_INSTANCES["subject/"])
+
+
+class SubjectGraphRouter:
+    """
+    Picks the named graph of every triple so that each subject's events, labels
+    and split assignment end up in the graph named after the subject node
+    (``meds-data:subject/{id}``), and shared nodes (codes, dataset metadata) in
+    ``shared_graph``.
+
+    Events and label samples are recognised by their ``meds:hasSubject`` triple,
+    which the mappers emit first, before the rest of the node's triples; only the
+    node being emitted is remembered, so memory does not grow with the data.
+    """
+
+    def __init__(self, shared_graph: Optional[URIRef] = SHARED_GRAPH):
+        self.shared_graph = shared_graph
+        self._node: Optional[Node] = None
+        self._graph: Optional[URIRef] = None
+
+    def __call__(self, triple: Tuple[Node, Node, Node]) -> Optional[URIRef]:
+        s, p, o = triple
+        if s == self._node:
+            return self._graph
+        if p == MEDS.hasSubject:
+            self._node, self._graph = s, o
+            return o
+        if str(s).startswith(_SUBJECT_PREFIX):
+            return s
+        return self.shared_graph
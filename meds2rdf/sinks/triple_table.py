@@ -0,0 +1,130 @@
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import polars as pl
+from rdflib import BNode, Literal, URIRef
+from rdflib.term import Node
+
+from .base import TripleSink
+
+DEFAULT_TABLE_COMMIT_SIZE = 1_000_000
+TERM_KINDS = pl.Enum(["iri", "literal", "bnode"])
+_KEY = ["kind", "value", "datatype", "lang"]
+_TERM_SCHEMA = {"id": pl.Int64, "kind": TERM_KINDS, "value": pl.String, "datatype": pl.String, "lang": pl.String}
+
+
+def _kind(term: Node) -> str:
+    if isinstance(term, Literal):
+        return "literal"
+    if isinstance(term, BNode):
+        return "bnode"
+    return "iri"
+
+
+def _term_frame(terms: list) -> pl.DataFrame:
+    """Dictionary key columns of ``terms`` (all rdflib terms are ``str`` subclasses)."""
+    return pl.DataFrame(
+        {
+            "kind": [_kind(t) for t in terms],
+            "value": terms,
+            "datatype": [getattr(t, "datatype", None) for t in terms],
+            "lang": [getattr(t, "language", None) for t in terms],
+        },
+        schema={k: _TERM_SCHEMA[k] for k in _KEY},
+    )
+
+
+class TripleTableSink(TripleSink):
+    """
+    Write triples as a dictionary-encoded integer triple table, for engines that
+    load RDF as columns (Spark, warehouses) rather than parsing it:
+
+    - ``out_dir/terms/part-00000.parquet``, ...: ``id`` (int64), ``kind`` ("iri",
+      "literal", "bnode"), ``value``, ``datatype`` and ``lang`` of every distinct term
+    - ``out_dir/triples/part-00000.parquet``, ...: ``s``, ``p``, ``o`` (and ``g`` with a
+      ``router``) term ids, int64
+
+    Triples are buffered and encoded ``commit_size`` at a time: the terms of a batch
+    are deduplicated in Polars and looked up in a term -> id index, misses get the
+    next ids, and the positions are mapped to ids with one join each against the
+    batch's own terms. Encoding a batch thus costs O(batch), however large the
+    dictionary grows. Each batch writes one part of both tables (only its new
+    terms to ``terms/``), so only the index stays in memory.
+
+    Parameters
+    ----------
+    out_dir : str | Path
+        Directory the two tables are written to
+    commit_size : int
+        Triples per encoded batch (and per part)
+    router : Optional[Callable]
+        Picks the named graph of every triple (e.g. ``SubjectGraphRouter``)
+    """
+
+    def __init__(
+        self,
+        out_dir: str | Path,
+        commit_size: int = DEFAULT_TABLE_COMMIT_SIZE,
+        router: Optional[Callable[[Tuple[Node, Node, Node]], Optional[URIRef]]] = None,
+    ):
+        super().__init__()
+        self.out_dir = Path(out_dir)
+        (self.out_dir / "terms").mkdir(parents=True, exist_ok=True)
+        (self.out_dir / "triples").mkdir(parents=True, exist_ok=True)
+        self.commit_size = commit_size
+        self.router = router
+        self.bytes_written = 0
+        self.parts = 0
+        # (kind, value, datatype, lang) -> id of every term written so far
+        self._ids: dict[tuple, int] = {}
+        self._columns: dict[str, list] = {c: [] for c in ("s", "p", "o", *(("g",) if router else ()))}
+
+    @property
+    def terms(self) -> int:
+        return len(self._ids)
+
+    def add(self, triple: Tuple[Node, Node, Node]) -> "TripleTableSink":
+        s, p, o = triple
+        self._columns["s"].append(s)
+        self._columns["p"].append(p)
+        self._columns["o"].append(o)
+        if self.router is not None:
+            self._columns["g"].append(self.router(triple))
+        self.count += 1
+        if len(self._columns["s"]) >= self.commit_size:
+            self.commit()
+        return self
+
+    def commit(self):
+        """Encode the buffered triples and write them as one part."""
+        if not self._columns["s"]:
+            return
+        frames = {c: _term_frame(terms) for c, terms in self._columns.items()}
+        for terms in self._columns.values():
+            terms.clear()
+
+        batch = pl.concat(list(frames.values())).drop_nulls("value").unique(maintain_order=True)
+        known = len(self._ids)
+        ids = [self._ids.setdefault(key, len(self._ids)) for key in batch.iter_rows()]
+        batch = batch.with_columns(id=pl.Series(ids, dtype=pl.Int64))
+        new = batch.filter(pl.col("id") >= known).select("id", *_KEY)
+
+        triples = pl.DataFrame({
+            c: frame.join(batch, on=_KEY, how="left", nulls_equal=True, maintain_order="left")["id"]
+            for c, frame in frames.items()
+        })
+        self._write(new, "terms")
+        self._write(triples, "triples")
+        self.parts += 1
+
+    def _write(self, df: pl.DataFrame, table: str):
+        path = self.out_dir / table / f"part-{self.parts:05d}.parquet"
+        df.write_parquet(path)
+        self.bytes_written += path.stat().st_size
+
+    def flush(self):
+        # parts are written per commit_size triples, not per mapped input batch
+        pass
+
+    def close(self):
+        self.commit()
@@ -0,0 +1,121 @@
+import re
+from pathlib import Path
+from typing import IO, Optional, Tuple
+
+from rdflib import BNode, Literal, Namespace
+from rdflib.namespace import RDF, XSD
+from rdflib.plugins.serializers.nt import _quote_encode
+from rdflib.term import Node
+
+from .base import TripleSink
+from .ntriples import DEFAULT_BUFFER_SIZE, NTriplesSink
+from ..namespace import MEDS, MEDS_INSTANCES, PROV
+
+DEFAULT_PREFIXES = {"meds": MEDS, "xsd": XSD, "rdf": RDF, "prov": PROV}
+_END = " .\n"
+_LOCAL_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*\Z")
+# "<kind>/<rest>" paths, which resolve against the base unchanged: the first
+# segment cannot be read as a scheme and there are no dot segments to remove
+_RELATIVE = re.compile(r"[A-Za-z][A-Za-z0-9_-]*/(?!\.\.?(?:/|\Z))(?!.*/\.\.?(?:/|\Z))[^\s<>\"{}|^`\\]*\Z")
+
+
+class TurtleSink(NTriplesSink):
+    """
+    Stream triples to a compact Turtle file without building a graph.
+
+    Consecutive triples about the same subject share one statement, their
+    predicates separated by ``;`` and the objects of a repeated predicate by ``,``.
+    The mappers emit each event, label and code node's triples together, so the
+    output is grouped per node while only the current subject and predicate are
+    kept in memory. Instance IRIs are written relative to ``@base`` and vocabulary
+    IRIs as prefixed names.
+
+    Parameters
+    ----------
+    destination : str | Path | IO[bytes]
+        Output path or an already opened binary stream
+    prefixes : Optional[dict]
+        Prefix name -> namespace used for prefixed names (default: meds, xsd, rdf, prov)
+    base : Optional[str]
+        Base IRI of the relative IRIs, None to write every IRI in full
+    buffer_size, compression, queue_size, compression_threads
+        As for ``NTriplesSink``
+    """
+
+    def __init__(
+        self,
+        destination: str | Path | IO[bytes],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        compression: Optional[str] = None,
+        queue_size: int = 0,
+        prefixes: Optional[dict[str, Namespace]] = None,
+        base: Optional[str] = MEDS_INSTANCES,
+        compression_threads: int = 1,
+    ):
+        super().__init__(
+            destination,
+            buffer_size=buffer_size,
+            compression=compression,
+            queue_size=queue_size,
+            compression_threads=compression_threads,
+        )
+        self.prefixes = {name: str(ns) for name, ns in (DEFAULT_PREFIXES if prefixes is None else prefixes).items()}
+        self.base = str(base) if base is not None else None
+        # vocabulary IRI -> prefixed name; bounded by the size of the vocabularies
+        # keyed on the URIRef: it does not hash like the equal str
+        self._names: dict[str, str] = {RDF.type: "a"}
+        self._subject: Optional[Node] = None
+        self._predicate: Optional[Node] = None
+        header = [f"@base <{self.base}> .\n"] if self.base is not None else []
+        header += [f"@prefix {name}: <{ns}> .\n" for name, ns in self.prefixes.items()]
+        self._write("".join(header) + "\n")
+
+    def _write(self, text: str):
+        self._buffer.append(text)
+        self._buffered += len(text)
+
+    def _iri(self, iri: str) -> str:
+        if (name := self._names.get(iri)) is not None:
+            return name
+        if self.base is not None and iri.startswith(self.base) and _RELATIVE.match(local := iri[len(self.base):]):
+            return f"<{local}>"
+        for prefix, ns in self.prefixes.items():
+            if iri.startswith(ns) and _LOCAL_NAME.match(local := iri[len(ns):]):
+                name = self._names[iri] = f"{prefix}:{local}"
+                return name
+        return f"<{iri}>"
+
+    def _term(self, term: Node) -> str:
+        if isinstance(term, Literal):
+            quoted = _quote_encode(term)
+            if term.language:
+                return f"{quoted}@{term.language}"
+            if term.datatype is None:
+                return quoted
+            return f"{quoted}^^{self._iri(term.datatype)}"
+        if isinstance(term, BNode):
+            return f"_:{term}"
+        return self._iri(term)
+
+    def _row(self, triple: Tuple[Node, Node, Node]) -> str:
+        s, p, o = triple
+        if s == self._subject:
+            if p == self._predicate:
+                return f", {self._term(o)}"
+            self._predicate = p
+            return f" ;\n    {self._iri(p)} {self._term(o)}"
+        row = f"{self._term(s)} {self._iri(p)} {self._term(o)}"
+        if self._subject is not None:
+            row = _END + row
+        self._subject, self._predicate = s, p
+        return row
+
+    def add_serialized(self, data: bytes, format: str = "nt"):
+        # N-Triples chunks would be valid Turtle, but regroup them to keep the output compact
+        return TripleSink.add_serialized(self, data, format)
+
+    def close(self):
+        if self._subject is not None:
+            self._write(_END)
+            self._subject = self._predicate = None
+        super().close()
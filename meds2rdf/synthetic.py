@@ -0,0 +1,156 @@
+"""Synthetic MEDS datasets of configurable size, for tests and benchmarks."""
+
+import json
+from pathlib import Path
+
+import polars as pl
+
+from .namespace import PREFIX_MAP_BIOPORTAL
+from .scan import splitmix64
+
+_STATIC_CODES = ("MEDS_BIRTH", "GENDER//F", "GENDER//M")
+_CODE_FAMILIES = ("LAB", "DIAGNOSIS", "PROCEDURE", "MEDICATION")
+_SPLITS = ("train", "tuning", "held_out")
+_START = pl.datetime(2020, 1, 1)
+
+
+def _uniform(expr: pl.Expr, seed: int) -> pl.Expr:
+    """
+    Deterministic pseudo-random floats in [0, 1) derived from the integers ``expr``:
+    the top 53 bits of their ``splitmix64``, so the same seed gives the same
+    dataset whatever the Polars version.
+    """
+    return (splitmix64(expr, seed) // pl.lit(1 << 11, dtype=pl.UInt64)).cast(pl.Float64) / 2.0**53
+
+
+def generate_codes(n_codes: int, seed: int = 0) -> pl.DataFrame:
+    """``metadata/codes.parquet`` content: ``n_codes`` codes, each with 0-2 ontology parents."""
+    prefixes = list(PREFIX_MAP_BIOPORTAL)
+    idx = pl.int_range(n_codes, dtype=pl.Int64)
+    family = (idx % len(_CODE_FAMILIES)).replace_strict(range(len(_CODE_FAMILIES)), _CODE_FAMILIES)
+    n_parents = (_uniform(idx, seed) * 3).cast(pl.Int64)
+    parent = pl.concat_str(
+        (idx % len(prefixes)).replace_strict(range(len(prefixes)), prefixes),
+        pl.lit(":"),
+        (idx // 10).cast(pl.String),
+    )
+    return pl.select(
+        code=pl.concat_str(family, pl.lit("//"), idx.cast(pl.String)),
+        description=pl.concat_str(pl.lit("Synthetic code "), idx.cast(pl.String)),
+        parent_codes=pl.when(n_parents == 0)
+        .then(pl.lit([], dtype=pl.List(pl.String)))
+        .when(n_parents == 1)
+        .then(pl.concat_list(parent))
+        .otherwise(pl.concat_list(parent, pl.concat_str(parent, pl.lit(".1")))),
+    ).vstack(pl.DataFrame({
+        "code": list(_STATIC_CODES),
+        "description": [f"Static code {c}" for c in _STATIC_CODES],
+        "parent_codes": [[] for _ in _STATIC_CODES],
+    }, schema={"code": pl.String, "description": pl.String, "parent_codes": pl.List(pl.String)}))
+
+
+def generate_events(
+    n_subjects: int,
+    events_per_subject: int,
+    n_codes: int,
+    null_rate: float = 0.3,
+    seed: int = 0,
+) -> pl.DataFrame:
+    """
+    DataSchema rows sorted by subject and time: two static events (birth, gender)
+    followed by ``events_per_subject - 2`` timed events with a skewed code
+    distribution and ``null_rate`` missing values.
+    """
+    n_timed = max(events_per_subject - 2, 0)
+    subject = pl.int_range(n_subjects, dtype=pl.Int64)
+    static = pl.select(
+        subject_id=subject.repeat_by(2).explode(),
+    ).select(
+        "subject_id",
+        time=pl.lit(None, dtype=pl.Datetime("us")),
+        code=pl.when(pl.int_range(pl.len()) % 2 == 0)
+        .then(pl.lit(_STATIC_CODES[0]))
+        .otherwise(pl.when(_uniform(pl.col("subject_id"), seed) < 0.5).then(pl.lit(_STATIC_CODES[1])).otherwise(pl.lit(_STATIC_CODES[2]))),
+        numeric_value=pl.lit(None, dtype=pl.Float32),
+        text_value=pl.lit(None, dtype=pl.String),
+    )
+
+    n = n_subjects * n_timed
+    row = pl.int_range(n, dtype=pl.Int64)
+    # squaring a uniform draw skews usage towards the first codes, as in real data
+    code_idx = (_uniform(row, seed + 1) ** 2 * n_codes).cast(pl.Int64)
+    timed = pl.select(
+        subject_id=row // max(n_timed, 1),
+        time=_START + pl.duration(minutes=(row % max(n_timed, 1)) * 60 + (_uniform(row, seed + 2) * 59).cast(pl.Int64)),
+        code=pl.concat_str(
+            (code_idx % len(_CODE_FAMILIES)).replace_strict(range(len(_CODE_FAMILIES)), _CODE_FAMILIES),
+            pl.lit("//"),
+            code_idx.cast(pl.String),
+        ),
+        numeric_value=pl.when(_uniform(row, seed + 3) >= null_rate)
+        .then((_uniform(row, seed + 4) * 200).round(2).cast(pl.Float32)),
+        text_value=pl.when(_uniform(row, seed + 5) < (1 - null_rate) / 4)
+        .then(pl.when(_uniform(row, seed + 6) < 0.5).then(pl.lit("POS")).otherwise(pl.lit("NEG"))),
+    )
+    return pl.concat([static, timed]).sort("subject_id", "time", nulls_last=False, maintain_order=True)
+
+
+def generate_meds_dataset(
+    root: str | Path,
+    n_subjects: int = 1_000,
+    events_per_subject: int = 100,
+    n_codes: int = 500,
+    null_rate: float = 0.3,
+    n_shards: int = 4,
+    n_label_tasks: int = 1,
+    seed: int = 0,
+) -> Path:
+    """
+    Write a complete synthetic MEDS directory under ``root``: ``data/`` split into
+    ``n_shards`` subject-disjoint shards, ``metadata/dataset.json``,
+    ``metadata/codes.parquet``, ``metadata/subject_splits.parquet`` and one
+    ``labels/task_{i}/`` directory per label task.
+
+    Returns
+    -------
+    Path
+        The dataset root
+    """
+    root = Path(root)
+    for sub in ("metadata", "data"):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+
+    with open(root / "metadata/dataset.json", "w") as f:
+        json.dump({
+            "dataset_name": "Synthetic MEDS",
+            "dataset_version": "1.0",
+            "meds_version": "0.4.0",
+            "etl_name": "meds2rdf.synthetic",
+            "code_modifier_columns": [],
+            "subject_id_columns": ["subject_id"],
+        }, f)
+
+    generate_codes(n_codes, seed).write_parquet(root / "metadata/codes.parquet")
+
+    events = generate_events(n_subjects, events_per_subject, n_codes, null_rate, seed)
+    shard = events["subject_id"] * n_shards // max(n_subjects, 1)
+    for i in range(n_shards):
+        events.filter(shard == i).write_parquet(root / f"data/{i}.parquet")
+
+    subjects = pl.int_range(n_subjects, dtype=pl.Int64, eager=True).alias("subject_id").to_frame()
+    subjects.with_columns(
+        split=pl.when(_uniform(pl.col("subject_id"), seed + 7) < 0.8)
+        .then(pl.lit(_SPLITS[0]))
+        .when(_uniform(pl.col("subject_id"), seed + 7) < 0.9)
+        .then(pl.lit(_SPLITS[1]))
+        .otherwise(pl.lit(_SPLITS[2])),
+    ).write_parquet(root / "metadata/subject_splits.parquet")
+
+    for task in range(n_label_tasks):
+        (root / f"labels/task_{task}").mkdir(parents=True, exist_ok=True)
+        subjects.with_columns(
+            prediction_time=_START + pl.duration(days=30),
+            boolean_value=_uniform(pl.col("subject_id"), seed + 8 + task) < 0.2,
+        ).write_parquet(root / f"labels/task_{task}/0.parquet")
+
+    return root
@@ -1,5 +1,8 @@
 # Optional: expose utility functions
 from .rdf_utils import *
+from .iri import IRI_STRATEGIES, row_iris, record_iri
+from .node_registry import NodeRegistry
+from .term_cache import TermCache, TERMS
 
 __all__ = [
     "to_literal",
@@ -7,4 +10,10 @@ __all__ = [
     "if_column_is_present",
     "add_code",
     "to_subject_node",
+    "IRI_STRATEGIES",
+    "row_iris",
+    "record_iri",
+    "NodeRegistry",
+    "TermCache",
+    "TERMS",
 ]
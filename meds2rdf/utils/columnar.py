@@ -0,0 +1,196 @@
+from typing import Optional
+from urllib.parse import quote
+import polars as pl
+from rdflib.namespace import XSD
+
+
+def iri_expr(base: str, column: str) -> pl.Expr:
+    """IRI strings ``{base}{value}`` for every value of ``column``."""
+    return pl.concat_str(pl.lit(str(base)), pl.col(column).cast(pl.String))
+
+
+def quoted_iri_series(base: str, series: pl.Series) -> pl.Series:
+    """
+    IRI strings ``{base}{quote(value)}``.
+
+    ``quote`` has no Polars equivalent, so it is applied once per distinct value
+    and broadcast back; codes are low-cardinality, making this close to free.
+    """
+    values = series.cast(pl.String)
+    uniques = values.unique().drop_nulls()
+    return values.replace_strict(
+        uniques,
+        [f"{base}{quote(v)}" for v in uniques],
+        default=None,
+        return_dtype=pl.String,
+    )
+
+
+TIME_PRECISIONS = ("auto", "s", "ms", "us")
+# how naive times repeated or skipped by a DST transition of ``time_zone`` are resolved
+AMBIGUOUS_TIMES = ("earliest", "latest", "null", "raise")
+NON_EXISTENT_TIMES = ("null", "raise")
+
+_FRACTION_FORMATS = {"s": "", "ms": "%.3f", "us": "%.6f"}
+_ISO_DATETIME = "%Y-%m-%dT%H:%M:%S%.f"
+# "Z", "+02:00" or "+0200"
+_ISO_DATETIME_OFFSET = f"{_ISO_DATETIME}%#z"
+
+
+class LexicalFormat:
+    """
+    How time and floating point columns are written as XSD lexical forms.
+
+    Parameters
+    ----------
+    time_zone : Optional[str]
+        If set (e.g. "UTC"), tz-aware times are converted to this zone, naive times
+        are taken to be in it, and every xsd:dateTime carries its offset. If None,
+        times are written as stored, with an offset only for tz-aware columns.
+    time_precision : str
+        "auto" writes fractional seconds only when non-zero (like
+        ``datetime.isoformat()``); "s", "ms" or "us" always use that precision
+    float_digits : Optional[int]
+        Round xsd:double values to this many decimal places
+    ambiguous : str
+        Naive times that occur twice in ``time_zone`` (clocks set back): "earliest"
+        (default) or "latest" occurrence, "null" to leave them out, "raise"
+    non_existent : str
+        Naive times skipped in ``time_zone`` (clocks set forward): "null" (default)
+        leaves them out, and the mappers warn with their count; "raise"
+    """
+
+    def __init__(
+        self,
+        time_zone: Optional[str] = None,
+        time_precision: str = "auto",
+        float_digits: Optional[int] = None,
+        ambiguous: str = "earliest",
+        non_existent: str = "null",
+    ):
+        if time_precision not in TIME_PRECISIONS:
+            raise ValueError(f"Unknown time precision: '{time_precision}', expected one of {TIME_PRECISIONS}")
+        if ambiguous not in AMBIGUOUS_TIMES:
+            raise ValueError(f"Unknown ambiguous time policy: '{ambiguous}', expected one of {AMBIGUOUS_TIMES}")
+        if non_existent not in NON_EXISTENT_TIMES:
+            raise ValueError(f"Unknown non-existent time policy: '{non_existent}', expected one of {NON_EXISTENT_TIMES}")
+        self.time_zone = time_zone
+        self.time_precision = time_precision
+        self.float_digits = float_digits
+        self.ambiguous = ambiguous
+        self.non_existent = non_existent
+
+    def to_options(self) -> dict:
+        return {
+            "time_zone": self.time_zone,
+            "time_precision": self.time_precision,
+            "float_digits": self.float_digits,
+            "ambiguous": self.ambiguous,
+            "non_existent": self.non_existent,
+        }
+
+
+def parse_iso_datetime(expr: pl.Expr) -> pl.Expr:
+    """ISO 8601 strings (``T`` or space separated) as naive datetimes, null where they do not parse."""
+    return expr.str.replace(" ", "T", literal=True).str.to_datetime(_ISO_DATETIME, time_unit="us", strict=False)
+
+
+def parse_iso_datetime_utc(expr: pl.Expr) -> pl.Expr:
+    """ISO 8601 strings with a UTC offset as UTC datetimes, null where they do not parse."""
+    return expr.str.replace(" ", "T", literal=True).str.to_datetime(
+        _ISO_DATETIME_OFFSET, time_unit="us", time_zone="UTC", strict=False
+    )
+
+
+def datetime_lexical(expr: pl.Expr, dtype: pl.DataType, fmt: Optional[LexicalFormat] = None) -> pl.Expr:
+    """
+    xsd:dateTime lexical forms of a datetime column, in a single expression.
+    String columns are parsed as ISO 8601 (``T`` or space separated) first. With a
+    ``time_zone``, strings with a UTC offset are converted to it like tz-aware
+    columns; without, they are written unchanged, as are strings that do not parse.
+    """
+    fmt = fmt or LexicalFormat()
+    if dtype == pl.String:
+        forms = [datetime_lexical(parse_iso_datetime(expr), pl.Datetime("us"), fmt)]
+        if fmt.time_zone is not None:
+            forms.append(datetime_lexical(parse_iso_datetime_utc(expr), pl.Datetime("us", "UTC"), fmt))
+        return pl.coalesce(*forms, expr)
+    if not isinstance(dtype, pl.Datetime):
+        return expr.cast(pl.String)
+
+    aware = dtype.time_zone is not None
+    if fmt.time_zone is not None:
+        if aware:
+            expr = expr.dt.convert_time_zone(fmt.time_zone)
+        else:
+            expr = expr.dt.replace_time_zone(fmt.time_zone, ambiguous=fmt.ambiguous, non_existent=fmt.non_existent)
+        aware = True
+    offset = "%:z" if aware else ""
+    if fmt.time_precision != "auto":
+        return expr.dt.strftime(f"%Y-%m-%dT%H:%M:%S{_FRACTION_FORMATS[fmt.time_precision]}{offset}")
+    return (
+        pl.when(expr.dt.microsecond() == 0)
+        .then(expr.dt.strftime(f"%Y-%m-%dT%H:%M:%S{offset}"))
+        .otherwise(expr.dt.strftime(f"%Y-%m-%dT%H:%M:%S%.6f{offset}"))
+    )
+
+
+def double_lexical(expr: pl.Expr, dtype: pl.DataType, fmt: Optional[LexicalFormat] = None) -> pl.Expr:
+    """
+    xsd:double lexical forms: integers are written as doubles ("45.0"), infinities
+    as "INF"/"-INF"; values are optionally rounded to ``fmt.float_digits``.
+    """
+    fmt = fmt or LexicalFormat()
+    if dtype.is_integer():
+        expr = expr.cast(pl.Float64)
+    elif not dtype.is_float():
+        return expr.cast(pl.String)
+    if fmt.float_digits is not None:
+        expr = expr.round(fmt.float_digits)
+    return (
+        pl.when(expr == float("inf")).then(pl.lit("INF"))
+        .when(expr == float("-inf")).then(pl.lit("-INF"))
+        .otherwise(expr.cast(pl.String))
+    )
+
+
+def _lexical(expr: pl.Expr, dtype: pl.DataType, xsd_type, fmt: Optional[LexicalFormat] = None) -> pl.Expr:
+    if xsd_type == XSD.dateTime:
+        return datetime_lexical(expr, dtype, fmt)
+    if xsd_type == XSD.double:
+        return double_lexical(expr, dtype, fmt)
+    return expr.cast(pl.String)
+
+
+def lexical_expr(column: str, dtype: pl.DataType, xsd_type, fmt: Optional[LexicalFormat] = None) -> pl.Expr:
+    """
+    Lexical form of ``column`` for a literal of datatype ``xsd_type``; list columns
+    become lists of lexical forms.
+    """
+    if isinstance(dtype, pl.List):
+        return pl.col(column).list.eval(_lexical(pl.element(), dtype.inner, xsd_type, fmt)).alias(column)
+    return _lexical(pl.col(column), dtype, xsd_type, fmt).alias(column)
+
+
+def xsd_datatype(dtype: pl.DataType):
+    """XSD datatype for the values of a Polars column (elements, for list columns)."""
+    if isinstance(dtype, pl.List):
+        dtype = dtype.inner
+    if dtype == pl.Boolean:
+        return XSD.boolean
+    if dtype.is_integer():
+        return XSD.integer
+    if dtype.is_float():
+        return XSD.double
+    if isinstance(dtype, pl.Datetime):
+        return XSD.dateTime
+    if dtype == pl.Date:
+        return XSD.date
+    return XSD.string
+
+
+def check_mandatory_columns(df: pl.DataFrame, fields: tuple, entity: str):
+    """Vectorized counterpart of ``try_access_mandatory_field_value``."""
+    for field in fields:
+        if field not in df.columns or df[field].null_count() > 0:
+            raise ValueError(f"{entity} must have field '{field}'")
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import uuid
+from typing import Optional
+from urllib.parse import quote
+
+import polars as pl
+from rdflib import URIRef
+
+from ..namespace import MEDS_INSTANCES
+
+# "uuid": random IRIs (uuid4), a fresh graph on every run
+# "hash": content-addressed IRIs, identical across runs (and Polars versions) over the same data
+IRI_STRATEGIES = ("uuid", "hash")
+
+_DIGEST_SIZE = 16
+
+# row index of a row in its input file, added by the scans (see ``Selection.scan``)
+ROW_INDEX = "_meds2rdf_row"
+
+
+def check_iri_strategy(strategy: str) -> str:
+    if strategy not in IRI_STRATEGIES:
+        raise ValueError(f"Unknown IRI strategy: '{strategy}'")
+    return strategy
+
+
+def _canonical_field(column: pl.Series) -> pl.Series:
+    """
+    ``column`` as strings that do not depend on its exact dtype nor on the Polars
+    version: integers as Int64, temporal values as epoch microseconds, floats in
+    hexadecimal notation, other values as strings. Every value is prefixed with its
+    byte length (nulls are "-") so that concatenated fields cannot collide.
+    """
+    dtype = column.dtype
+    if dtype.is_float():
+        column = pl.Series([None if v is None else v.hex() for v in column.cast(pl.Float64).to_list()], dtype=pl.String)
+    elif dtype.is_integer() or dtype == pl.Boolean:
+        column = column.cast(pl.Int64).cast(pl.String)
+    elif dtype.is_temporal() and dtype != pl.Duration and dtype != pl.Time:
+        column = column.cast(pl.Datetime("us", dtype.time_zone if isinstance(dtype, pl.Datetime) else None))
+        column = column.dt.epoch("us").cast(pl.String)
+    elif dtype.is_nested():
+        column = pl.Series([None if v is None else json.dumps(v, default=str) for v in column.to_list()], dtype=pl.String)
+    else:
+        column = column.cast(pl.String)
+    return (
+        pl.select(pl.concat_str(column.str.len_bytes().cast(pl.String), pl.lit(":"), column))
+        .to_series()
+        .fill_null("-")
+    )
+
+
+def row_iris(
+    df: pl.DataFrame,
+    base: str,
+    key_columns: tuple,
+    strategy: str = "uuid",
+    source: Optional[str] = None,
+    row_offset: int = 0,
+) -> pl.Series:
+    """
+    One IRI per row of ``df``, under ``base``.
+
+    With the "hash" strategy the IRI is a 128-bit BLAKE2b digest of the row's
+    ``source`` shard, row index and ``key_columns``. The row index is taken from
+    the ``ROW_INDEX`` column when present, so that it is counted in the whole
+    file, otherwise it is ``row_offset`` plus the position in ``df``. All are each cast to a canonical
+    form first (see ``_canonical_field``), so IRIs are stable across Polars
+    versions and input dtypes (e.g. an Int32 or Int64 ``subject_id``).
+    """
+    check_iri_strategy(strategy)
+    if strategy == "uuid":
+        return pl.Series([f"{base}{uuid.uuid4()}" for _ in range(df.height)], dtype=pl.String)
+
+    fields = [
+        pl.Series([source or ""] * df.height, dtype=pl.String),
+        df[ROW_INDEX] if ROW_INDEX in df.columns
+        else pl.int_range(row_offset, row_offset + df.height, dtype=pl.Int64, eager=True),
+        *[df[c] for c in key_columns if c in df.columns],
+    ]
+    keys = pl.select(pl.concat_str([_canonical_field(f) for f in fields], separator="|")).to_series()
+    return pl.Series(
+        [f"{base}{hashlib.blake2b(key.encode('utf-8'), digest_size=_DIGEST_SIZE).hexdigest()}" for key in keys],
+        dtype=pl.String,
+    )
+
+
+def record_iri(base: str, record: dict, strategy: str = "uuid") -> URIRef:
+    """Single-record counterpart of ``row_iris`` (dataset metadata, licenses, ...)."""
+    check_iri_strategy(strategy)
+    if strategy == "uuid":
+        return URIRef(f"{base}{uuid.uuid4()}")
+    digest = hashlib.sha1(json.dumps(record, sort_keys=True, default=str).encode("utf-8"))
+    return URIRef(f"{base}{digest.hexdigest()}")
+
+
+def task_graph_iri(task: str) -> URIRef:
+    """Named graph holding the labels of the prediction task ``task``."""
+    return URIRef(MEDS_INSTANCES[f"task/{quote(task)}"])
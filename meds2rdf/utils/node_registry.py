@@ -0,0 +1,45 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class NodeRegistry:
+    """
+    Remembers which nodes (codes, subjects) have already been declared during a
+    conversion, so their ``rdf:type``/identifier triples are emitted only once.
+
+    Parameters
+    ----------
+    maxsize : Optional[int]
+        Keep at most ``maxsize`` nodes, evicting the least recently seen one.
+        ``None`` keeps every node. An evicted node is declared again the next time
+        it shows up, which only produces a duplicate (harmless) triple.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        self._seen = set() if maxsize is None else OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def first_seen(self, key: Hashable) -> bool:
+        """Record ``key`` and return True if it was not registered yet."""
+        if key in self._seen:
+            self.hits += 1
+            if self.maxsize is not None:
+                self._seen.move_to_end(key)
+            return False
+
+        self.misses += 1
+        if self.maxsize is None:
+            self._seen.add(key)
+        else:
+            self._seen[key] = None
+            if len(self._seen) > self.maxsize:
+                self._seen.popitem(last=False)
+        return True
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __contains__(self, key):
+        return key in self._seen
@@ -4,11 +4,12 @@ from rdflib.namespace import XSD
 from datetime import datetime
 from typing import Optional, Callable, Iterable
 from ..namespace import MEDS, MEDS_INSTANCES, PROV, PREFIX_MAP_BIOPORTAL
+from .term_cache import TERMS
 
 def to_literal(value, dtype):
     if isinstance(value, datetime):
         return Literal(value.isoformat(), datatype=XSD.dateTime)
-    return Literal(str(value), datatype=dtype)
+    return TERMS.literal(str(value), dtype)
 
 def try_access_mandatory_field_value(row, field, entity):
     val = row.get(field)
@@ -28,14 +29,16 @@ def if_column_is_present(column_name, source, callback: Callable[[str], Graph]):
 
 from urllib.parse import quote
 
-def add_code(code_str: str, graph: Graph, dataset_uri: Optional[URIRef] = None, external = False):
+def add_code(code_str: str, graph: Graph, dataset_uri: Optional[URIRef] = None, external = False, registry = None):
     if external: 
         code_uri = curie_to_uri(code_str)
     else: 
-        code_uri = URIRef(MEDS_INSTANCES[f"code/{quote(code_str)}"])
+        code_uri = TERMS.intern(("code", code_str), lambda: URIRef(MEDS_INSTANCES[f"code/{quote(code_str)}"]))
 
-    graph.add((code_uri, RDF.type, MEDS.Code))
-    graph.add((code_uri, MEDS.codeString, Literal(str(code_str), datatype=XSD.string)))
+    # registry: optional NodeRegistry, skips codes declared earlier in the conversion
+    if registry is None or registry.first_seen(str(code_uri)):
+        graph.add((code_uri, RDF.type, MEDS.Code))
+        graph.add((code_uri, MEDS.codeString, TERMS.literal(str(code_str), XSD.string)))
 
     if dataset_uri:
         graph.add((code_uri, PROV.wasDerivedFrom, dataset_uri))
@@ -43,11 +46,16 @@ def add_code(code_str: str, graph: Graph, dataset_uri: Optional[URIRef] = None,
     return code_uri
 
 def to_subject_node(subject_id: str) -> URIRef:
-    if (subject_uri := URIRef(MEDS_INSTANCES[f"subject/{subject_id}"])) is None:
+    if (subject_uri := TERMS.intern(("subject", subject_id), lambda: URIRef(MEDS_INSTANCES[f"subject/{subject_id}"]))) is None:
         raise ValueError(f"Cannot create subject uri with id: ${subject_id}")
     return subject_uri
 
 def curie_to_uri(curie: str, prefix_map: dict = PREFIX_MAP_BIOPORTAL) -> URIRef:
+    if prefix_map is PREFIX_MAP_BIOPORTAL:
+        return TERMS.intern(("curie", curie), lambda: _curie_to_uri(curie, prefix_map))
+    return _curie_to_uri(curie, prefix_map)
+
+def _curie_to_uri(curie: str, prefix_map: dict) -> URIRef:
     prefix, local = curie.split(":", 1)
     if prefix not in prefix_map:
         raise ValueError(f"Unknown prefix: {prefix}")
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+from rdflib import Literal, URIRef
+from rdflib.term import Node
+
+DEFAULT_TERM_CACHE_SIZE = 1 << 16
+DEFAULT_MAX_VALUE_LENGTH = 256
+
+
+class TermCache:
+    """
+    Interns rdflib terms of low-cardinality values (codes, subjects, categories,
+    split names), so that repeated values reuse one ``Literal``/``URIRef`` instead
+    of building, and quoting, a new one per occurrence.
+
+    Parameters
+    ----------
+    maxsize : int
+        Keep at most ``maxsize`` terms, evicting the least recently used one
+    max_value_length : int
+        Values longer than this (free text, long IRIs) are rarely repeated and
+        are built without being cached, so they cannot flush the useful entries
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_TERM_CACHE_SIZE, max_value_length: int = DEFAULT_MAX_VALUE_LENGTH):
+        self.maxsize = maxsize
+        self.max_value_length = max_value_length
+        self._terms: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def intern(self, key: Hashable, build: Callable[[], Node]) -> Node:
+        """Term cached under ``key``, built with ``build()`` on a miss."""
+        term = self._terms.get(key)
+        if term is not None:
+            self.hits += 1
+            self._terms.move_to_end(key)
+            return term
+        self.misses += 1
+        term = self._terms[key] = build()
+        if len(self._terms) > self.maxsize:
+            self._terms.popitem(last=False)
+        return term
+
+    def literal(self, value: str, datatype: Optional[URIRef] = None) -> Literal:
+        """``Literal(value, datatype=datatype)``, interned on (value, datatype)."""
+        if len(value) > self.max_value_length:
+            self.skipped += 1
+            return Literal(value, datatype=datatype)
+        return self.intern(("literal", value, datatype), lambda: Literal(value, datatype=datatype))
+
+    def uri(self, value: str) -> URIRef:
+        """``URIRef(value)``, interned."""
+        if len(value) > self.max_value_length:
+            self.skipped += 1
+            return URIRef(value)
+        return self.intern(("uri", value), lambda: URIRef(value))
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "size": len(self._terms),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.skipped = 0
+
+    def clear(self):
+        self._terms.clear()
+        self.reset_stats()
+
+    def __len__(self):
+        return len(self._terms)
+
+
+# Shared by all mappers of a process
+TERMS = TermCache()
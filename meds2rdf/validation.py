@@ -0,0 +1,162 @@
+"""
+Vectorized checks of the MEDS inputs, run on the lazy Parquet scans before any
+row is mapped, so that bad rows are reported (or dropped) up front instead of
+aborting the conversion at the first one, possibly hours in.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+from .mapping.split_mapper import _split_dict
+from .namespace import PREFIX_MAP_BIOPORTAL
+
+ON_INVALID = ("raise", "drop", "quarantine")
+_EXAMPLES = 5
+_MANDATORY = {
+    "data": ("subject_id", "code"),
+    "codes": ("code",),
+    "splits": ("subject_id", "split"),
+    "labels": ("subject_id",),
+}
+
+
+class InvalidRowsError(ValueError):
+    """Raised before mapping when the inputs hold rows the mappers would reject."""
+
+    def __init__(self, report: "ValidationReport"):
+        super().__init__(str(report))
+        self.report = report
+
+
+def _unknown_prefix(codes: pl.Expr) -> pl.Expr:
+    """True on CURIEs whose prefix is missing or not in ``PREFIX_MAP_BIOPORTAL``."""
+    prefix = codes.str.extract(r"^([^:]+):", 1)
+    return prefix.is_null() | ~prefix.is_in(list(PREFIX_MAP_BIOPORTAL))
+
+
+def row_checks(stage: str, schema: pl.Schema) -> dict[str, tuple[pl.Expr, Optional[pl.Expr]]]:
+    """
+    Checks of the rows of an input of ``stage``, by name: an expression that is
+    True on the rows failing the check, and one listing a few offending values
+    (None when the values themselves are missing).
+    """
+    checks = {}
+    for field in _MANDATORY[stage]:
+        # a missing column fails every row, not a single broadcast literal
+        missing = pl.col(field).is_null() if field in schema else pl.repeat(True, pl.len())
+        checks[f"missing {field}"] = (missing, None)
+
+    if stage == "splits" and "split" in schema:
+        split = pl.col("split")
+        unknown = split.is_not_null() & ~split.is_in(list(_split_dict))
+        checks["unknown split"] = (unknown, split.filter(unknown))
+
+    if stage == "codes" and "parent_codes" in schema:
+        parents = pl.col("parent_codes")
+        if isinstance(schema["parent_codes"], pl.List):
+            unknown = parents.list.eval(pl.element().is_not_null() & _unknown_prefix(pl.element())).list.any()
+            flat = parents.explode().drop_nulls()
+        else:
+            unknown = parents.is_not_null() & _unknown_prefix(parents)
+            flat = parents.drop_nulls()
+        checks["unknown parent_codes prefix"] = (unknown.fill_null(False), flat.filter(_unknown_prefix(flat)))
+    return checks
+
+
+def invalid_rows(stage: str, schema: pl.Schema) -> pl.Expr:
+    """True on the rows of an input of ``stage`` failing any check."""
+    return pl.any_horizontal([invalid for invalid, _ in row_checks(stage, schema).values()])
+
+
+def failed_checks(stage: str, schema: pl.Schema) -> pl.Expr:
+    """Names of the checks each row fails, as a list column."""
+    names = [pl.when(invalid).then(pl.lit(name)) for name, (invalid, _) in row_checks(stage, schema).items()]
+    return pl.concat_list(names).list.drop_nulls()
+
+
+class ValidationReport:
+    """
+    Outcome of ``validate_inputs``: rows checked, and one issue per input and
+    failed check with the number of offending rows and a few offending values.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.seconds = 0.0
+        self.issues: list[dict] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    @property
+    def invalid_sources(self) -> list[str]:
+        return list(dict.fromkeys(issue["source"] for issue in self.issues))
+
+    def to_dict(self) -> dict:
+        return {"rows": self.rows, "seconds": self.seconds, "issues": self.issues}
+
+    def save(self, path: str | Path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def __str__(self) -> str:
+        if self.ok:
+            return f"{self.rows:,} rows valid"
+        lines = [f"{sum(i['rows'] for i in self.issues):,} invalid rows found in {self.rows:,}:"]
+        for issue in self.issues:
+            examples = f" (e.g. {', '.join(map(str, issue['examples']))})" if issue["examples"] else ""
+            lines.append(f"  {issue['source']}: {issue['rows']:,} rows with {issue['check']}{examples}")
+        return "\n".join(lines)
+
+
+def validate_inputs(inputs: list[tuple[str, str, pl.LazyFrame]]) -> ValidationReport:
+    """
+    Run the checks of every ``(stage, source, lazy frame)`` input. All the counts
+    are computed in a single ``pl.collect_all``, so Polars scans the inputs in
+    parallel and never materializes their rows.
+    """
+    start = time.perf_counter()
+    queries, names = [], []
+    for stage, source, lf in inputs:
+        checks = row_checks(stage, lf.collect_schema())
+        columns = [pl.len().alias("rows")]
+        for i, (invalid, examples) in enumerate(checks.values()):
+            columns.append(invalid.sum().alias(f"invalid_{i}"))
+            if examples is not None:
+                columns.append(examples.unique(maintain_order=True).head(_EXAMPLES).implode().alias(f"examples_{i}"))
+        queries.append(lf.select(columns))
+        names.append((source, list(checks)))
+
+    report = ValidationReport()
+    for (source, checks), counts in zip(names, pl.collect_all(queries)):
+        row = counts.row(0, named=True)
+        report.rows += row["rows"]
+        for i, check in enumerate(checks):
+            if row[f"invalid_{i}"]:
+                report.issues.append({
+                    "source": source,
+                    "check": check,
+                    "rows": row[f"invalid_{i}"],
+                    "examples": row.get(f"examples_{i}") or [],
+                })
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def quarantine(stage: str, source: str, lf: pl.LazyFrame, out_dir: str | Path) -> Path:
+    """
+    Write the invalid rows of an input to ``out_dir/<source>``, with an extra
+    ``invalid_checks`` column naming the checks each row failed.
+    """
+    path = Path(out_dir) / source
+    path.parent.mkdir(parents=True, exist_ok=True)
+    schema = lf.collect_schema()
+    lf.filter(invalid_rows(stage, schema)).with_columns(
+        failed_checks(stage, schema).alias("invalid_checks")
+    ).sink_parquet(path)
+    return path
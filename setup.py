@@ -10,7 +10,14 @@ setup(
         "pyparsing==3.2.5",
         "rdflib==7.5.0",
     ],
+    extras_require={
+        "oxigraph": ["pyoxigraph>=0.4"],
+        "zstd": ["zstandard>=0.22"],
+    },
     python_requires='>=3.8',
+    entry_points={
+        "console_scripts": ["meds2rdf=meds2rdf.cli:main"],
+    },
     description="Convert MEDS datasets into RDF using the MEDS Ontology",
     url="https://github.com/albertomarfoglia/meds2rdf",
     author="Alberto Marfoglia",
@@ -0,0 +1,54 @@
+import json
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+
+@pytest.fixture
+def meds_root(tmp_path):
+    """A small on-disk MEDS dataset with two data shards, codes, splits and labels."""
+    (tmp_path / "metadata").mkdir()
+    (tmp_path / "data" / "train").mkdir(parents=True)
+    (tmp_path / "labels" / "mortality").mkdir(parents=True)
+
+    with open(tmp_path / "metadata/dataset.json", "w") as f:
+        json.dump({"dataset_name": "Test MEDS", "meds_version": "0.4.0"}, f)
+
+    pl.DataFrame({
+        "subject_id": [1, 1, 1],
+        "time": [None, datetime(2025, 1, 1), datetime(2025, 1, 1, 5, 30)],
+        "code": ["DEMOGRAPHICS//GENDER", "DEMOGRAPHICS//AGE", "LAB//GLUCOSE"],
+        "numeric_value": [None, 45.0, 120.5],
+        "text_value": ["F", None, None],
+    }, schema_overrides={"subject_id": pl.Int64, "numeric_value": pl.Float32}).write_parquet(
+        tmp_path / "data/train/0.parquet"
+    )
+    pl.DataFrame({
+        "subject_id": [2, 2],
+        "time": [datetime(2025, 1, 3), datetime(2025, 1, 4)],
+        "code": ["DEMOGRAPHICS//AGE", "LAB//GLUCOSE"],
+        "numeric_value": [60.0, 99.0],
+        "text_value": [None, None],
+    }, schema_overrides={"subject_id": pl.Int64, "numeric_value": pl.Float32, "text_value": pl.String}).write_parquet(
+        tmp_path / "data/train/1.parquet"
+    )
+
+    pl.DataFrame({
+        "code": ["DEMOGRAPHICS//GENDER", "DEMOGRAPHICS//AGE", "LAB//GLUCOSE", "LAB//ROOT"],
+        "description": ["Sex", "Age in years", "Blood glucose", "Laboratory root"],
+        "parent_codes": [["ICD10:AAAA"], ["ICD10:AAAA"], ["LOINC:2345-7"], []],
+    }).write_parquet(tmp_path / "metadata/codes.parquet")
+
+    pl.DataFrame({
+        "subject_id": [1, 2],
+        "split": ["train", "held_out"],
+    }).write_parquet(tmp_path / "metadata/subject_splits.parquet")
+
+    pl.DataFrame({
+        "subject_id": [1, 2],
+        "prediction_time": [datetime(2025, 1, 2), datetime(2025, 1, 5)],
+        "boolean_value": [True, False],
+    }).write_parquet(tmp_path / "labels/mortality/0.parquet")
+
+    return tmp_path
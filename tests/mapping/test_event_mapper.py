@@ -27,4 +27,58 @@ def test_map_data_table_adds_event_triples():
     assert (code1_uri, MEDS.codeString, Literal("CODE1", datatype=XSD.string)) in graph
     assert (event_uris[0], MEDS.hasCode, code1_uri) in graph
 
-    assert (event_uris[1], None, MEDS.Event) in graph
\ No newline at end of file
+    assert (event_uris[1], None, MEDS.Event) in graph
+
+def test_map_data_table_accepts_dataframe_batches():
+    import polars as pl
+    from datetime import datetime
+    from pytest import raises
+
+    graph = Graph()
+    df = pl.DataFrame({
+        "subject_id": [7, 7],
+        "time": [datetime(2025, 1, 1), datetime(2025, 1, 1, 5, 30, 0, 250000)],
+        "code": ["LAB//A B", "LAB//A B"],
+        "numeric_value": [1.5, None],
+    }, schema_overrides={"numeric_value": pl.Float32})
+
+    event_uris = map_data_table(graph, df)
+
+    code_uri = URIRef(MEDS_INSTANCES["code/LAB//A%20B"])
+    assert (event_uris[0], MEDS.hasCode, code_uri) in graph
+    assert (event_uris[0], MEDS.time, Literal("2025-01-01T00:00:00", datatype=XSD.dateTime)) in graph
+    assert (event_uris[1], MEDS.time, Literal("2025-01-01T05:30:00.250000", datatype=XSD.dateTime)) in graph
+    assert (event_uris[0], MEDS.numericValue, Literal("1.5", datatype=XSD.double)) in graph
+    assert not list(graph.triples((event_uris[1], MEDS.numericValue, None)))
+
+    with raises(ValueError, match="Event must have field 'code'"):
+        map_data_table(graph, df.with_columns(code=pl.lit(None, dtype=pl.String)))
+
+def test_map_data_table_maps_declared_extension_columns():
+    import polars as pl
+    from rdflib import RDF
+    from meds2rdf.mapping.event_mapper import compile_event_plan
+    from meds2rdf.mapping.plan import column_property
+
+    graph = Graph()
+    df = pl.DataFrame({
+        "subject_id": [1, 2],
+        "code": ["LAB//GLUCOSE", "LAB//GLUCOSE"],
+        "unit": ["mg/dL", None],
+        "flags": [["H", "CRIT"], []],
+        "ignored": [1, 2],
+    })
+    plan = compile_event_plan(df.schema, ["unit", "flags", "code"])
+
+    assert plan.columns == ["unit", "flags"]
+    assert [rule.is_list for rule in plan.rules] == [False, True]
+
+    event_uris = map_data_table(graph, df, plan=plan)
+
+    unit, flags = column_property("unit"), column_property("flags")
+    assert (unit, RDF.type, RDF.Property) in graph
+    assert (event_uris[0], unit, Literal("mg/dL", datatype=XSD.string)) in graph
+    assert set(graph.objects(event_uris[0], flags)) == {Literal("H", datatype=XSD.string), Literal("CRIT", datatype=XSD.string)}
+    assert not list(graph.triples((event_uris[1], unit, None)))
+    assert not list(graph.triples((event_uris[1], flags, None)))
+    assert not list(graph.triples((None, column_property("ignored"), None)))
@@ -0,0 +1,53 @@
+import gzip
+import struct
+import pytest
+from meds2rdf import MedsRDFConverter
+from meds2rdf.sinks.compression import BlockCompressor, open_output, _bgzf_block, _BGZF_EOF
+
+def _bgzf_blocks(data: bytes) -> list[bytes]:
+    """Split a BGZF file on the block sizes stored in the headers."""
+    blocks = []
+    while data:
+        assert data[:4] == b"\x1f\x8b\x08\x04" and data[12:14] == b"BC"
+        size = struct.unpack("<H", data[16:18])[0] + 1
+        blocks.append(data[:size])
+        data = data[size:]
+    return blocks
+
+@pytest.mark.parametrize("compression", ["gzip", "bgzip"])
+def test_threaded_block_gzip_matches_plain_output(meds_root, tmp_path, compression):
+    plain, packed = tmp_path / "out.nt", tmp_path / "out.nt.gz"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(plain, include_labels=True)
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(
+        packed, include_labels=True, compression=compression, compression_threads=4
+    )
+    assert gzip.decompress(packed.read_bytes()) == plain.read_bytes()
+
+def test_bgzf_blocks_decompress_independently(tmp_path):
+    data = b"".join(b"<s%d> <p> <o> .\n" % i for i in range(20_000))
+    with open_output(tmp_path / "out.gz", "bgzip", threads=3) as out:
+        out.write(data[:1000])
+        out.write(data[1000:])
+
+    blocks = _bgzf_blocks((tmp_path / "out.gz").read_bytes())
+    assert len(blocks) > 3 and blocks[-1] == _BGZF_EOF
+    assert b"".join(gzip.decompress(block) for block in blocks) == data
+    # incompressible input still fits a block
+    assert len(_bgzf_block(bytes(range(256)) * 255)) <= 1 << 16
+
+def test_zstd_frames(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    data = bytes(range(256)) * 10_000
+    with BlockCompressor(open(tmp_path / "out.zst", "wb"), lambda b: zstandard.compress(b), 1 << 16, 4) as out:
+        out.write(data)
+    reader = zstandard.ZstdDecompressor().stream_reader(open(tmp_path / "out.zst", "rb"), read_across_frames=True)
+    assert reader.read() == data
+
+def test_zstd_parts(meds_root, tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    out = MedsRDFConverter(meds_root).convert_to_parts(tmp_path / "parts", compression="zstd", compression_threads=2)
+    parts = sorted(out.glob("part-*.nt.zst"))
+    assert parts
+    for part in parts:
+        text = zstandard.ZstdDecompressor().stream_reader(part.read_bytes(), read_across_frames=True).read()
+        assert text.endswith(b" .\n")
@@ -0,0 +1,23 @@
+from rdflib import Graph
+from rdflib.plugins.stores.memory import SimpleMemory
+from meds2rdf.converter import MedsRDFConverter
+from meds2rdf.mapping.split_mapper import map_split_table
+from meds2rdf.sinks import GraphSink
+
+def test_graph_sink_writes_in_commit_sized_batches():
+    graph = Graph()
+    sink = GraphSink(graph, commit_size=2)
+    map_split_table(sink, [{"subject_id": i, "split": "train"} for i in range(3)])
+
+    assert len(graph) == 2 and sink.commits == 1
+    sink.close()
+    assert len(graph) == 3 and sink.commits == 2
+
+def test_converter_uses_given_store(meds_root):
+    reference = MedsRDFConverter(meds_root, iri_strategy="hash").convert(include_labels=True)
+
+    converter = MedsRDFConverter(meds_root, iri_strategy="hash", store=SimpleMemory(), commit_size=7)
+    graph = converter.convert(include_labels=True, batch_size=2)
+
+    assert isinstance(graph.store, SimpleMemory)
+    assert set(graph) == set(reference)
@@ -0,0 +1,30 @@
+import io
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from meds2rdf.mapping.split_mapper import map_split_table
+from meds2rdf.sinks import NTriplesSink, NQuadsSink
+
+splits = [
+    {"subject_id": 1, "split": "train"},
+    {"subject_id": 2, "split": "held_out"},
+]
+
+def test_ntriples_sink_matches_graph_output():
+    graph = Graph()
+    map_split_table(graph, splits)
+
+    stream = io.BytesIO()
+    sink = NTriplesSink(stream, buffer_size=1)
+    map_split_table(sink, splits)
+    sink.close()
+
+    assert sink.count == 2
+    assert isomorphic(Graph().parse(data=stream.getvalue(), format="nt"), graph)
+
+def test_nquads_sink_buffers_until_flush():
+    stream = io.BytesIO()
+    sink = NQuadsSink(stream)
+    map_split_table(sink, splits)
+    assert stream.getvalue() == b""
+    sink.flush()
+    assert len(stream.getvalue().splitlines()) == 2
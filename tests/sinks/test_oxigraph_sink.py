@@ -0,0 +1,25 @@
+import io
+import pytest
+from rdflib import Graph
+from meds2rdf import MedsRDFConverter, SummaryReporter
+
+pyoxigraph = pytest.importorskip("pyoxigraph")
+
+def test_bulk_load_matches_streamed_output(meds_root, tmp_path):
+    nt = tmp_path / "out.nt"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(nt, include_labels=True)
+
+    reporter = SummaryReporter(io.StringIO(), progress_interval=None)
+    converter = MedsRDFConverter(meds_root, iri_strategy="hash", observer=reporter)
+    store = converter.convert_to_oxigraph(tmp_path / "store", commit_size=5, include_labels=True, workers=2)
+
+    assert len(store) == len(Graph().parse(nt, format="nt"))
+    assert reporter.load["commits"] > 1
+    # workers declare shared codes again, the store deduplicates them
+    assert reporter.load["triples"] >= len(nt.read_text().splitlines())
+
+def test_bulk_load_into_subject_graphs(meds_root):
+    store = MedsRDFConverter(meds_root, subject_graphs=True).convert_to_oxigraph(pyoxigraph.Store())
+    graphs = {g.value for g in store.named_graphs()}
+    assert "https://albertomarfoglia.github.io/meds-data/subject/1" in graphs
+    assert "https://albertomarfoglia.github.io/meds-data/graph/shared" in graphs
@@ -0,0 +1,80 @@
+import gzip
+import json
+from rdflib import RDF, Graph
+from meds2rdf.converter import MedsRDFConverter
+from meds2rdf.namespace import MEDS
+from meds2rdf.sinks import PartitionedSink
+from meds2rdf.manifest import file_fingerprint
+
+def _load_parts(out_dir):
+    manifest = json.loads((out_dir / "manifest.json").read_text())
+    graph = Graph()
+    for part in manifest["parts"]:
+        graph.parse(data=gzip.decompress((out_dir / part["file"]).read_bytes()), format="nt")
+    return manifest, graph
+
+def test_partition_by_shard_writes_one_part_per_input(meds_root, tmp_path):
+    out = tmp_path / "out"
+    MedsRDFConverter(meds_root).convert_to_parts(out, include_labels=True)
+    manifest, graph = _load_parts(out)
+
+    assert [part["sources"] for part in manifest["parts"]] == [
+        ["metadata/dataset.json"],
+        ["data/train/0.parquet"],
+        ["data/train/1.parquet"],
+        ["metadata/codes.parquet"],
+        ["labels/mortality/0.parquet"],
+    ]
+    assert manifest["triples"] == sum(part["triples"] for part in manifest["parts"])
+    for part in manifest["parts"]:
+        assert part["sha256"] == file_fingerprint(out / part["file"])["sha256"]
+    assert len(list(graph.subjects(None, MEDS.Event))) == 5
+
+def test_partition_by_subject_keeps_subjects_together(meds_root, tmp_path):
+    out = tmp_path / "out"
+    MedsRDFConverter(meds_root).convert_to_parts(
+        out, partition_by="subject", buckets=4, workers=2, include_labels=True, include_splits=True
+    )
+    manifest, graph = _load_parts(out)
+
+    # at most one part per bucket, plus the shared nodes' part
+    assert len(manifest["parts"]) <= 5
+    buckets = {}
+    for part in manifest["parts"]:
+        part_graph = Graph().parse(data=gzip.decompress((out / part["file"]).read_bytes()), format="nt")
+        if "bucket" not in part:
+            assert list(part_graph.subjects(RDF.type, MEDS.Code))
+            assert not list(part_graph.subjects(MEDS.hasSubject, None))
+            continue
+        # the subject node, its split, events and labels all share the subject's bucket
+        for node in part_graph.subjects(RDF.type, MEDS.Subject):
+            assert buckets.setdefault(node, part["bucket"]) == part["bucket"]
+        for node, subject in part_graph.subject_objects(MEDS.hasSubject):
+            assert buckets.setdefault(subject, part["bucket"]) == part["bucket"]
+        for subject in part_graph.subjects(MEDS.assignedSplit, None):
+            assert buckets.setdefault(subject, part["bucket"]) == part["bucket"]
+    assert len(buckets) == 2
+    assert len(list(graph.subjects(None, MEDS.Event))) == 5
+    assert len(list(graph.subjects(None, MEDS.LabelSample))) == 2
+
+def test_partition_by_size_rolls_over(meds_root, tmp_path):
+    out = tmp_path / "out"
+    with PartitionedSink(out, partition_by="size", max_part_size=1, compression=None) as sink:
+        MedsRDFConverter(meds_root).convert_to_stream(sink, include_codes=False, batch_size=1)
+    manifest = json.loads((out / "manifest.json").read_text())
+
+    assert len(manifest["parts"]) > 1
+    assert all(part["file"].endswith(".nt") for part in manifest["parts"])
+    assert sum(len((out / p["file"]).read_text().splitlines()) for p in manifest["parts"]) == manifest["triples"]
+
+def test_partition_by_task_separates_label_tasks(meds_root, tmp_path):
+    import shutil
+    (meds_root / "labels/readmission").mkdir()
+    shutil.copy(meds_root / "labels/mortality/0.parquet", meds_root / "labels/readmission/0.parquet")
+
+    out = tmp_path / "out"
+    MedsRDFConverter(meds_root).convert_to_parts(out, partition_by="task", include_labels=True)
+    manifest, _ = _load_parts(out)
+
+    assert [part.get("task") for part in manifest["parts"]] == [None, "mortality", "readmission"]
+    assert manifest["parts"][1]["sources"] == ["labels/mortality/0.parquet"]
@@ -0,0 +1,38 @@
+import polars as pl
+from rdflib import BNode, Graph, Literal, URIRef
+from meds2rdf import MedsRDFConverter
+
+def _decode(out_dir):
+    terms = pl.read_parquet(out_dir / "terms" / "*.parquet")
+    triples = pl.read_parquet(out_dir / "triples" / "*.parquet")
+    node = {}
+    for id, kind, value, datatype, lang in terms.iter_rows():
+        if kind == "literal":
+            node[id] = Literal(value, datatype=datatype, lang=lang)
+        else:
+            node[id] = URIRef(value) if kind == "iri" else BNode(value)
+    return terms, triples, {(node[s], node[p], node[o]) for s, p, o in triples.select("s", "p", "o").iter_rows()}
+
+def test_triple_table_decodes_to_streamed_output(meds_root, tmp_path):
+    nt = tmp_path / "out.nt"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(nt, include_labels=True)
+
+    out = MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_triple_table(
+        tmp_path / "table", commit_size=7, include_labels=True
+    )
+    terms, triples, decoded = _decode(out)
+
+    assert len(list((out / "triples").glob("*.parquet"))) > 1
+    assert triples.schema == pl.Schema({"s": pl.Int64, "p": pl.Int64, "o": pl.Int64})
+    assert terms["id"].is_unique().all()
+    assert terms.select("kind", "value", "datatype", "lang").is_unique().all()
+    assert decoded == set(Graph().parse(nt, format="nt"))
+
+def test_triple_table_with_subject_graphs(meds_root, tmp_path):
+    out = MedsRDFConverter(meds_root, subject_graphs=True).convert_to_triple_table(tmp_path / "table")
+    terms = pl.read_parquet(out / "terms" / "*.parquet")
+    triples = pl.read_parquet(out / "triples" / "*.parquet")
+
+    graphs = set(triples.join(terms, left_on="g", right_on="id")["value"])
+    assert "https://albertomarfoglia.github.io/meds-data/subject/1" in graphs
+    assert "https://albertomarfoglia.github.io/meds-data/graph/shared" in graphs
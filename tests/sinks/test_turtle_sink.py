@@ -0,0 +1,33 @@
+import io
+from rdflib import RDF, Graph, Literal, URIRef, XSD
+from rdflib.compare import isomorphic
+from meds2rdf import MedsRDFConverter
+from meds2rdf.namespace import MEDS, MEDS_INSTANCES
+from meds2rdf.sinks import TurtleSink
+
+def test_turtle_file_matches_ntriples(meds_root, tmp_path):
+    nt, ttl = tmp_path / "out.nt", tmp_path / "out.ttl"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(nt, include_labels=True, include_splits=True)
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(
+        ttl, format="ttl", include_labels=True, include_splits=True, workers=2, batch_size=2
+    )
+
+    assert isomorphic(Graph().parse(ttl, format="turtle"), Graph().parse(nt, format="nt"))
+    assert ttl.stat().st_size < nt.stat().st_size / 2
+
+def test_turtle_groups_predicates_and_objects():
+    stream = io.BytesIO()
+    event, code = MEDS_INSTANCES["event/1"], MEDS_INSTANCES["code/LAB%2F%2FA/../B"]
+    with TurtleSink(stream) as sink:
+        sink.add((event, RDF.type, MEDS.Event))
+        sink.add((event, MEDS.hasSubject, MEDS_INSTANCES["subject/1"]))
+        sink.add((event, MEDS.hasCode, code))
+        sink.add((event, MEDS.hasCode, URIRef("http://example.org/other")))
+        sink.add((code, MEDS.codeString, Literal('say "hi"\n', datatype=XSD.string)))
+
+    text = stream.getvalue().decode()
+    assert "<event/1> a meds:Event ;\n    meds:hasSubject <subject/1> ;\n    meds:hasCode " in text
+    assert "rdf:type" not in text
+    # dot segments would be removed when resolving a relative IRI
+    assert f"<{code}>, <http://example.org/other> .\n" in text
+    assert f'<{code}> meds:codeString "say \\"hi\\"\\n"^^xsd:string .\n' in text
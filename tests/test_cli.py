@@ -0,0 +1,26 @@
+import gzip
+import subprocess
+import sys
+import pytest
+from rdflib import Graph
+from meds2rdf.cli import main
+from meds2rdf.namespace import MEDS
+
+def test_cli_streams_compressed_ntriples(meds_root, tmp_path, capsys):
+    out = tmp_path / "out.nt.gz"
+    assert main([str(meds_root), str(out), "--compression", "gzip", "--labels", "-b", "1e3", "--progress", "0"]) == 0
+
+    graph = Graph().parse(data=gzip.decompress(out.read_bytes()), format="nt")
+    assert len(list(graph.subjects(None, MEDS.Event))) == 5
+    assert len(list(graph.subjects(None, MEDS.LabelSample))) == 2
+    assert "total" in capsys.readouterr().err
+
+def test_cli_rejects_inconsistent_options(meds_root, tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(meds_root), str(tmp_path / "out"), "--partition-by", "size"])
+    with pytest.raises(SystemExit):
+        main([str(meds_root), str(tmp_path / "out.xml"), "-f", "xml", "--compression", "gzip"])
+
+def test_cli_help_does_not_import_converter():
+    code = "import sys; from meds2rdf.cli import build_parser; build_parser(); print('polars' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True).stdout.strip() == "False"
@@ -153,36 +153,39 @@ mock_labels = [
 SHACL_SHAPES_URL = "https://raw.githubusercontent.com/albertomarfoglia/meds-ontology/refs/heads/main/shacl/meds-shapes.ttl"
 
 
-def test_convert_and_validate_shacl(monkeypatch):
+def write_mock_dataset(root):
+    """Materialize the mocks above as an on-disk MEDS directory."""
+    import json
+    import polars as pl
+
+    (root / "metadata").mkdir(parents=True)
+    (root / "data").mkdir()
+    (root / "labels" / "task").mkdir(parents=True)
+
+    with open(root / "metadata/dataset.json", "w") as f:
+        json.dump(mock_dataset_metadata, f)
+
+    pl.DataFrame(mock_data).write_parquet(root / "data/0.parquet")
+    pl.DataFrame(mock_codes).write_parquet(root / "metadata/codes.parquet")
+    pl.DataFrame(mock_splits).write_parquet(root / "metadata/subject_splits.parquet")
+    pl.DataFrame(mock_labels).write_parquet(root / "labels/task/0.parquet")
+
+
+def test_convert_and_validate_shacl(tmp_path):
     """
     Tests that the output RDF graph from MedsRDFConverter conforms to the MEDS SHACL shapes.
     """
 
-    # -- 1. Mock out filesystem + read_parquet just like in your previous test
-    import polars as pl
-    from pathlib import Path
-    import json
-    from unittest.mock import MagicMock, mock_open, patch
-
-    with patch("builtins.open", mock_open(read_data=json.dumps(mock_dataset_metadata))), \
-         patch("pathlib.Path.exists", return_value=True), \
-         patch("polars.read_parquet") as mock_pl_read:
-
-        # Make Polars return our mock objects
-        mock_pl_read.side_effect = [
-            MagicMock(to_dicts=lambda: mock_data),    # data/**/*.parquet
-            MagicMock(to_dicts=lambda: mock_codes),   # codes
-            MagicMock(to_dicts=lambda: mock_splits),  # splits
-            MagicMock(to_dicts=lambda: mock_labels),  # labels
-        ]
-
-        converter = MedsRDFConverter("dummy/path")
-        data_graph = converter.convert(
-            include_dataset_metadata=True,
-            include_codes=True,
-            include_labels=True,
-            include_splits=True,
-        )
+    # -- 1. Write the mocks to disk and convert them
+    write_mock_dataset(tmp_path)
+
+    converter = MedsRDFConverter(tmp_path)
+    data_graph = converter.convert(
+        include_dataset_metadata=True,
+        include_codes=True,
+        include_labels=True,
+        include_splits=True,
+    )
 
     # Sanity check — we *have* an rdflib.Graph
     assert isinstance(data_graph, Graph)
@@ -0,0 +1,88 @@
+from rdflib import Graph
+from meds2rdf.converter import MedsRDFConverter
+from meds2rdf.namespace import MEDS
+
+def test_convert_to_file_streams_ntriples(meds_root, tmp_path):
+    out = tmp_path / "out.nt"
+    converter = MedsRDFConverter(meds_root)
+    converter.convert_to_file(out, format="nt", include_splits=True, include_labels=True)
+
+    # nothing is accumulated in memory
+    assert len(converter.graph) == 0
+
+    graph = Graph().parse(out, format="nt")
+    assert len(list(graph.subjects(None, MEDS.Event))) == 5
+    assert len(list(graph.subjects(None, MEDS.LabelSample))) == 2
+
+def test_hash_iri_strategy_is_reproducible(meds_root, tmp_path):
+    first = tmp_path / "first.nt"
+    second = tmp_path / "second.nt"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(first, include_labels=True)
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(second, include_labels=True)
+
+    assert first.read_bytes() == second.read_bytes()
+
+def test_batched_conversion_matches_whole_file(meds_root, tmp_path):
+    whole = tmp_path / "whole.nt"
+    batched = tmp_path / "batched.nt"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(whole, include_labels=True)
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(batched, include_labels=True, batch_size=1)
+
+    assert sorted(whole.read_text().splitlines()) == sorted(batched.read_text().splitlines())
+
+def test_labels_are_filtered_by_task_and_put_in_task_graphs(meds_root, tmp_path):
+    import shutil
+    from rdflib import Dataset
+    from meds2rdf.utils.iri import task_graph_iri
+
+    (meds_root / "labels/readmission").mkdir()
+    shutil.copy(meds_root / "labels/mortality/0.parquet", meds_root / "labels/readmission/0.parquet")
+    converter = MedsRDFConverter(meds_root)
+
+    only = tmp_path / "only.nt"
+    converter.convert_to_file(only, include_labels=True, tasks=["readmission"])
+    assert len(list(Graph().parse(only, format="nt").subjects(None, MEDS.LabelSample))) == 2
+
+    out = tmp_path / "out.nq"
+    converter.convert_to_file(out, format="nq", task_graphs=True, include_labels=True)
+    dataset = Dataset().parse(out, format="nquads")
+    for task in ("mortality", "readmission"):
+        graph = dataset.graph(task_graph_iri(task))
+        assert len(list(graph.subjects(None, MEDS.LabelSample))) == 2
+        assert not list(graph.subjects(None, MEDS.Event))
+
+def test_subject_graphs_hold_each_subjects_triples(meds_root, tmp_path):
+    from rdflib import Dataset, URIRef
+    from meds2rdf.namespace import MEDS_INSTANCES
+    from meds2rdf.sinks import SHARED_GRAPH
+
+    out = tmp_path / "out.nq"
+    MedsRDFConverter(meds_root, subject_graphs=True).convert_to_file(
+        out, format="nq", include_labels=True, include_splits=True, workers=2
+    )
+    dataset = Dataset().parse(out, format="nquads")
+
+    subject_1 = dataset.graph(URIRef(MEDS_INSTANCES["subject/1"]))
+    assert len(list(subject_1.subjects(None, MEDS.Event))) == 3
+    assert len(list(subject_1.subjects(None, MEDS.LabelSample))) == 1
+    assert (URIRef(MEDS_INSTANCES["subject/1"]), MEDS.assignedSplit, MEDS.trainSplit) in subject_1
+    assert not list(subject_1.subjects(None, MEDS.Code))
+    assert len(list(dataset.graph(SHARED_GRAPH).subjects(None, MEDS.Code))) >= 3
+
+    graph = MedsRDFConverter(meds_root, subject_graphs=True).convert()
+    assert len(list(graph.graph(URIRef(MEDS_INSTANCES["subject/2"])).subjects(None, MEDS.Event))) == 2
+
+def test_subject_graphs_serialize_to_turtle(meds_root, tmp_path):
+    import pytest
+    from rdflib.compare import isomorphic
+
+    converter = MedsRDFConverter(meds_root, subject_graphs=True)
+    dataset = converter.convert(include_labels=True)
+    converter.to_turtle(tmp_path / "out.ttl")
+    converter.to_nt(tmp_path / "out.nt")
+
+    turtle = Graph().parse(tmp_path / "out.ttl", format="turtle")
+    assert len(turtle) == len(list(dataset.quads())) > 0
+    assert isomorphic(turtle, Graph().parse(tmp_path / "out.nt", format="nt"))
+    with pytest.raises(ValueError, match="N-Quads"):
+        converter.to_xml(tmp_path / "out.xml")
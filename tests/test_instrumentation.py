@@ -0,0 +1,53 @@
+import io
+from meds2rdf import MedsRDFConverter, ConversionObserver, SummaryReporter
+
+class RecordingObserver(ConversionObserver):
+    def __init__(self):
+        self.inputs = []
+        self.stages = {}
+        self.progress_calls = 0
+
+    def input_finished(self, stage, source, seconds, rows, triples, bytes_written):
+        self.inputs.append((stage, source, rows, triples))
+
+    def stage_finished(self, stage, seconds, rows, triples, bytes_written):
+        self.stages[stage] = (rows, triples, bytes_written)
+
+    def progress(self, stage, elapsed, rows, triples, bytes_written):
+        self.progress_calls += 1
+
+def test_observer_receives_per_stage_and_per_shard_counts(meds_root, tmp_path):
+    observer = RecordingObserver()
+    converter = MedsRDFConverter(meds_root, observer=observer)
+    converter.convert_to_file(tmp_path / "out.nt", include_splits=True, include_labels=True)
+
+    assert list(observer.stages) == ["metadata", "data", "codes", "splits", "labels"]
+    assert [i[1] for i in observer.inputs if i[0] == "data"] == ["data/train/0.parquet", "data/train/1.parquet"]
+    assert observer.stages["data"][0] == 5
+    assert sum(s[1] for s in observer.stages.values()) == len((tmp_path / "out.nt").read_text().splitlines())
+    assert sum(s[2] for s in observer.stages.values()) == (tmp_path / "out.nt").stat().st_size
+    assert observer.progress_calls >= len(observer.inputs)
+
+def test_summary_reporter_prints_table(meds_root):
+    stream = io.StringIO()
+    MedsRDFConverter(meds_root, observer=SummaryReporter(stream, progress_interval=None)).convert()
+
+    summary = stream.getvalue()
+    assert "data" in summary and "total" in summary
+
+class StageTimes(ConversionObserver):
+    def __init__(self):
+        self.seconds = {}
+
+    def stage_finished(self, stage, seconds, rows, triples, bytes_written):
+        self.seconds[stage] = seconds
+
+def test_parallel_worker_time_is_attributed_to_data(meds_root, tmp_path):
+    in_memory, parts = StageTimes(), StageTimes()
+    MedsRDFConverter(meds_root, observer=in_memory).convert(workers=2)
+    MedsRDFConverter(meds_root, observer=parts).convert_to_directory(tmp_path / "parts", workers=2)
+
+    for observer in (in_memory, parts):
+        # spawning the pool alone takes longer than mapping dataset.json
+        assert list(observer.seconds)[:2] == ["metadata", "data"]
+        assert observer.seconds["metadata"] < observer.seconds["data"]
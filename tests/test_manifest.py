@@ -0,0 +1,49 @@
+import json
+import polars as pl
+from meds2rdf.converter import MedsRDFConverter
+from meds2rdf.manifest import ShardManifest
+
+def test_incremental_conversion_remaps_only_changed_inputs(meds_root, tmp_path):
+    out = tmp_path / "out"
+    converter = MedsRDFConverter(meds_root)
+    converter.convert_to_directory(out, include_labels=True, include_splits=True)
+
+    manifest = ShardManifest.load(out)
+    assert set(manifest.entries) == {
+        "metadata/dataset.json",
+        "data/train/0.parquet",
+        "data/train/1.parquet",
+        "metadata/codes.parquet",
+        "metadata/subject_splits.parquet",
+        "labels/mortality/0.parquet",
+    }
+    unchanged = (out / "data/train/0.nt").read_bytes()
+    changed = (out / "data/train/1.nt").read_bytes()
+
+    pl.read_parquet(meds_root / "data/train/1.parquet").head(1).write_parquet(meds_root / "data/train/1.parquet")
+    (meds_root / "labels/mortality/0.parquet").unlink()
+
+    converter.convert_to_directory(out, incremental=True, include_labels=True, include_splits=True)
+
+    # uuid IRIs: identical bytes mean the part was not re-mapped
+    assert (out / "data/train/0.nt").read_bytes() == unchanged
+    assert (out / "data/train/1.nt").read_bytes() != changed
+    assert not (out / "labels/mortality/0.nt").exists()
+    assert "labels/mortality/0.parquet" not in json.loads((out / "manifest.json").read_text())["inputs"]
+
+def test_incremental_conversion_remaps_codes_of_changed_selection(meds_root, tmp_path):
+    out = tmp_path / "out"
+    converter = MedsRDFConverter(meds_root)
+    converter.convert_to_directory(out, code_prefixes=["LAB//"], include_splits=True)
+    codes = (out / "metadata/codes.nt").read_bytes()
+
+    converter.convert_to_directory(out, incremental=True, code_prefixes=["LAB//"], include_splits=True)
+    assert (out / "metadata/codes.nt").read_bytes() == codes
+
+    pl.read_parquet(meds_root / "data/train/1.parquet").with_columns(code=pl.lit("LAB//ROOT")).write_parquet(
+        meds_root / "data/train/1.parquet"
+    )
+    converter.convert_to_directory(out, incremental=True, code_prefixes=["LAB//"], include_splits=True)
+
+    # the codes part follows the codes the selected events now reference
+    assert "Laboratory root" in (out / "metadata/codes.nt").read_text()
@@ -0,0 +1,27 @@
+from pathlib import Path
+from rdflib import Graph
+from meds2rdf.converter import MedsRDFConverter
+from meds2rdf.namespace import MEDS
+from meds2rdf.parallel import list_data_shards, map_data_shards_parallel, read_part
+
+def test_parallel_parts_follow_shard_order(meds_root):
+    shards = list_data_shards(meds_root)
+    parts, rows, graphs = [], [], []
+    for part, n, _ in map_data_shards_parallel(shards, 2, meds_root, batch_size=1):
+        parts.append(part)
+        rows.append(n)
+        graphs.append(Graph().parse(data=b"".join(read_part(part, chunk_size=64)), format="nt"))
+
+    assert rows == [3, 2]
+    assert len(list(graphs[0].subjects(None, MEDS.Event))) == 3
+    # workers wrote temporary files, removed once merged
+    assert not any(Path(part).exists() for part in parts)
+
+def test_convert_with_workers_matches_single_process(meds_root, tmp_path):
+    single = MedsRDFConverter(meds_root).convert()
+    parallel = MedsRDFConverter(meds_root).convert(workers=2)
+    assert len(parallel) == len(single)
+
+    out = MedsRDFConverter(meds_root).convert_to_file(tmp_path / "out.nt", workers=2)
+    graph = Graph().parse(out, format="nt")
+    assert len(list(graph.subjects(None, MEDS.Event))) == 5
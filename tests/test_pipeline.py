@@ -0,0 +1,33 @@
+import gzip
+import io
+import pytest
+from meds2rdf.converter import MedsRDFConverter
+from meds2rdf.pipeline import BackgroundWriter, read_ahead
+
+def test_read_ahead_keeps_order_and_reraises():
+    assert list(read_ahead(iter(range(100)), depth=2)) == list(range(100))
+
+    def failing():
+        yield 1
+        raise RuntimeError("corrupt batch")
+
+    with pytest.raises(RuntimeError, match="corrupt batch"):
+        list(read_ahead(failing(), depth=2))
+
+def test_background_writer_writes_everything_on_close():
+    stream = io.BytesIO()
+    stream.close = lambda: None
+    with BackgroundWriter(stream, depth=1) as writer:
+        for i in range(50):
+            writer.write(f"{i}\n".encode())
+    assert stream.getvalue().decode().split() == [str(i) for i in range(50)]
+
+def test_pipelined_conversion_matches_sequential(meds_root, tmp_path):
+    sequential = tmp_path / "sequential.nt"
+    pipelined = tmp_path / "pipelined.nt.gz"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(sequential, include_labels=True, batch_size=1)
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(
+        pipelined, compression="gzip", include_labels=True, batch_size=1, pipeline_depth=2
+    )
+
+    assert gzip.decompress(pipelined.read_bytes()) == sequential.read_bytes()
@@ -0,0 +1,93 @@
+from datetime import datetime
+import pytest
+import polars as pl
+from meds2rdf.converter import MedsRDFConverter
+from meds2rdf.namespace import MEDS, MEDS_INSTANCES
+from meds2rdf.parallel import list_data_shards
+from meds2rdf.scan import Selection, subject_sample
+
+def test_selection_resolves_referenced_subjects_and_codes(meds_root):
+    selection = Selection(code_prefixes=["LAB//"], time_range=(datetime(2025, 1, 2), None))
+    selection.resolve(list_data_shards(meds_root))
+
+    assert selection.subjects.to_list() == [2]
+    assert selection.codes.to_list() == ["LAB//GLUCOSE"]
+
+def test_convert_subject_subset(meds_root):
+    graph = MedsRDFConverter(meds_root).convert(
+        subject_ids=[2], columns=["time"], include_splits=True, include_labels=True
+    )
+
+    subject = MEDS_INSTANCES["subject/2"]
+    events = list(graph.subjects(MEDS.hasSubject, None))
+    assert events and all((e, MEDS.hasSubject, subject) in graph for e in events)
+    assert not list(graph.triples((None, MEDS.numericValue, None)))
+    # only the codes used by subject 2's events
+    assert len(list(graph.subjects(MEDS.codeDescription, None))) == 2
+    assert len(list(graph.subjects(None, MEDS.LabelSample))) == 1
+    assert len(list(graph.triples((None, MEDS.assignedSplit, None)))) == 1
+
+def test_subject_sample_is_deterministic_and_consistent(meds_root):
+    subjects = pl.DataFrame({"subject_id": list(range(10_000))})
+    sampled = subjects.filter(subject_sample(0.1, seed=7))["subject_id"]
+    assert 900 < len(sampled) < 1100
+    assert sampled.to_list() == subjects.filter(subject_sample(0.1, seed=7))["subject_id"].to_list()
+    assert sampled.to_list() != subjects.filter(subject_sample(0.1, seed=8))["subject_id"].to_list()
+
+    # pick a seed that keeps subject 2 only
+    both = pl.DataFrame({"subject_id": [1, 2]})
+    seed = next(s for s in range(100) if both.filter(subject_sample(0.5, s))["subject_id"].to_list() == [2])
+    graph = MedsRDFConverter(meds_root).convert(
+        sample_fraction=0.5, sample_seed=seed, include_splits=True, include_labels=True
+    )
+    assert set(graph.objects(None, MEDS.hasSubject)) == {MEDS_INSTANCES["subject/2"]}
+    assert list(graph.subjects(MEDS.assignedSplit, None)) == [MEDS_INSTANCES["subject/2"]]
+    assert len(list(graph.subjects(None, MEDS.LabelSample))) == 1
+    assert len(list(graph.subjects(MEDS.codeDescription, None))) == 2
+
+def test_hashed_iris_do_not_depend_on_the_selection(meds_root, tmp_path):
+    full, subset = tmp_path / "full.nt", tmp_path / "subset.nt"
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(full, include_labels=True)
+    MedsRDFConverter(meds_root, iri_strategy="hash").convert_to_file(
+        subset, include_labels=True, subject_ids=[2], code_prefixes=["LAB//"], columns=["numeric_value"], workers=2
+    )
+
+    triples = set(full.read_text().splitlines())
+    assert set(subset.read_text().splitlines()) - triples == set()
+    # the subset is a strict one: events of subject 1 and the DEMOGRAPHICS code are left out
+    assert len(subset.read_text().splitlines()) < len(triples)
+
+def test_time_range_with_columns_outside_the_projection(meds_root):
+    graph = MedsRDFConverter(meds_root).convert(
+        time_range=(datetime(2025, 1, 2), None), columns=["numeric_value"], include_codes=False
+    )
+
+    # subject 2's two events and subject 1's static one; time was filtered on but not mapped
+    assert len(list(graph.subjects(MEDS.hasSubject, None))) == 3
+    assert not list(graph.triples((None, MEDS.time, None)))
+    assert len(list(graph.triples((None, MEDS.numericValue, None)))) == 2
+
+@pytest.mark.parametrize("time_zone", [None, "offset", "UTC", "Europe/Rome"])
+def test_time_range_on_aware_and_string_times(meds_root, time_zone):
+    from datetime import timezone
+
+    strings = {
+        None: pl.col("time").dt.to_string(),
+        # offset strings are compared in UTC
+        "offset": pl.col("time").dt.replace_time_zone("UTC").dt.convert_time_zone("Europe/Rome").dt.to_string("%FT%T%:z"),
+    }
+    for shard in list_data_shards(meds_root):
+        df = pl.read_parquet(shard)
+        time = strings[time_zone] if time_zone in strings else pl.col("time").dt.replace_time_zone(time_zone)
+        df.with_columns(time=time).write_parquet(shard)
+    converter = MedsRDFConverter(meds_root)
+
+    # naive bounds are in the column's time zone, aware ones are converted to it
+    naive = converter.convert(time_range=(datetime(2025, 1, 2), "2025-01-04"), include_codes=False)
+    aware = MedsRDFConverter(meds_root).convert(
+        time_range=(datetime(2025, 1, 2, tzinfo=timezone.utc), None), include_codes=False
+    )
+
+    # the static event and subject 2's first event
+    assert len(list(naive.subjects(MEDS.hasSubject, None))) == 2
+    assert len(list(aware.subjects(MEDS.hasSubject, None))) == 3
@@ -0,0 +1,38 @@
+import polars as pl
+from meds2rdf.synthetic import generate_meds_dataset
+
+def test_generate_meds_dataset_shape(tmp_path):
+    root = generate_meds_dataset(
+        tmp_path, n_subjects=20, events_per_subject=10, n_codes=30, n_shards=3, n_label_tasks=2
+    )
+
+    data = pl.read_parquet(str(root / "data/*.parquet"))
+    assert data.height == 200
+    assert data["subject_id"].n_unique() == 20
+    assert sorted(p.name for p in (root / "data").iterdir()) == ["0.parquet", "1.parquet", "2.parquet"]
+
+    # every event code is described in codes.parquet
+    codes = pl.read_parquet(root / "metadata/codes.parquet")
+    assert data["code"].is_in(codes["code"].implode()).all()
+
+    splits = pl.read_parquet(root / "metadata/subject_splits.parquet")
+    assert splits["split"].is_in(["train", "tuning", "held_out"]).all()
+    assert len(list((root / "labels").rglob("*.parquet"))) == 2
+
+    # deterministic for a given seed
+    again = generate_meds_dataset(tmp_path / "again", n_subjects=20, events_per_subject=10, n_codes=30, n_shards=3)
+    assert pl.read_parquet(str(again / "data/*.parquet")).equals(data)
+
+def test_uniform_draws_follow_splitmix64():
+    from meds2rdf.synthetic import _uniform
+
+    def splitmix64(x, seed):
+        mask = (1 << 64) - 1
+        x = (x + (seed + 1) * 0x9E3779B97F4A7C15) & mask
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & mask
+        return x ^ (x >> 31)
+
+    # a fixed mixer rather than Expr.hash, which may change with the Polars version
+    draws = pl.select(_uniform(pl.int_range(5, dtype=pl.Int64), 3)).to_series().to_list()
+    assert draws == [(splitmix64(i, 3) >> 11) / 2.0**53 for i in range(5)]
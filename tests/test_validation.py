@@ -0,0 +1,73 @@
+import json
+import polars as pl
+import pytest
+from meds2rdf import MedsRDFConverter, InvalidRowsError
+from meds2rdf.namespace import MEDS
+
+@pytest.fixture
+def invalid_root(meds_root):
+    """The test dataset with a null code, an unknown split and an unknown parent code prefix."""
+    pl.DataFrame({
+        "subject_id": [3, 3],
+        "time": [None, None],
+        "code": ["DEMOGRAPHICS//AGE", None],
+    }, schema_overrides={"subject_id": pl.Int64, "time": pl.Datetime, "code": pl.String}).write_parquet(
+        meds_root / "data/train/2.parquet"
+    )
+    pl.DataFrame({
+        "subject_id": [1, 2, 3],
+        "split": ["train", "held_out", "validation"],
+    }).write_parquet(meds_root / "metadata/subject_splits.parquet")
+    pl.DataFrame({
+        "code": ["LAB//GLUCOSE", "LAB//ROOT"],
+        "parent_codes": [["LOINC:2345-7", "SNOMED:1234"], []],
+    }).write_parquet(meds_root / "metadata/codes.parquet")
+    return meds_root
+
+def test_valid_dataset_passes(meds_root):
+    converter = MedsRDFConverter(meds_root, on_invalid="raise")
+    converter.convert(include_splits=True, include_labels=True)
+
+    assert converter.validation_report.ok
+    assert converter.validation_report.rows == 5 + 4 + 2 + 2
+
+def test_invalid_rows_are_reported_before_mapping(invalid_root):
+    converter = MedsRDFConverter(invalid_root, on_invalid="raise")
+    with pytest.raises(InvalidRowsError) as error:
+        converter.convert(include_splits=True)
+
+    issues = {(i["source"], i["check"]): i for i in error.value.report.issues}
+    assert set(issues) == {
+        ("data/train/2.parquet", "missing code"),
+        ("metadata/codes.parquet", "unknown parent_codes prefix"),
+        ("metadata/subject_splits.parquet", "unknown split"),
+    }
+    assert issues[("metadata/subject_splits.parquet", "unknown split")]["examples"] == ["validation"]
+    assert issues[("metadata/codes.parquet", "unknown parent_codes prefix")]["examples"] == ["SNOMED:1234"]
+    # nothing was mapped
+    assert len(converter.graph) == 0
+
+def test_invalid_rows_are_dropped(invalid_root):
+    graph = MedsRDFConverter(invalid_root, on_invalid="drop").convert(include_splits=True, workers=2)
+
+    assert len(list(graph.triples((None, MEDS.assignedSplit, None)))) == 2
+    assert len(list(graph.subjects(MEDS.hasSubject, None))) == 6
+    assert not list(graph.triples((None, MEDS.parentCode, None)))
+
+def test_invalid_rows_are_quarantined(invalid_root, tmp_path):
+    out = tmp_path / "quarantine"
+    MedsRDFConverter(invalid_root, on_invalid="quarantine", quarantine_dir=out).convert(include_splits=True)
+
+    splits = pl.read_parquet(out / "metadata/subject_splits.parquet")
+    assert splits["subject_id"].to_list() == [3]
+    assert splits["invalid_checks"].to_list() == [["unknown split"]]
+    assert pl.read_parquet(out / "data/train/2.parquet").height == 1
+    assert len(json.loads((out / "report.json").read_text())["issues"]) == 3
+
+def test_missing_column_fails_every_row(meds_root):
+    pl.DataFrame({"subject_id": [4, 4, 4, 4]}).write_parquet(meds_root / "data/train/2.parquet")
+    with pytest.raises(InvalidRowsError) as error:
+        MedsRDFConverter(meds_root, on_invalid="raise").convert()
+
+    [issue] = error.value.report.issues
+    assert (issue["source"], issue["check"], issue["rows"]) == ("data/train/2.parquet", "missing code", 4)
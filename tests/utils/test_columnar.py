@@ -0,0 +1,62 @@
+from datetime import datetime
+import polars as pl
+import pytest
+from rdflib.namespace import XSD
+from meds2rdf.utils.columnar import LexicalFormat, lexical_expr
+
+def _lexical(values, xsd_type, fmt=None, dtype=None):
+    df = pl.DataFrame({"v": values}, schema={"v": dtype} if dtype else None)
+    return df.select(lexical_expr("v", df.schema["v"], xsd_type, fmt)).to_series().to_list()
+
+def test_datetime_lexical_forms():
+    times = [datetime(2025, 1, 1), datetime(2025, 1, 1, 5, 30, 0, 250000), None]
+    assert _lexical(times, XSD.dateTime) == ["2025-01-01T00:00:00", "2025-01-01T05:30:00.250000", None]
+    assert _lexical(times, XSD.dateTime, LexicalFormat(time_precision="ms")) == [
+        "2025-01-01T00:00:00.000", "2025-01-01T05:30:00.250", None,
+    ]
+    assert _lexical(times[:1], XSD.dateTime, LexicalFormat(time_zone="UTC")) == ["2025-01-01T00:00:00+00:00"]
+
+    # strings are normalized the same way, unparseable ones are kept
+    strings = ["2025-01-01 05:30:00.250", "2025-01-01T00:00:00", "yesterday"]
+    assert _lexical(strings, XSD.dateTime) == ["2025-01-01T05:30:00.250000", "2025-01-01T00:00:00", "yesterday"]
+
+    # offsets are normalized to the target time zone, kept as written without one
+    offsets = ["2025-01-01T00:00:00Z", "2025-01-01 02:00:00+02:00", "2025-01-01T02:00:00.5+0200", "2025-01-01T00:00:00"]
+    assert _lexical(offsets, XSD.dateTime, LexicalFormat(time_zone="UTC")) == [
+        "2025-01-01T00:00:00+00:00", "2025-01-01T00:00:00+00:00", "2025-01-01T00:00:00.500000+00:00", "2025-01-01T00:00:00+00:00"
+    ]
+    assert _lexical(offsets, XSD.dateTime)[:3] == offsets[:3]
+
+def test_double_lexical_forms():
+    assert _lexical([45, None], XSD.double) == ["45.0", None]
+    assert _lexical([0.1, 120.5], XSD.double, dtype=pl.Float32) == ["0.1", "120.5"]
+    assert _lexical([float("inf"), float("-inf"), float("nan")], XSD.double) == ["INF", "-INF", "NaN"]
+    assert _lexical([1.23456], XSD.double, LexicalFormat(float_digits=2)) == ["1.23"]
+
+def test_naive_times_across_dst_transitions():
+    # 01:30 happens twice on 2025-11-02 in New York, 02:30 never on 2025-03-30 in Rome
+    fall_back = [datetime(2025, 11, 2, 1, 30)]
+    assert _lexical(fall_back, XSD.dateTime, LexicalFormat(time_zone="America/New_York")) == ["2025-11-02T01:30:00-04:00"]
+    assert _lexical(fall_back, XSD.dateTime, LexicalFormat(time_zone="America/New_York", ambiguous="latest")) == [
+        "2025-11-02T01:30:00-05:00"
+    ]
+    spring_forward = [datetime(2025, 3, 30, 2, 30), datetime(2025, 3, 30, 3, 30)]
+    assert _lexical(spring_forward, XSD.dateTime, LexicalFormat(time_zone="Europe/Rome")) == [
+        None, "2025-03-30T03:30:00+02:00"
+    ]
+    with pytest.raises(pl.exceptions.ComputeError):
+        _lexical(spring_forward, XSD.dateTime, LexicalFormat(time_zone="Europe/Rome", non_existent="raise"))
+
+def test_times_in_a_dst_gap_are_left_out_with_a_warning():
+    from meds2rdf.mapping import map_data_table
+    from meds2rdf.mapping.event_mapper import compile_event_plan
+    from meds2rdf.namespace import MEDS
+    from rdflib import Graph
+
+    df = pl.DataFrame({"subject_id": [1, 1], "code": ["A", "B"], "time": [datetime(2025, 3, 30, 2, 30), datetime(2025, 3, 30, 3)]})
+    plan = compile_event_plan(df.schema, lexical=LexicalFormat(time_zone="Europe/Rome"))
+    g = Graph()
+    with pytest.warns(UserWarning, match="1 'time' values do not exist in time zone Europe/Rome"):
+        map_data_table(g, df, plan=plan)
+
+    assert len(list(g.triples((None, MEDS.time, None)))) == 1
@@ -0,0 +1,33 @@
+import datetime
+import polars as pl
+from meds2rdf.utils.iri import row_iris
+
+KEY = ("subject_id", "code", "time", "numeric_value")
+
+def _events(**overrides) -> pl.DataFrame:
+    return pl.DataFrame({
+        "subject_id": [1, 2],
+        "code": ["LAB//A", None],
+        "time": [datetime.datetime(2020, 1, 1, 12), None],
+        "numeric_value": [1.5, None],
+    }).with_columns(**overrides)
+
+def test_hash_iris_ignore_key_dtypes():
+    reference = row_iris(_events(), "event/", KEY, "hash", "data/0.parquet")
+    narrow = _events(
+        subject_id=pl.col("subject_id").cast(pl.Int32),
+        time=pl.col("time").cast(pl.Datetime("ns")),
+        numeric_value=pl.col("numeric_value").cast(pl.Float32),
+    )
+
+    assert row_iris(narrow, "event/", KEY, "hash", "data/0.parquet").to_list() == reference.to_list()
+    # a plain digest of the canonical key, not a Polars row hash that may change across versions
+    assert reference[0] == "event/d387d5eed35966b971590e1ae949e697"
+
+def test_hash_iris_depend_on_source_and_row_index():
+    df = _events()
+    iris = row_iris(df, "event/", KEY, "hash", "data/0.parquet").to_list()
+
+    assert len(set(iris)) == 2
+    assert row_iris(df, "event/", KEY, "hash", "data/1.parquet").to_list() != iris
+    assert row_iris(df.tail(1), "event/", KEY, "hash", "data/0.parquet", row_offset=1).to_list() == iris[1:]
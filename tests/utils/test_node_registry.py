@@ -0,0 +1,30 @@
+import io
+from meds2rdf.mapping.event_mapper import map_data_table
+from meds2rdf.sinks import NTriplesSink
+from meds2rdf.utils.node_registry import NodeRegistry
+
+def test_declarations_are_streamed_once():
+    data = [
+        {"subject_id": 1, "code": "A"},
+        {"subject_id": 1, "code": "A"},
+        {"subject_id": 1, "code": "B"},
+    ]
+    stream = io.BytesIO()
+    sink = NTriplesSink(stream)
+    registry = NodeRegistry()
+    map_data_table(sink, data, registry=registry)
+    map_data_table(sink, data, registry=registry)
+    sink.close()
+
+    lines = stream.getvalue().decode().splitlines()
+    assert len(lines) == len(set(lines))
+    assert sum("ontology#Subject>" in line for line in lines) == 1
+    assert sum("ontology#Code>" in line for line in lines) == 2
+
+def test_bounded_registry_evicts_least_recent():
+    registry = NodeRegistry(maxsize=2)
+    assert registry.first_seen("a") and registry.first_seen("b")
+    assert not registry.first_seen("a")
+    assert registry.first_seen("c")
+    assert "b" not in registry and "a" in registry
+    assert (registry.hits, registry.misses) == (1, 3)
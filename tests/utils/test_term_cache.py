@@ -0,0 +1,24 @@
+import io
+from rdflib import XSD, Literal, URIRef
+from meds2rdf import MedsRDFConverter, SummaryReporter
+from meds2rdf.utils.term_cache import TermCache
+
+def test_terms_are_interned_on_value_and_datatype():
+    cache = TermCache(maxsize=2, max_value_length=8)
+    first = cache.literal("F", XSD.string)
+    assert cache.literal("F", XSD.string) is first
+    assert cache.literal("F", XSD.token) == Literal("F", datatype=XSD.token)
+    assert cache.uri("urn:a") == URIRef("urn:a")
+    # least recently used entry was evicted
+    assert cache.literal("F", XSD.string) is not first
+
+    long_value = cache.literal("a long free text", XSD.string)
+    assert long_value == Literal("a long free text", datatype=XSD.string)
+    assert cache.stats() == {"hits": 1, "misses": 4, "skipped": 1, "size": 2, "hit_rate": 0.2}
+
+def test_conversion_reports_term_cache_stats(meds_root):
+    reporter = SummaryReporter(io.StringIO(), progress_interval=None)
+    MedsRDFConverter(meds_root, observer=reporter).convert(include_splits=True)
+
+    assert reporter.caches["terms"]["hits"] > 0
+    assert "terms cache" in reporter.summary()